@@ -1,288 +1,88 @@
+from startup_profile import PROFILE
+
+# Timed from the first line, so a cold run's marks include importing everything below
+PROFILE.begin()
+
 import streamlit as st
-import feedparser
+import plotly.graph_objects as go
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import lru_cache
 import html
+import os
 import re
+import time
+
+from article import Article
+from article_store import ArticleStore
+from date_parsing import utc_now
+from feed_config import MAX_AGE_DAYS, NEWS_FEED_LIMIT, current_feeds
+from feed_cache import DEFAULT_FEED_CACHE_URL, open_feed_cache
+from feed_fetcher import FEED_TTL_SECONDS, FETCH_MAX_WORKERS, FeedRefresher
+from feed_metrics import METRICS
+from feed_registry import REGISTRY
+from keyword_matching import FOCUS_AREAS, categorize_article
+from search_index import SearchIndex
+from snapshot import SnapshotReader
+from trends import ROLLING_DAYS, TREND_DAYS, TREND_KINDS, KeywordTrends
+from views import ALL_SPORTS, FeedViews
+
+PROFILE.mark("imports")
 
 # Page configuration
 st.set_page_config(
     page_title="Sports Analytics Dashboard",
-    page_icon="SA",
+    page_icon=":material/analytics:",
     layout="wide",
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for dark theme styling
-st.markdown("""
-<style>
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-    }
-
-    .dashboard-header {
-        background: linear-gradient(90deg, #1a2a4a 0%, #0d1929 100%);
-        padding: 0.75rem 1.5rem;
-        border-radius: 6px;
-        margin-bottom: 1.5rem;
-        border-bottom: 2px solid #FF4B4B;
-    }
-
-    .dashboard-header h1 {
-        color: white;
-        margin: 0;
-        font-weight: 600;
-        font-size: 1.5rem;
-    }
-
-    .metric-card {
-        background-color: #262730;
-        border-radius: 8px;
-        padding: 1.25rem;
-        border-left: 4px solid #FF4B4B;
-        margin-bottom: 1rem;
-        min-height: 120px;
-    }
-
-    .metric-card h4 {
-        color: #FF4B4B;
-        margin: 0 0 0.5rem 0;
-        font-size: 0.9rem;
-        font-weight: 600;
-    }
-
-    .metric-card p {
-        color: #888888;
-        margin: 0;
-        font-size: 0.85rem;
-        line-height: 1.4;
-    }
-
-    .news-card {
-        background-color: #1A1A2E;
-        border-radius: 6px;
-        padding: 1rem;
-        margin-bottom: 0.75rem;
-        border-left: 3px solid #FF4B4B;
-        transition: all 0.2s ease;
-    }
-
-    .news-card:hover {
-        background-color: #262730;
-        transform: translateX(4px);
-    }
-
-    .news-card a {
-        text-decoration: none;
-        color: inherit;
-        display: block;
-    }
-
-    .news-title {
-        color: #FAFAFA;
-        font-weight: 600;
-        font-size: 0.95rem;
-        margin-bottom: 0.5rem;
-        line-height: 1.3;
-    }
-
-    .news-summary {
-        color: #AAAAAA;
-        font-size: 0.85rem;
-        margin-bottom: 0.5rem;
-        line-height: 1.4;
-    }
-
-    .news-meta {
-        color: #888888;
-        font-size: 0.75rem;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        flex-wrap: wrap;
-        gap: 0.5rem;
-    }
-
-    .news-source {
-        color: #FF4B4B;
-        font-weight: 500;
-    }
-
-    .news-date {
-        color: #888888;
-    }
-
-    .recent-badge {
-        display: inline-block;
-        background-color: #FF4B4B;
-        color: white;
-        padding: 0.15rem 0.4rem;
-        border-radius: 3px;
-        font-size: 0.65rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        margin-left: 0.5rem;
-    }
-
-    .category-tag {
-        display: inline-block;
-        background-color: #333333;
-        color: #CCCCCC;
-        padding: 0.2rem 0.5rem;
-        border-radius: 4px;
-        font-size: 0.7rem;
-        margin-right: 0.5rem;
-        text-transform: uppercase;
-    }
-
-    .section-header {
-        color: #FAFAFA;
-        font-weight: 600;
-        font-size: 1.1rem;
-        margin-bottom: 0.5rem;
-        padding-bottom: 0.5rem;
-        border-bottom: 2px solid #FF4B4B;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-    }
-
-    .section-timestamp {
-        color: #666666;
-        font-size: 0.75rem;
-        font-weight: 400;
-    }
-
-    .placeholder-box {
-        background-color: #262730;
-        border: 1px solid #444444;
-        border-radius: 8px;
-        padding: 1.5rem;
-        text-align: center;
-        color: #888888;
-        min-height: 150px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-    }
-
-    .placeholder-box h3 {
-        color: #FAFAFA;
-        margin: 0 0 0.5rem 0;
-        font-size: 1rem;
-    }
-
-    .placeholder-box p {
-        margin: 0;
-        font-size: 0.85rem;
-    }
-
-    .no-content-msg {
-        background-color: #262730;
-        border-radius: 6px;
-        padding: 1rem;
-        color: #888888;
-        text-align: center;
-        font-size: 0.9rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "dashboard.css")
 
-# =============================================================================
-# SPORT-SPECIFIC FEED MAPPING (Explicit - no cross-sport contamination)
-# =============================================================================
-ANALYTICS_FEEDS = {
-    "MLB": [
-        {"url": "https://blogs.fangraphs.com/feed/", "source": "FanGraphs"},
-        {"url": "https://www.baseballprospectus.com/feed/", "source": "Baseball Prospectus"},
-        {"url": "https://technology.mlblogs.com/feed", "source": "MLB Tech Blog"},
-    ],
-    "NFL": [
-        {"url": "https://www.the33rdteam.com/feed/", "source": "The 33rd Team"},
-        {"url": "https://www.sharpfootballanalysis.com/feed/", "source": "Sharp Football"},
-    ],
-    "NBA": [
-        {"url": "https://dunksandthrees.com/feed", "source": "Dunks & Threes"},
-    ],
-    "College Football": [
-        {"url": "https://www.saturdaytradition.com/feed/", "source": "Saturday Tradition"},
-    ],
-    "College Basketball": [
-        {"url": "https://kenpom.com/blog/feed/", "source": "KenPom"},
-    ],
-}
 
-# Deep Dive feeds mapped by sport (explicit mapping)
-DEEP_DIVE_FEEDS = {
-    "MLB": [
-        {"url": "https://blogs.fangraphs.com/feed/", "source": "FanGraphs"},
-        {"url": "https://www.baseballprospectus.com/feed/", "source": "Baseball Prospectus"},
-    ],
-    "NFL": [
-        {"url": "https://www.the33rdteam.com/feed/", "source": "The 33rd Team"},
-        {"url": "https://www.sharpfootballanalysis.com/feed/", "source": "Sharp Football"},
-    ],
-    "NBA": [
-        {"url": "https://dunksandthrees.com/feed", "source": "Dunks & Threes"},
-    ],
-    "College Football": [
-        {"url": "https://www.saturdaytradition.com/feed/", "source": "Saturday Tradition"},
-    ],
-    "College Basketball": [
-        {"url": "https://kenpom.com/blog/feed/", "source": "KenPom"},
-    ],
-}
-
-# Analytics focus area categories
-FOCUS_AREAS = {
-    "All Topics": [],
-    "Recruiting & Roster": ["recruit", "roster", "draft", "transfer", "portal", "prospect", "signing"],
-    "Performance Metrics": ["metric", "stat", "EPA", "CPOE", "WAR", "xG", "expected", "efficiency", "rating", "advanced"],
-    "Coaching Strategy": ["coach", "strategy", "scheme", "play-call", "decision", "fourth down", "clock", "timeout"],
-    "Salary Cap/NIL": ["salary", "cap", "contract", "NIL", "money", "deal", "extension", "free agent"],
-    "Technology & Tools": ["tracking", "wearable", "AI", "machine learning", "model", "algorithm", "technology", "data"],
+@lru_cache(maxsize=1)
+def load_stylesheet(path: str = STYLESHEET_PATH) -> str:
+    """The dashboard stylesheet as a minified <style> block, read once per process."""
+    try:
+        with open(path, encoding="utf-8") as handle:
+            css = handle.read()
+    except OSError:
+        return ""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return f"<style>{' '.join(css.split())}</style>"
+
+
+# Dark theme styling from static/dashboard.css
+st.markdown(load_stylesheet(), unsafe_allow_html=True)
+PROFILE.mark("page setup")
+
+# Date range choices for article search, in days (None = no limit)
+SEARCH_DATE_RANGES = {
+    "Any time": None,
+    "Past 24 hours": 1,
+    "Past 7 days": 7,
+    "Past 30 days": 30,
+    "Past year": 365,
 }
 
-# =============================================================================
-# DATE FILTERING: Only show articles from last 30 days (after Dec 21, 2025)
-# =============================================================================
-MAX_AGE_DAYS = 30
+# Articles newer than this get the RECENT badge
 RECENT_THRESHOLD_DAYS = 7
 
+# Articles per page of the news grid and of Deep Dives; "Load more" adds a page
+NEWS_PAGE_SIZE = 10
+DEEP_DIVE_PAGE_SIZE = 6
 
-def parse_date(date_str: str) -> datetime:
-    """Parse various date formats from RSS feeds."""
-    if not date_str:
-        return None
+# Draw cards as each feed arrives instead of after the slowest one (PROGRESSIVE_RENDER=0 disables)
+PROGRESSIVE_RENDER = os.environ.get("PROGRESSIVE_RENDER", "1") != "0"
+
+# When set, feeds are read from the ingestion worker's snapshot (see ingest.py)
+# and the dashboard itself does no network I/O
+FEED_SNAPSHOT_PATH = os.environ.get("FEED_SNAPSHOT_PATH")
 
-    # Common RSS date formats
-    formats = [
-        "%a, %d %b %Y %H:%M:%S %z",      # RFC 822
-        "%a, %d %b %Y %H:%M:%S %Z",      # RFC 822 with timezone name
-        "%a, %d %b %Y %H:%M:%S GMT",     # RFC 822 GMT
-        "%Y-%m-%dT%H:%M:%S%z",           # ISO 8601
-        "%Y-%m-%dT%H:%M:%SZ",            # ISO 8601 UTC
-        "%Y-%m-%dT%H:%M:%S.%fZ",         # ISO 8601 with microseconds
-        "%Y-%m-%d %H:%M:%S",             # Simple datetime
-        "%Y-%m-%d",                       # Simple date
-    ]
-
-    # Clean up the date string
-    date_str = re.sub(r'\s+', ' ', date_str.strip())
-    # Handle +0000 timezone format
-    date_str = re.sub(r'\+0000$', '+00:00', date_str)
-
-    for fmt in formats:
-        try:
-            parsed = datetime.strptime(date_str, fmt)
-            # Make timezone-naive for comparison
-            if parsed.tzinfo:
-                parsed = parsed.replace(tzinfo=None)
-            return parsed
-        except ValueError:
-            continue
-
-    return None
+# When set, per-feed metrics are written here after every run (*.prom for
+# Prometheus text, anything else appends JSON lines)
+FEED_METRICS_PATH = os.environ.get("FEED_METRICS_PATH")
 
 
 def format_date_display(pub_date: datetime) -> str:
@@ -290,7 +90,7 @@ def format_date_display(pub_date: datetime) -> str:
     if not pub_date:
         return "Unknown date"
 
-    now = datetime.now()
+    now = utc_now()
     diff = now - pub_date
 
     if diff.days == 0:
@@ -313,150 +113,239 @@ def is_recent(pub_date: datetime) -> bool:
     """Check if article is less than 7 days old."""
     if not pub_date:
         return False
-    return (datetime.now() - pub_date).days < RECENT_THRESHOLD_DAYS
+    return (utc_now() - pub_date).days < RECENT_THRESHOLD_DAYS
 
 
-@st.cache_data(ttl=600)
-def fetch_rss_feed(url: str, source: str, limit: int = 15) -> list:
-    """Fetch and parse RSS feed with caching, error handling, and 30-day filtering."""
-    try:
-        feed = feedparser.parse(url)
+@st.cache_resource
+def get_article_store() -> ArticleStore:
+    """Process-wide on-disk article store."""
+    return ArticleStore()
 
-        if feed.bozo and not feed.entries:
-            return []
 
-        cutoff_date = datetime.now() - timedelta(days=MAX_AGE_DAYS)
-        items = []
+@st.cache_resource
+def get_search_index() -> SearchIndex:
+    """Process-wide search index, seeded from the article store's full history."""
+    index = SearchIndex()
+    try:
+        index.add_many(get_article_store().query(limit=None))
+    except Exception:
+        pass
+    return index
 
-        for entry in feed.entries:
-            if len(items) >= limit:
-                break
 
-            try:
-                # Parse publication date
-                pub_date_str = entry.get("published", "") or entry.get("updated", "")
-                pub_date = parse_date(pub_date_str)
-
-                # CRITICAL: Skip articles older than 30 days
-                if pub_date and pub_date < cutoff_date:
-                    continue
-
-                # If we can't parse the date, skip the article (be strict)
-                if not pub_date:
-                    continue
-
-                summary = entry.get("summary", "") or entry.get("description", "")
-                summary = html.unescape(str(summary))
-                # Remove HTML tags
-                summary = re.sub(r'<[^>]+>', ' ', summary)
-                summary = re.sub(r'\s+', ' ', summary).strip()
-
-                if len(summary) > 200:
-                    summary = summary[:200].rsplit(" ", 1)[0] + "..."
-
-                items.append({
-                    "title": str(entry.get("title", "No title")),
-                    "link": str(entry.get("link", "#")),
-                    "published": pub_date_str,
-                    "pub_date": pub_date,
-                    "date_display": format_date_display(pub_date),
-                    "is_recent": is_recent(pub_date),
-                    "summary": summary,
-                    "source": source,
-                })
-            except Exception:
-                continue
+@st.cache_resource
+def get_keyword_trends() -> KeywordTrends:
+    """Process-wide keyword trend counters, seeded from the article store's recent history."""
+    trends = KeywordTrends()
+    try:
+        trends.add_many(get_article_store().query(since=utc_now() - timedelta(days=TREND_DAYS), limit=None))
+    except Exception:
+        pass
+    return trends
 
-        # Sort by date (newest first)
-        items.sort(key=lambda x: x.get("pub_date") or datetime.min, reverse=True)
 
-        return items
-    except Exception:
-        return []
+@st.cache_resource
+def get_feed_views() -> FeedViews:
+    """Process-wide materialized news and Deep Dives views, reconfigured when the feed config changes."""
+    views = FeedViews(max_age_days=MAX_AGE_DAYS)
+    REGISTRY.listeners.append(views.configure)
+    return views
 
 
-def categorize_article(title: str, summary: str) -> str:
-    """Categorize an article based on keywords."""
+def open_shared_cache():
+    """The feed cache shared with other replicas (FEED_CACHE_URL), or None."""
+    if not DEFAULT_FEED_CACHE_URL:
+        return None
     try:
-        text = (str(title) + " " + str(summary)).lower()
-
-        category_scores = {
-            "Recruiting Analytics": ["recruit", "draft", "prospect", "transfer", "portal", "signing", "commit"],
-            "Performance Metrics": ["metric", "stat", "EPA", "CPOE", "WAR", "efficiency", "rating", "advanced", "expected"],
-            "Coaching Analytics": ["coach", "strategy", "scheme", "decision", "fourth down", "play-call", "game plan"],
-            "Roster Optimization": ["roster", "lineup", "rotation", "depth", "minutes", "snap", "usage"],
-            "Salary Cap/NIL": ["salary", "cap", "contract", "NIL", "money", "deal", "extension"],
-        }
-
-        best_category = "Performance Metrics"
-        best_score = 0
-
-        for category, keywords in category_scores.items():
-            score = sum(1 for kw in keywords if kw.lower() in text)
-            if score > best_score:
-                best_score = score
-                best_category = category
-
-        return best_category
+        return open_feed_cache(DEFAULT_FEED_CACHE_URL)
     except Exception:
-        return "Performance Metrics"
+        return None
 
 
-def filter_by_focus_area(items: list, focus_area: str) -> list:
-    """Filter news items by analytics focus area."""
-    try:
-        if focus_area == "All Topics":
-            return items
+@st.cache_resource
+def get_feed_refresher() -> FeedRefresher:
+    """Process-wide feed refresher shared by every session."""
+    search_index = get_search_index()
+    trends = get_keyword_trends()
+    return FeedRefresher(
+        store=get_article_store(),
+        listeners=[lambda url, items: search_index.add_many(items), get_feed_views().update,
+                   lambda url, items: trends.add_many(items)],
+        cache=open_shared_cache(),
+    )
 
-        keywords = FOCUS_AREAS.get(focus_area, [])
-        if not keywords:
-            return items
 
-        filtered = []
-        for item in items:
-            text = (str(item.get("title", "")) + " " + str(item.get("summary", ""))).lower()
-            if any(kw.lower() in text for kw in keywords):
-                filtered.append(item)
+@st.cache_resource
+def get_snapshot_reader() -> SnapshotReader:
+    """Process-wide reader of the ingestion worker's snapshot file."""
+    search_index = get_search_index()
+    trends = get_keyword_trends()
+    return SnapshotReader(
+        FEED_SNAPSHOT_PATH,
+        max_age_days=MAX_AGE_DAYS,
+        listeners=[lambda url, items: search_index.add_many(items), get_feed_views().update,
+                   lambda url, items: trends.add_many(items)],
+    )
 
-        return filtered if filtered else items[:5]
-    except Exception:
-        return items
 
+def get_feed_source():
+    """Snapshot reader when FEED_SNAPSHOT_PATH is set, otherwise the live feed refresher."""
+    return get_snapshot_reader() if FEED_SNAPSHOT_PATH else get_feed_refresher()
+
+
+def iter_feeds_concurrently(jobs: list, max_workers: int = FETCH_MAX_WORKERS, force: bool = False):
+    """Fetch (feed_info, limit) jobs in parallel, yielding (job index, items) as each lands.
+
+    Jobs that name the same URL share a single fetch at the largest limit
+    among them and each receive a slice. With force=True each feed is
+    re-fetched now instead of served from the refresher, unless an earlier
+    section already re-fetched it in this script run.
+    """
+    if not jobs:
+        return
+
+    feed_source = get_feed_source()
+    refreshed = st.session_state.setdefault(FORCE_REFRESHED_URLS, set()) if force else set()
+
+    jobs_by_url = {}
+    for i, (feed_info, limit) in enumerate(jobs):
+        jobs_by_url.setdefault(feed_info["url"], []).append(i)
+
+    workers = max(1, min(max_workers, len(jobs_by_url)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="feed-fetch") as pool:
+        futures = {}
+        for url, indexes in jobs_by_url.items():
+            source = jobs[indexes[0]][0]["source"]
+            limit = max(jobs[i][1] for i in indexes)
+            fetch = feed_source.refresh if force and url not in refreshed else feed_source.get
+            if force:
+                refreshed.add(url)
+            futures[pool.submit(fetch, url, source, limit)] = url
 
-def render_news_card(item: dict, show_category: bool = True):
-    """Render a clickable news card with source, date, and RECENT badge."""
+        for future in as_completed(futures):
+            try:
+                items = future.result() or []
+            except Exception:
+                items = []
+            for i in jobs_by_url[futures[future]]:
+                yield i, items[:jobs[i][1]]
+
+
+def _safe_link(link: str) -> str:
+    """Escaped href for an article link; anything but http(s) becomes "#"."""
+    link = str(link or "").strip()
+    return html.escape(link if link.lower().startswith(("http://", "https://")) else "#")
+
+
+@lru_cache(maxsize=4096)
+def _news_card_parts(item: Article, show_category: bool) -> tuple:
+    """Escaped card markup before the RECENT badge, between it and the date, and after the date.
+
+    Only the badge and the relative date change between reruns, so the
+    rest of each card is built once per article.
+    """
+    # Category is attached at ingest; only unenriched items are categorized here
+    category = item.get("category") or categorize_article(item.get("title", ""), item.get("summary", ""))
+    category_html = f'<span class="category-tag">{html.escape(category)}</span>' if show_category else ""
+    return (
+        f'<div class="news-card"><a href="{_safe_link(item.get("link"))}" target="_blank" rel="noopener noreferrer">'
+        f'{category_html}<div class="news-title">{html.escape(item.get("title", "No title"))}',
+        f'</div><div class="news-summary">{html.escape(item.get("summary", ""))}</div>'
+        f'<div class="news-meta"><span class="news-source">{html.escape(item.get("source", "Unknown"))}</span>'
+        '<span class="news-date">',
+        "</span></div></a></div>",
+    )
+
+
+def news_card_html(item, show_category: bool = True) -> str:
+    """HTML for one clickable news card with source, date, and RECENT badge; "" if the item is unusable."""
     try:
-        category = categorize_article(item.get("title", ""), item.get("summary", ""))
-        category_html = f'<span class="category-tag">{category}</span>' if show_category else ""
-
-        # Add RECENT badge if article is less than 7 days old
-        recent_badge = '<span class="recent-badge">RECENT</span>' if item.get("is_recent") else ""
-
-        date_display = item.get("date_display", "Unknown date")
-
-        st.markdown(f"""
-        <div class="news-card">
-            <a href="{item.get('link', '#')}" target="_blank" rel="noopener noreferrer">
-                {category_html}
-                <div class="news-title">{item.get('title', 'No title')}{recent_badge}</div>
-                <div class="news-summary">{item.get('summary', '')}</div>
-                <div class="news-meta">
-                    <span class="news-source">{item.get('source', 'Unknown')}</span>
-                    <span class="news-date">{date_display}</span>
-                </div>
-            </a>
-        </div>
-        """, unsafe_allow_html=True)
+        if isinstance(item, Article):
+            head, middle, tail = _news_card_parts(item, show_category)
+        else:
+            head, middle, tail = _news_card_parts.__wrapped__(item, show_category)
+
+        # Relative date and RECENT badge are derived from pub_date on each render so they never go stale
+        pub_date = item.get("pub_date")
+        recent_badge = '<span class="recent-badge">RECENT</span>' if is_recent(pub_date) else ""
+        return head + recent_badge + middle + format_date_display(pub_date) + tail
     except Exception:
-        pass
+        return ""
+
+
+def render_news_cards(items: list, show_category: bool = True):
+    """Render a column of news cards as one st.markdown block instead of one per card."""
+    cards = "".join(news_card_html(item, show_category) for item in items)
+    if cards:
+        st.markdown(f'<div class="news-cards">{cards}</div>', unsafe_allow_html=True)
+        PROFILE.mark("first card")
+
+
+def redraw(slot):
+    """Clear a placeholder and return a fresh container in its place.
+
+    Writing a new container over an older one in the same run would leave the
+    older one's extra trailing elements behind, so the slot is emptied first.
+    """
+    slot.empty()
+    return slot.container()
+
+
+def render_loading_caption(pending: int):
+    """Note how many feeds are still loading under a progressively drawn section."""
+    if pending:
+        st.caption(f"Loading {pending} more feed{'s' if pending != 1 else ''}...")
+
+
+def render_news_grid(unique_news: list, sport: str, pending: int = 0):
+    """Render the two-column news grid, or the empty-state message once all feeds are in."""
+    if unique_news:
+        col1, col2 = st.columns(2)
+        with col1:
+            render_news_cards(unique_news[0::2])
+        with col2:
+            render_news_cards(unique_news[1::2])
+    elif not pending:
+        st.info(f"No recent analytics news available for {sport} (last {MAX_AGE_DAYS} days). Try selecting 'All Topics' or check back later.")
+    render_loading_caption(pending)
+
+
+def render_deep_dives(unique_features: list, sport: str, pending: int = 0):
+    """Render the two Deep Dives columns; pages past the first are split evenly between them."""
+    dive_col1, dive_col2 = st.columns(2)
+    split = max(3, (len(unique_features) + 1) // 2)
+
+    with dive_col1:
+        st.markdown(f"#### Latest {sport} Analytics")
+        if unique_features:
+            render_news_cards(unique_features[:split], show_category=True)
+        elif not pending:
+            st.markdown(f"""
+            <div class="no-content-msg">
+                No recent feature articles for {sport}
+            </div>
+            """, unsafe_allow_html=True)
+
+    with dive_col2:
+        st.markdown(f"#### More {sport} Features")
+        if len(unique_features) > split:
+            render_news_cards(unique_features[split:], show_category=True)
+        elif not pending:
+            st.markdown(f"""
+            <div class="no-content-msg">
+                Check back for more {sport} content
+            </div>
+            """, unsafe_allow_html=True)
+
+    render_loading_caption(pending)
 
 
 def render_section_header(title: str):
-    """Render a section header with timestamp."""
+    """Render a section header with timestamp; the title is escaped, so it may hold user input."""
     timestamp = datetime.now().strftime("%I:%M %p")
     st.markdown(f"""
     <div class="section-header">
-        <span>{title}</span>
+        <span>{html.escape(title)}</span>
         <span class="section-timestamp">Last updated: {timestamp}</span>
     </div>
     """, unsafe_allow_html=True)
@@ -471,6 +360,336 @@ def render_no_content_message(source_name: str):
     """, unsafe_allow_html=True)
 
 
+def render_startup_profile():
+    """Script phase timings (ms into the run) of the cold start and the median warm run."""
+    report = PROFILE.report()
+    if not report:
+        return
+    st.markdown("#### Startup")
+    st.dataframe(
+        [{"Phase": row["phase"], "Cold ms": row["cold_ms"], "Warm ms": row["warm_ms"]} for row in report],
+        hide_index=True,
+        width="stretch",
+    )
+
+
+def render_ops_panel():
+    """Startup timings and per-feed fetch metrics for this process, slowest feed first."""
+    st.markdown("## Ops")
+    if REGISTRY.error:
+        st.warning(f"Feed config not reloaded: {REGISTRY.error}")
+    render_startup_profile()
+    if FEED_SNAPSHOT_PATH:
+        st.caption("Feeds are fetched by the ingestion worker; see `ingest.py --metrics`.")
+        return
+
+    rows = METRICS.rows()
+    if not rows:
+        st.caption("No feeds fetched by this process yet.")
+        return
+
+    st.dataframe(
+        [
+            {
+                "Source": row["source"],
+                "Status": row["last_status"],
+                "Fetch ms": round((row["last_fetch_seconds"] or 0) * 1000),
+                "Parse ms": round((row["last_parse_seconds"] or 0) * 1000),
+                "KB": round((row["last_bytes"] or 0) / 1024, 1),
+                "Seen/kept": f"{row['entries_seen']}/{row['entries_kept']}",
+                "Cache hit/miss": f"{row['cache_hits']}/{row['cache_misses']}",
+                "Shared": row["shared_adoptions"],
+                "Retries": row["retries"],
+                "Errors": row["errors"],
+                "Circuit": "open" if row["circuit_open"] else "closed",
+                "Poll min": round((row["poll_interval_seconds"] or FEED_TTL_SECONDS) / 60, 1),
+                "Last error": row["last_error"] or "",
+            }
+            for row in rows
+        ],
+        hide_index=True,
+        width="stretch",
+    )
+    st.download_button("Prometheus metrics", METRICS.to_prometheus(), file_name="feed_metrics.prom",
+                       mime="text/plain", width="stretch")
+    st.download_button("JSON lines", METRICS.to_json_lines(), file_name="feed_metrics.jsonl",
+                       mime="application/x-ndjson", width="stretch")
+
+
+# Independently rerunning page sections (st.fragment keys)
+SEARCH_FRAGMENT = "search"
+NEWS_FRAGMENT = "news"
+DEEP_DIVE_FRAGMENT = "deep_dives"
+TRENDS_FRAGMENT = "trends"
+OPS_PANEL_FRAGMENT = "ops_panel"
+
+# Session state key: feed URLs re-fetched by "Refresh Data" in this script run
+FORCE_REFRESHED_URLS = "force_refreshed_urls"
+
+
+def rerun_fragments(*keys: str):
+    """Widget callback that reruns only the named fragments instead of the whole script."""
+    st.rerun(list(keys))
+
+
+def section_is_fresh(section: str, sport: str, force: bool = False) -> bool:
+    """Whether this session walked the section's feeds for `sport` within the feed TTL."""
+    fetched = st.session_state.get(f"{section}_fetched")
+    return not force and fetched is not None and fetched[0] == sport and time.monotonic() - fetched[1] < FEED_TTL_SECONDS
+
+
+def mark_section_fetched(section: str, sport: str):
+    st.session_state[f"{section}_fetched"] = (sport, time.monotonic())
+
+
+def section_feeds(feeds_by_sport: dict, sport: str) -> list:
+    """A sport's feeds, or every sport's feeds (each URL once) for All Sports."""
+    if sport != ALL_SPORTS:
+        return feeds_by_sport.get(sport, [])
+    feeds = {}
+    for sport_feeds in feeds_by_sport.values():
+        for feed_info in sport_feeds:
+            feeds.setdefault(feed_info["url"], feed_info)
+    return list(feeds.values())
+
+
+def loaded_pages(state_key: str, view_key: tuple, next_page, reset: bool = False) -> dict:
+    """This session's loaded pages of a view, started over when the view key changes or on reset.
+
+    `next_page(cursor)` returns (items, next cursor), like FeedViews.news_page.
+    """
+    pages = st.session_state.get(state_key)
+    if reset or pages is None or pages["view"] != view_key:
+        items, cursor = next_page(None)
+        pages = {"view": view_key, "items": items, "cursor": cursor}
+        st.session_state[state_key] = pages
+    return pages
+
+
+def load_next_page(state_key: str, next_page):
+    """Button callback appending the page after the stored cursor; `next_page(cursor)` returns (items, cursor)."""
+    pages = st.session_state[state_key]
+    items, cursor = next_page(pages["cursor"])
+    pages["items"] = pages["items"] + items
+    pages["cursor"] = cursor
+
+
+def walk_section_feeds(feeds: list, force: bool = False):
+    """Fetch a section's feeds into the views, yielding the number still pending after each one lands.
+
+    Feeds are read at their full window so the views see the same items
+    the refresher's listeners deliver.
+    """
+    views = get_feed_views()
+    pending = len(feeds)
+    windows = current_feeds().windows
+    feed_jobs = [(feed_info, windows.get(feed_info["url"], NEWS_FEED_LIMIT)) for feed_info in feeds]
+    for job_index, items in iter_feeds_concurrently(feed_jobs, force=force):
+        views.update(feed_jobs[job_index][0]["url"], items)
+        pending -= 1
+        yield pending
+
+
+@st.fragment(key=SEARCH_FRAGMENT)
+def render_search_section():
+    """Article search box, filters and results; typing a query reruns only this section."""
+    search_query = st.text_input(
+        "Search articles",
+        placeholder="Search players, metrics (EPA, CPOE, xG) or teams",
+        label_visibility="collapsed",
+    )
+    if not search_query.strip():
+        return
+
+    feeds = current_feeds()
+    all_sports = list(feeds.news.keys())
+    all_sources = sorted({feed_info["source"] for feed_info in feeds.sources})
+
+    filter_cols = st.columns(3)
+    with filter_cols[0]:
+        search_sport = st.selectbox("Sport", [ALL_SPORTS] + all_sports)
+    with filter_cols[1]:
+        search_source = st.selectbox("Source", ["All Sources"] + all_sources)
+    with filter_cols[2]:
+        search_range = st.selectbox("Published", list(SEARCH_DATE_RANGES.keys()))
+
+    range_days = SEARCH_DATE_RANGES[search_range]
+    started = time.perf_counter()
+    search_results = get_search_index().search(
+        search_query,
+        limit=10,
+        sport=None if search_sport == ALL_SPORTS else search_sport,
+        source=None if search_source == "All Sources" else search_source,
+        since=utc_now() - timedelta(days=range_days) if range_days else None,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    render_section_header(f'Search Results - "{search_query.strip()}"')
+    st.caption(f"{len(search_results)} results in {elapsed_ms:.1f} ms")
+    if search_results:
+        result_items = [item for _, item in search_results]
+        search_col1, search_col2 = st.columns(2)
+        with search_col1:
+            render_news_cards(result_items[0::2])
+        with search_col2:
+            render_news_cards(result_items[1::2])
+    else:
+        st.info("No stored articles match your search. Try fewer or different terms.")
+
+    st.markdown("---")
+
+
+@st.fragment(key=NEWS_FRAGMENT)
+def render_news_section():
+    """News grid for the selected sport and focus area; reruns alone when either filter changes."""
+    selected_sport = st.session_state["selected_sport"]
+    focus_area = st.session_state["focus_area"]
+    force_refresh = st.session_state.get("refresh_data", False)
+
+    render_section_header(f"Analytics News Feed - {selected_sport}")
+
+    # Slots are reserved up front and filled in as each feed's results arrive
+    news_slot = st.empty()
+    no_content_slot = st.empty()
+
+    # Fetch news from ONLY the selected sport's feeds (every sport's for All Sports).
+    # A focus change only looks up another precomputed view.
+    views = get_feed_views()
+    sport_feeds = section_feeds(current_feeds().news, selected_sport)
+
+    def next_page(cursor: tuple = None) -> tuple:
+        return views.news_page(selected_sport, focus_area, cursor, NEWS_PAGE_SIZE)
+
+    walked = not section_is_fresh(NEWS_FRAGMENT, selected_sport, force_refresh)
+    if walked:
+        if sport_feeds:
+            news_slot.caption(f"Loading {selected_sport} analytics news...")
+        for news_pending in walk_section_feeds(sport_feeds, force=force_refresh):
+            if PROGRESSIVE_RENDER and news_pending:
+                with redraw(news_slot):
+                    render_news_grid(next_page()[0], selected_sport, news_pending)
+        mark_section_fetched(NEWS_FRAGMENT, selected_sport)
+
+    # Pages added with "Load more" stay until the filters change or the feeds are walked again
+    pages = loaded_pages("news_pages", (selected_sport, focus_area), next_page, reset=walked)
+    with redraw(news_slot):
+        render_news_grid(pages["items"], selected_sport)
+        if pages["cursor"] is not None:
+            st.button("Load more", key="news_load_more", on_click=load_next_page, args=("news_pages", next_page))
+
+    # Show sources with no recent content
+    feeds_with_no_content = [feed_info for feed_info in sport_feeds if not views.feed_items(feed_info["url"])]
+    if feeds_with_no_content:
+        with no_content_slot.container():
+            with st.expander("Sources with no recent updates"):
+                for feed_info in feeds_with_no_content:
+                    metrics = METRICS.get(feed_info["url"])
+                    if metrics and metrics["last_error"]:
+                        st.markdown(f"- {feed_info['source']} (last error: {metrics['last_error']})")
+                    else:
+                        st.markdown(f"- {feed_info['source']}")
+
+
+@st.fragment(key=DEEP_DIVE_FRAGMENT)
+def render_deep_dive_section():
+    """Deep Dives for the selected sport; reruns alone when the sport changes."""
+    selected_sport = st.session_state["selected_sport"]
+    force_refresh = st.session_state.get("refresh_data", False)
+
+    render_section_header(f"Deep Dives - {selected_sport}")
+
+    deep_dive_slot = st.empty()
+
+    views = get_feed_views()
+    deep_dive_feeds = section_feeds(current_feeds().deep_dives, selected_sport)
+
+    def next_page(cursor: tuple = None) -> tuple:
+        return views.deep_dive_page(selected_sport, cursor, DEEP_DIVE_PAGE_SIZE)
+
+    walked = not section_is_fresh(DEEP_DIVE_FRAGMENT, selected_sport, force_refresh)
+    if walked:
+        if deep_dive_feeds:
+            deep_dive_slot.caption(f"Loading {selected_sport} feature articles...")
+        for deep_dive_pending in walk_section_feeds(deep_dive_feeds, force=force_refresh):
+            if PROGRESSIVE_RENDER and deep_dive_pending:
+                with redraw(deep_dive_slot):
+                    render_deep_dives(next_page()[0], selected_sport, deep_dive_pending)
+        mark_section_fetched(DEEP_DIVE_FRAGMENT, selected_sport)
+
+    pages = loaded_pages("deep_dive_pages", (selected_sport,), next_page, reset=walked)
+    with redraw(deep_dive_slot):
+        render_deep_dives(pages["items"], selected_sport)
+        if pages["cursor"] is not None:
+            st.button("Load more", key="deep_dive_load_more", on_click=load_next_page,
+                      args=("deep_dive_pages", next_page))
+
+
+@lru_cache(maxsize=64)
+def trend_view(trends: KeywordTrends, version: int, kind: str, sport: str, source: str) -> tuple:
+    """(movers, trend lines figure) for a selection, built once per trends version.
+
+    Reruns that change nothing else reuse the figure instead of building
+    and validating a new one; `version` changes whenever a count does.
+    """
+    movers = trends.movers(kind, sport, source)
+    dates, series = trends.series(kind, sport, source, days=MAX_AGE_DAYS)
+    figure = go.Figure([go.Scatter(x=dates, y=mentions, mode="lines", name=label)
+                        for label, mentions in series.items()])
+    figure.update_layout(
+        height=340,
+        margin=dict(l=0, r=0, t=10, b=0),
+        hovermode="x unified",
+        yaxis_title=f"Articles, trailing {ROLLING_DAYS} days",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, x=0),
+    )
+    return movers, figure
+
+
+@st.fragment(key=TRENDS_FRAGMENT)
+def render_trends_section():
+    """Keyword trends for the selected sport; reruns alone when the sport or a trend control changes."""
+    selected_sport = st.session_state["selected_sport"]
+    sport = None if selected_sport == ALL_SPORTS else selected_sport
+
+    render_section_header(f"Industry Trends - {selected_sport}")
+
+    feeds = current_feeds()
+    sources = sorted({feed_info["source"] for feed_info in feeds.sources
+                      if sport is None or feeds.sports.get(feed_info["url"]) == sport})
+    control_cols = st.columns(2)
+    with control_cols[0]:
+        kind = st.radio("Trend of", list(TREND_KINDS), format_func=TREND_KINDS.get, horizontal=True,
+                        label_visibility="collapsed", key="trend_kind")
+    with control_cols[1]:
+        trend_source = st.selectbox("Source", ["All Sources"] + sources, label_visibility="collapsed",
+                                    key="trend_source")
+    source = None if trend_source == "All Sources" else trend_source
+
+    trends = get_keyword_trends()
+    movers, figure = trend_view(trends, trends.version, kind, sport, source)
+    if not movers:
+        st.info("No trend data yet. Trends fill in as articles are ingested.")
+        return
+
+    mover_cols = st.columns(4)
+    for column, (label, mentions, previous) in zip(mover_cols, movers):
+        with column:
+            st.metric(label, mentions, delta=mentions - previous,
+                      help=f"Articles in the last {ROLLING_DAYS} days vs the {ROLLING_DAYS} before")
+    st.plotly_chart(figure, width="stretch", config={"displayModeBar": False})
+
+
+@st.fragment(key=OPS_PANEL_FRAGMENT)
+def render_ops_panel_section():
+    """Sidebar ops panel, drawn only while its toggle is on."""
+    if st.session_state.get("show_ops_panel"):
+        render_ops_panel()
+
+
+# Pick up edits to the feed config file (FEED_CONFIG_PATH) before anything reads the feeds
+REGISTRY.reload_if_changed()
+
+
 # =============================================================================
 # SIDEBAR
 # =============================================================================
@@ -478,34 +697,45 @@ with st.sidebar:
     st.markdown("## Sports Filter")
     st.markdown("---")
 
-    selected_sport = st.radio(
+    # Filter changes rerun only the sections that read them, not the whole page
+    st.radio(
         "Select Sport",
-        options=list(ANALYTICS_FEEDS.keys()),
-        index=0,
-        label_visibility="collapsed"
+        options=[ALL_SPORTS] + list(current_feeds().news.keys()),
+        index=1,
+        label_visibility="collapsed",
+        key="selected_sport",
+        on_change=rerun_fragments,
+        args=(NEWS_FRAGMENT, TRENDS_FRAGMENT, DEEP_DIVE_FRAGMENT),
     )
 
     st.markdown("---")
     st.markdown("## Analytics Focus Area")
 
-    focus_area = st.radio(
+    st.radio(
         "Filter by Topic",
         options=list(FOCUS_AREAS.keys()),
         index=0,
-        label_visibility="collapsed"
+        label_visibility="collapsed",
+        key="focus_area",
+        on_change=rerun_fragments,
+        args=(NEWS_FRAGMENT,),
     )
 
     st.markdown("---")
 
-    if st.button("Refresh Data", use_container_width=True):
-        st.cache_data.clear()
-        st.rerun()
+    # Re-fetches only the selected sport's feeds; other cached feeds are kept
+    st.button("Refresh Data", width="stretch", key="refresh_data")
+    # A feed both sections read is re-fetched once per run; the later section reuses it
+    st.session_state[FORCE_REFRESHED_URLS] = set()
 
     st.markdown("---")
     st.markdown(f"**Last loaded:**")
     st.markdown(f"{datetime.now().strftime('%I:%M:%S %p')}")
     st.markdown("---")
     st.markdown(f"*Showing articles from last {MAX_AGE_DAYS} days*")
+    st.toggle("Show ops panel", key="show_ops_panel", on_change=rerun_fragments, args=(OPS_PANEL_FRAGMENT,))
+
+PROFILE.mark("sidebar")
 
 
 # =============================================================================
@@ -517,147 +747,34 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+# Article Search Section
+render_search_section()
+
 # Analytics News Feed Section
-render_section_header(f"Analytics News Feed - {selected_sport}")
-
-# Fetch news from ONLY the selected sport's feeds (no cross-contamination)
-all_news = []
-sport_feeds = ANALYTICS_FEEDS.get(selected_sport, [])
-sources_with_no_content = []
-
-with st.spinner(f"Loading {selected_sport} analytics news..."):
-    for feed_info in sport_feeds:
-        try:
-            items = fetch_rss_feed(feed_info["url"], feed_info["source"])
-            if items:
-                all_news.extend(items)
-            else:
-                sources_with_no_content.append(feed_info["source"])
-        except Exception:
-            sources_with_no_content.append(feed_info["source"])
-
-# Filter by focus area
-filtered_news = filter_by_focus_area(all_news, focus_area)
-
-# Deduplicate by title and sort by date
-seen_titles = set()
-unique_news = []
-for item in filtered_news:
-    title = item.get("title", "")
-    if title and title not in seen_titles:
-        seen_titles.add(title)
-        unique_news.append(item)
-
-# Sort newest first
-unique_news.sort(key=lambda x: x.get("pub_date") or datetime.min, reverse=True)
-
-if unique_news:
-    col1, col2 = st.columns(2)
-    for i, item in enumerate(unique_news[:10]):
-        with col1 if i % 2 == 0 else col2:
-            render_news_card(item)
-else:
-    st.info(f"No recent analytics news available for {selected_sport} (last {MAX_AGE_DAYS} days). Try selecting 'All Topics' or check back later.")
-
-# Show sources with no recent content
-if sources_with_no_content:
-    with st.expander("Sources with no recent updates"):
-        for source in sources_with_no_content:
-            st.markdown(f"- {source}")
+render_news_section()
+PROFILE.mark("news")
 
 st.markdown("---")
 
 # Industry Trends Section
-render_section_header("Industry Trends")
-
-trend_cols = st.columns(4)
-
-with trend_cols[0]:
-    st.markdown("""
-    <div class="metric-card">
-        <h4>Latest Research Papers</h4>
-        <p>Recent analytics publications from MIT Sloan Sports Analytics Conference, academic journals, and team research departments</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-with trend_cols[1]:
-    st.markdown("""
-    <div class="metric-card">
-        <h4>Methodology Updates</h4>
-        <p>New metrics being adopted: EPA, CPOE, Win Shares, xG, RAPTOR, catch probability, and other advanced statistics</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-with trend_cols[2]:
-    st.markdown("""
-    <div class="metric-card">
-        <h4>Technology Adoption</h4>
-        <p>Player tracking systems, wearable tech, computer vision, and AI/ML tools being deployed across leagues</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-with trend_cols[3]:
-    st.markdown("""
-    <div class="metric-card">
-        <h4>Hiring Activity</h4>
-        <p>Latest analytics department hires, new roles created, and career opportunities across professional teams</p>
-    </div>
-    """, unsafe_allow_html=True)
+render_trends_section()
+PROFILE.mark("trends")
 
 st.markdown("---")
 
 # =============================================================================
 # DEEP DIVES SECTION - RESPECTS SPORT FILTER (CRITICAL FIX)
 # =============================================================================
-render_section_header(f"Deep Dives - {selected_sport}")
-
-# Fetch feature content ONLY from the selected sport's feeds
-deep_dive_feeds = DEEP_DIVE_FEEDS.get(selected_sport, [])
-deep_dive_news = []
-
-with st.spinner(f"Loading {selected_sport} feature articles..."):
-    for feed_info in deep_dive_feeds:
-        try:
-            items = fetch_rss_feed(feed_info["url"], feed_info["source"], limit=8)
-            deep_dive_news.extend(items)
-        except Exception:
-            continue
-
-# Filter for longer/feature content and sort by date
-feature_articles = [item for item in deep_dive_news if len(item.get("summary", "")) > 80]
-feature_articles.sort(key=lambda x: x.get("pub_date") or datetime.min, reverse=True)
-
-# Deduplicate
-seen_feature_titles = set()
-unique_features = []
-for item in feature_articles:
-    title = item.get("title", "")
-    if title and title not in seen_feature_titles:
-        seen_feature_titles.add(title)
-        unique_features.append(item)
-
-dive_col1, dive_col2 = st.columns(2)
-
-with dive_col1:
-    st.markdown(f"#### Latest {selected_sport} Analytics")
-    if unique_features:
-        for item in unique_features[:3]:
-            render_news_card(item, show_category=True)
-    else:
-        st.markdown(f"""
-        <div class="no-content-msg">
-            No recent feature articles for {selected_sport}
-        </div>
-        """, unsafe_allow_html=True)
-
-with dive_col2:
-    st.markdown(f"#### More {selected_sport} Features")
-    if len(unique_features) > 3:
-        for item in unique_features[3:6]:
-            render_news_card(item, show_category=True)
-    else:
-        st.markdown(f"""
-        <div class="no-content-msg">
-            Check back for more {selected_sport} content
-        </div>
-        """, unsafe_allow_html=True)
+render_deep_dive_section()
+PROFILE.mark("deep dives")
+
+with st.sidebar:
+    render_ops_panel_section()
+
+if FEED_METRICS_PATH and not FEED_SNAPSHOT_PATH:
+    try:
+        METRICS.export(FEED_METRICS_PATH)
+    except Exception:
+        pass
+
+PROFILE.end()
@@ -0,0 +1,100 @@
+"""Compact, immutable article record shared by every session."""
+
+import sys
+from datetime import datetime
+
+FIELDS = ("guid", "title", "link", "published", "pub_date", "summary", "source", "sport",
+          "feed_url", "category", "focus_areas", "search_text")
+_FIELD_SET = frozenset(FIELDS)
+
+# Fields with few distinct values; interning makes every article share one copy
+_INTERNED = ("source", "sport", "feed_url", "category")
+
+_focus_tuples = {}
+
+
+class Article:
+    """One article, stored in slots instead of a per-article dict.
+
+    Reads like a read-only dict (item["title"], item.get("category"),
+    dict(item)) so feed items, stored rows and snapshot rows all share one
+    type. Unset (None) fields behave like missing keys for get(), `in` and
+    keys(). Articles cannot be modified; replace() returns a changed copy,
+    which lets the feed cache hand the same objects to every session.
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self, guid: str, title: str, link: str, published: str, pub_date: datetime,
+                 summary: str = "", source: str = None, sport: str = None, feed_url: str = None,
+                 category: str = None, focus_areas=None, search_text: str = None):
+        values = locals()
+        for name in FIELDS:
+            value = values[name]
+            if name in _INTERNED and isinstance(value, str):
+                value = sys.intern(value)
+            elif name == "focus_areas" and value is not None:
+                value = tuple(value)
+                value = _focus_tuples.setdefault(value, value)
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_mapping(cls, item) -> "Article":
+        """An Article from a dict-like item; an Article is returned as-is."""
+        if isinstance(item, cls):
+            return item
+        return cls(
+            guid=str(item.get("guid") or item.get("link", "")),
+            title=str(item.get("title", "No title")),
+            link=str(item.get("link", "#")),
+            published=str(item.get("published", "")),
+            pub_date=item.get("pub_date"),
+            **{name: item.get(name) for name in FIELDS[5:] if item.get(name) is not None},
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Article is immutable; use replace()")
+
+    def __delattr__(self, name):
+        raise AttributeError("Article is immutable")
+
+    def __reduce__(self):
+        return (Article, self._values())
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in FIELDS)
+
+    def replace(self, **changes) -> "Article":
+        """A copy with the given fields changed."""
+        values = dict(zip(FIELDS, self._values()))
+        values.update(changes)
+        return Article(**values)
+
+    def __getitem__(self, key: str):
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        value = getattr(self, key, None) if key in _FIELD_SET else None
+        return default if value is None else value
+
+    def __contains__(self, key: str) -> bool:
+        return key in _FIELD_SET and getattr(self, key) is not None
+
+    def keys(self) -> list:
+        return [name for name in FIELDS if getattr(self, name) is not None]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Article):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash(self._values())
+
+    def __repr__(self) -> str:
+        return f"Article(guid={self.guid!r}, title={self.title!r}, source={self.source!r})"
@@ -0,0 +1,228 @@
+"""On-disk SQLite store of every article the dashboard has ingested."""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from article import Article
+
+DEFAULT_DB_PATH = os.environ.get("ARTICLE_DB_PATH", os.path.join("data", "articles.db"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    guid TEXT NOT NULL UNIQUE,
+    link TEXT NOT NULL,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL,
+    sport TEXT,
+    feed_url TEXT NOT NULL,
+    published TEXT NOT NULL DEFAULT '',
+    pub_date TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    category TEXT,
+    focus_areas TEXT NOT NULL DEFAULT '[]',
+    search_text TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_articles_sport_date ON articles (sport, pub_date DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_source_date ON articles (source, pub_date DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_feed_date ON articles (feed_url, pub_date DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_pub_date ON articles (pub_date DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_link ON articles (link);
+"""
+
+# Columns added after the first release; older databases get them on open
+ENRICHMENT_COLUMNS = {
+    "category": "TEXT",
+    "focus_areas": "TEXT NOT NULL DEFAULT '[]'",
+    "search_text": "TEXT NOT NULL DEFAULT ''",
+}
+
+# Only new or edited entries reach this statement (see ArticleStore.ingest)
+UPSERT_SQL = """
+INSERT INTO articles (guid, link, title, summary, source, sport, feed_url, published, pub_date,
+                      first_seen, category, focus_areas, search_text)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (guid) DO UPDATE SET
+    link = excluded.link,
+    title = excluded.title,
+    summary = excluded.summary,
+    published = excluded.published,
+    pub_date = excluded.pub_date,
+    category = excluded.category,
+    focus_areas = excluded.focus_areas,
+    search_text = excluded.search_text
+"""
+
+SELECT_COLUMNS = ("guid, link, title, summary, source, sport, feed_url, published, pub_date, "
+                  "category, focus_areas, search_text")
+
+
+def _format_date(value: datetime) -> str:
+    return value.isoformat(sep=" ", timespec="seconds")
+
+
+def _row_to_item(row: sqlite3.Row) -> Article:
+    return Article(
+        guid=row["guid"],
+        title=row["title"],
+        link=row["link"],
+        published=row["published"],
+        pub_date=datetime.fromisoformat(row["pub_date"]),
+        summary=row["summary"],
+        source=row["source"],
+        sport=row["sport"],
+        feed_url=row["feed_url"],
+        category=row["category"],
+        focus_areas=json.loads(row["focus_areas"]),
+        search_text=row["search_text"],
+    )
+
+
+class ArticleStore:
+    """Thread-safe SQLite article store with incremental, idempotent ingestion."""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._add_missing_columns()
+
+    def ingest(self, feed_url: str, source: str, sport: str, items: list, enrich=None) -> int:
+        """Store new or edited items and return how many rows were written.
+
+        Items whose guid is already stored with the same title, summary and
+        date are skipped before `enrich` runs, so enrichment happens once per
+        new article rather than once per fetch.
+        """
+        candidates = {}
+        for item in items:
+            if item.get("pub_date"):
+                candidates[str(item.get("guid") or item.get("link", "#"))] = item
+        if not candidates:
+            return 0
+
+        with self._lock:
+            known = self._known_fingerprints(list(candidates), enriched_only=enrich is not None)
+
+        now = _format_date(datetime.now())
+        rows = []
+        for guid, item in candidates.items():
+            pub_date = _format_date(item["pub_date"])
+            title = str(item.get("title", "No title"))
+            summary = str(item.get("summary", ""))
+            if known.get(guid) == (title, summary, pub_date):
+                continue
+            if enrich is not None:
+                item = enrich(item)
+            rows.append((
+                guid,
+                str(item.get("link", "#")),
+                title,
+                summary,
+                source,
+                sport,
+                feed_url,
+                str(item.get("published", "")),
+                pub_date,
+                now,
+                item.get("category"),
+                json.dumps(list(item.get("focus_areas") or [])),
+                item.get("search_text", ""),
+            ))
+
+        if not rows:
+            return 0
+
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(UPSERT_SQL, rows)
+        return len(rows)
+
+    def feed_articles(self, feed_url: str, limit: int = 15, since: datetime = None) -> list:
+        """Newest-first articles from one feed, optionally only those published after `since`."""
+        sql = f"SELECT {SELECT_COLUMNS} FROM articles WHERE feed_url = ?"
+        params = [feed_url]
+        if since:
+            sql += " AND pub_date >= ?"
+            params.append(_format_date(since))
+        sql += " ORDER BY pub_date DESC LIMIT ?"
+        params.append(limit)
+        return self._select(sql, params)
+
+    def query(self, sport: str = None, source: str = None, since: datetime = None,
+              until: datetime = None, limit: int = 100) -> list:
+        """Newest-first articles matching the given filters, across the full history.
+
+        Pass limit=None to return every matching article.
+        """
+        clauses = []
+        params = []
+        if sport:
+            clauses.append("sport = ?")
+            params.append(sport)
+        if source:
+            clauses.append("source = ?")
+            params.append(source)
+        if since:
+            clauses.append("pub_date >= ?")
+            params.append(_format_date(since))
+        if until:
+            clauses.append("pub_date < ?")
+            params.append(_format_date(until))
+
+        sql = f"SELECT {SELECT_COLUMNS} FROM articles"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY pub_date DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._select(sql, params)
+
+    def count(self) -> int:
+        """Total number of stored articles."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _add_missing_columns(self):
+        existing = {row["name"] for row in self._conn.execute("PRAGMA table_info(articles)")}
+        with self._conn:
+            for name, declaration in ENRICHMENT_COLUMNS.items():
+                if name not in existing:
+                    self._conn.execute(f"ALTER TABLE articles ADD COLUMN {name} {declaration}")
+
+    def _known_fingerprints(self, guids: list, enriched_only: bool = False) -> dict:
+        # Caller holds self._lock. With enriched_only, rows stored before
+        # enrichment existed are left out so they get backfilled.
+        condition = "category IS NOT NULL AND " if enriched_only else ""
+        known = {}
+        for start in range(0, len(guids), 500):
+            chunk = guids[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT guid, title, summary, pub_date FROM articles "
+                f"WHERE {condition}guid IN ({placeholders})",
+                chunk,
+            )
+            for row in rows:
+                known[row["guid"]] = (row["title"], row["summary"], row["pub_date"])
+        return known
+
+    def _select(self, sql: str, params: list) -> list:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [_row_to_item(row) for row in rows]
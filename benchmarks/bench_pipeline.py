@@ -0,0 +1,262 @@
+"""Benchmark of the feed pipeline, stage by stage, against a local stand-in RSS server.
+
+Stages: fetch_rss_feed (cold and revalidated with a 304), a large feed
+with full article bodies through the streaming parser and through
+feedparser (with peak memory), a concurrent fetch cycle including slow
+and failing feeds, parse_date,
+categorize_article, enrich_article, filter_by_focus_area, the
+merge/filter/dedup pipeline the news grid used to run on every rerun,
+rebuilding the materialized views, and a view lookup. Each stage reports
+throughput and latency percentiles. Run from the repository root:
+
+    python benchmarks/bench_pipeline.py --feeds 12 --items 50 --json results.json
+    python benchmarks/bench_pipeline.py --compare results.json --threshold 0.25
+
+With --compare, stages whose median latency grew by more than the
+threshold are listed and the script exits with status 1.
+"""
+
+import argparse
+import heapq
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feed_fetcher  # noqa: E402
+from date_parsing import parse_date  # noqa: E402
+from dedup import dedupe_near_duplicates  # noqa: E402
+from enrichment import enrich_article  # noqa: E402
+from feed_config import NEWS_FEED_LIMIT  # noqa: E402
+from feed_fetcher import FETCH_MAX_WORKERS, FeedValidatorStore, fetch_rss_feed  # noqa: E402
+from keyword_matching import FOCUS_AREAS, categorize_article, filter_by_focus_area, match_article  # noqa: E402
+from rss_server import FeedServer  # noqa: E402
+from views import FeedViews  # noqa: E402
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(samples: list, wall_seconds: float = None) -> dict:
+    """Throughput and latency percentiles (ms) for per-operation timings in seconds."""
+    ordered = sorted(samples)
+    total = wall_seconds if wall_seconds is not None else sum(ordered)
+    return {
+        "ops": len(ordered),
+        "total_s": round(total, 6),
+        "ops_per_s": round(len(ordered) / total, 1) if total else None,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 4),
+        "p90_ms": round(percentile(ordered, 0.90) * 1000, 4),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4) if ordered else 0.0,
+    }
+
+
+def timed(func, inputs: list, repeat: int, before_pass=None) -> list:
+    """Per-call wall times of func over the inputs, `repeat` passes."""
+    samples = []
+    for _ in range(repeat):
+        if before_pass:
+            before_pass()
+        for value in inputs:
+            started = time.perf_counter()
+            func(value)
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+def build_feeds(server: FeedServer, args) -> list:
+    """(url, source) pairs for the healthy, slow and failing feeds."""
+    feeds = []
+    for i in range(args.feeds):
+        feed_format = args.format if args.format != "mixed" else ("atom" if i % 3 == 2 else "rss")
+        url = server.feed_url(f"feed{i}", items=args.items, format=feed_format, dates=args.dates,
+                              dupes=args.dupes, latency=args.latency)
+        feeds.append((url, f"Source {i}"))
+    for i in range(args.slow_feeds):
+        feeds.append((server.feed_url(f"slow{i}", items=args.items, dates=args.dates,
+                                      latency=args.slow_latency), f"Slow {i}"))
+    for i in range(args.failing_feeds):
+        failure = {"status": 500} if i % 2 == 0 else {"drop": 1}
+        feeds.append((server.feed_url(f"failing{i}", **failure), f"Failing {i}"))
+    return feeds
+
+
+def run_benchmarks(args) -> dict:
+    server = FeedServer().start()
+    try:
+        feeds = build_feeds(server, args)
+        healthy = feeds[:args.feeds]
+        stages = {}
+
+        def reset_validators():
+            feed_fetcher.VALIDATORS = FeedValidatorStore()
+
+        fetch = lambda feed: fetch_rss_feed(feed[0], feed[1], args.items)  # noqa: E731
+        stages["fetch_rss_feed cold"] = summarize(timed(fetch, healthy, args.repeat, reset_validators))
+        # Validators from the last cold pass are still in place, so these are 304s
+        stages["fetch_rss_feed 304"] = summarize(timed(fetch, healthy, args.repeat))
+
+        large_url = server.feed_url("large", items=args.large_items, content=args.large_content)
+        fetch_large = lambda feed: fetch_rss_feed(feed[0], feed[1], NEWS_FEED_LIMIT)  # noqa: E731
+        streaming_default = feed_fetcher.STREAMING_PARSER
+        try:
+            for streaming, name in ((True, "large feed streaming"), (False, "large feed feedparser")):
+                feed_fetcher.STREAMING_PARSER = streaming
+                stages[name] = summarize(timed(fetch_large, [(large_url, "Large")], args.repeat, reset_validators))
+                reset_validators()
+                tracemalloc.start()
+                fetch_large((large_url, "Large"))
+                stages[name]["peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 1e6, 2)
+                tracemalloc.stop()
+        finally:
+            feed_fetcher.STREAMING_PARSER = streaming_default
+
+        cycle_samples = []
+        cycle_walls = []
+        for _ in range(args.repeat):
+            reset_validators()
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=min(FETCH_MAX_WORKERS, len(feeds))) as pool:
+                cycle_samples.extend(pool.map(lambda feed: _time_call(fetch, feed), feeds))
+            cycle_walls.append(time.perf_counter() - started)
+        stages["concurrent fetch cycle"] = summarize(cycle_samples)
+        stages["concurrent fetch cycle"]["cycle_wall_ms"] = round(min(cycle_walls) * 1000, 3)
+
+        feed_results = [fetch_rss_feed(url, source, args.items) for url, source in healthy]
+        items = [item for result in feed_results for item in result]
+        date_strings = [item["published"] for item in items]
+
+        stages["parse_date cold cache"] = summarize(timed(parse_date, date_strings, args.repeat, parse_date.cache_clear))
+        stages["categorize_article"] = summarize(timed(
+            lambda item: categorize_article(item["title"], item["summary"]), items, args.repeat,
+            match_article.cache_clear))
+        stages["enrich_article"] = summarize(timed(enrich_article, items, args.repeat, match_article.cache_clear))
+
+        enriched_results = [[enrich_article(item) for item in result] for result in feed_results]
+        focus_areas = [area for area in FOCUS_AREAS if area != "All Topics"]
+        merged = list(heapq.merge(*enriched_results, key=lambda x: x.get("pub_date") or datetime.min, reverse=True))
+        stages["filter_by_focus_area"] = summarize(timed(
+            lambda area: filter_by_focus_area(merged, area), focus_areas, args.repeat))
+
+        def news_view(focus_area):
+            # What the page did per rerun before materialized views: merge, focus filter, near-dedup
+            newest = heapq.merge(*enriched_results, key=lambda x: x.get("pub_date") or datetime.min, reverse=True)
+            filtered = filter_by_focus_area(list(newest), focus_area)
+            return dedupe_near_duplicates([item for item in filtered if item.get("title")])
+
+        stages["merge + dedup view"] = summarize(timed(news_view, ["All Topics"] + focus_areas, args.repeat))
+
+        bench_feeds = {"Bench": [{"url": url, "source": source} for url, source in healthy]}
+
+        def build_views(results):
+            # One ingest cycle: every feed lands and rebuilds the sport's views
+            views = FeedViews(news_feeds=bench_feeds, deep_dive_feeds=bench_feeds)
+            for (url, _), result in zip(healthy, results):
+                views.update(url, result)
+            return views
+
+        stages["build views per cycle"] = summarize(timed(build_views, [enriched_results], args.repeat))
+        views = build_views(enriched_results)
+        stages["view lookup"] = summarize(timed(lambda area: views.news("Bench", area)[:10],
+                                                ["All Topics"] + focus_areas, args.repeat))
+        return {"meta": _metadata(args, len(items)), "stages": stages}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _time_call(func, value) -> float:
+    started = time.perf_counter()
+    func(value)
+    return time.perf_counter() - started
+
+
+def _metadata(args, article_count: int) -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except Exception:
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "articles": article_count,
+        "args": {key: value for key, value in vars(args).items() if key not in ("json", "compare")},
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """(stage, baseline p50, current p50) for stages that slowed down by more than threshold."""
+    regressions = []
+    for name, stats in current["stages"].items():
+        previous = baseline.get("stages", {}).get(name)
+        if not previous or not previous.get("p50_ms"):
+            continue
+        if stats["p50_ms"] > previous["p50_ms"] * (1 + threshold):
+            regressions.append((name, previous["p50_ms"], stats["p50_ms"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--feeds", type=int, default=12, help="healthy feeds served")
+    parser.add_argument("--items", type=int, default=50, help="entries per feed")
+    parser.add_argument("--format", choices=["rss", "atom", "mixed"], default="mixed")
+    parser.add_argument("--dates", choices=["mixed", "rfc822", "iso"], default="mixed")
+    parser.add_argument("--dupes", type=float, default=0.15, help="fraction of syndicated duplicate entries")
+    parser.add_argument("--latency", type=float, default=0, help="response latency of healthy feeds, ms")
+    parser.add_argument("--slow-feeds", type=int, default=2)
+    parser.add_argument("--slow-latency", type=float, default=300, help="response latency of slow feeds, ms")
+    parser.add_argument("--failing-feeds", type=int, default=2, help="feeds answering 500 or dropping the connection")
+    parser.add_argument("--large-items", type=int, default=100, help="entries in the large feed")
+    parser.add_argument("--large-content", type=int, default=20000,
+                        help="characters of full-article HTML per large-feed entry")
+    parser.add_argument("--repeat", type=int, default=3, help="passes per stage")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline results file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed median slowdown, as a fraction")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args)
+
+    print(f"{results['meta']['articles']} articles from {args.feeds} feeds, {args.repeat} passes per stage")
+    print(f"  {'stage':<24} {'ops':>6} {'ops/s':>10} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, stats in results["stages"].items():
+        print(f"  {name:<24} {stats['ops']:>6} {stats['ops_per_s'] or 0:>10.1f} {stats['p50_ms']:>9.3f} "
+              f"{stats['p90_ms']:>9.3f} {stats['p99_ms']:>9.3f} {stats['max_ms']:>9.3f}")
+    for name in ("large feed streaming", "large feed feedparser"):
+        print(f"  {name} peak memory: {results['stages'][name]['peak_mb']:.2f} MB")
+    print(f"  concurrent fetch cycle wall time: {results['stages']['concurrent fetch cycle']['cycle_wall_ms']:.1f} ms")
+
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump(results, handle, indent=2)
+        print(f"Results written to {args.json}")
+
+    if args.compare:
+        with open(args.compare) as handle:
+            regressions = compare(results, json.load(handle), args.threshold)
+        for name, before, after in regressions:
+            print(f"REGRESSION {name}: p50 {before:.3f} ms -> {after:.3f} ms")
+        if regressions:
+            sys.exit(1)
+        print(f"No stage slowed down by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""Benchmark of the dashboard's startup: module import times and script phase timings.
+
+Each sample starts a fresh Python process (python -X importtime) that
+runs app.py twice through Streamlit's AppTest against a synthetic
+snapshot (FEED_SNAPSHOT_PATH), so no network is used. The first run is
+the cold start, which imports the app's modules and seeds its caches;
+the second is a warm rerun. The report lists the median time into each
+run at which app.py reached each phase (see startup_profile), including
+the first news card sent, and the slowest imports of the cold start.
+Run from the repository root:
+
+    python benchmarks/bench_startup.py --runs 5 --json startup.json
+    python benchmarks/bench_startup.py --compare startup.json --threshold 0.25
+
+With --compare, cold-start phases whose median grew by more than the
+threshold are listed and the script exits with status 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from date_parsing import utc_now  # noqa: E402
+from enrichment import enrich_article  # noqa: E402
+from feed_config import current_feeds  # noqa: E402
+from snapshot import write_snapshot  # noqa: E402
+
+# Heavy third-party packages the dashboard should only import when it needs them
+DEFERRED_PACKAGES = ("feedparser", "numpy", "yaml", "PIL")
+
+TITLES = [
+    "Projection model update: WAR leaders after the first month",
+    "Salary cap space and the trade deadline",
+    "Win probability added in late-game coaching decisions",
+    "Recruiting rankings meet advanced metrics",
+    "Tracking data explains the defensive shift",
+    "Roster construction through the draft",
+]
+
+# Runs inside the child process; prints the profile as one JSON line on stdout
+CHILD = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+print("STARTUP-BENCH app imports begin", file=sys.stderr, flush=True)
+preloaded = {name for name in sys.argv[2:] if name in sys.modules}
+app = AppTest.from_file(sys.argv[1], default_timeout=120)
+started = time.perf_counter()
+app.run()
+cold_wall = time.perf_counter() - started
+app.run()
+import startup_profile
+print(json.dumps({
+    "cold": startup_profile.PROFILE.cold,
+    "warm": startup_profile.PROFILE.warm(),
+    "cold_wall_ms": round(cold_wall * 1000, 2),
+    "exception": [str(error.value) for error in app.exception],
+    "deferred": {name: name in sys.modules and name not in preloaded for name in sys.argv[2:]},
+}))
+"""
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def build_snapshot(path: str, items_per_feed: int) -> int:
+    """Write a snapshot of synthetic enriched articles for every configured feed; returns the row count."""
+    now = utc_now()
+    feeds = current_feeds()
+    feed_items = {}
+    for feed_index, feed_info in enumerate(feeds.sources):
+        url = feed_info["url"]
+        feed_items[url] = [
+            enrich_article({
+                "guid": f"{url}#{index}",
+                "link": f"{url}#{index}",
+                "title": f"{TITLES[(feed_index + index) % len(TITLES)]} ({index})",
+                "summary": "Analytics, data and the numbers behind the game.",
+                "published": "",
+                "pub_date": now - timedelta(hours=6 * index + feed_index),
+                "source": feed_info["source"],
+                "sport": feeds.sports.get(url),
+            })
+            for index in range(items_per_feed)
+        ]
+    return write_snapshot(path, feed_items)
+
+
+def parse_import_times(stderr: str) -> dict:
+    """{module: (self µs, cumulative µs, depth)} for modules first imported once the app started loading."""
+    lines = stderr.split("STARTUP-BENCH app imports begin", 1)[-1].splitlines()
+    imports = {}
+    for line in lines:
+        match = IMPORT_LINE.match(line)
+        if match:
+            imports[match.group(4)] = (int(match.group(1)), int(match.group(2)), len(match.group(3)))
+    return imports
+
+
+def run_sample(env: dict) -> dict:
+    """One fresh process: the profile of a cold and a warm run, and the cold start's import times."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD, os.path.join(ROOT, "app.py"), *DEFERRED_PACKAGES],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=300,
+    )
+    lines = [line for line in completed.stdout.splitlines() if line.startswith("{")]
+    if completed.returncode or not lines:
+        raise RuntimeError(f"Startup sample failed:\n{completed.stderr[-2000:]}")
+    sample = json.loads(lines[-1])
+    sample["imports"] = parse_import_times(completed.stderr)
+    return sample
+
+
+def median(values: list) -> float:
+    ordered = sorted(values)
+    return ordered[len(ordered) // 2] if ordered else None
+
+
+def run_benchmarks(args) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        snapshot_path = os.path.join(workdir, "snapshot.bin")
+        rows = build_snapshot(snapshot_path, args.items)
+        env = dict(os.environ, FEED_SNAPSHOT_PATH=snapshot_path,
+                   ARTICLE_DB_PATH=os.path.join(workdir, "articles.db"), STARTUP_PROFILE_PATH="")
+        env.pop("FEED_CONFIG_PATH", None)
+        samples = [run_sample(env) for _ in range(args.runs)]
+
+    phases = {}
+    for sample in samples:
+        for run in ("cold", "warm"):
+            for name, ms in (sample[run] or {}).items():
+                phases.setdefault(name, {"cold": [], "warm": []})[run].append(ms)
+
+    # Direct imports of app.py (and of the AppTest harness) are the least indented lines
+    imports = {}
+    for sample in samples:
+        depth = min((entry[2] for entry in sample["imports"].values()), default=0)
+        for module, (self_us, cumulative_us, module_depth) in sample["imports"].items():
+            if module_depth == depth or module in DEFERRED_PACKAGES:
+                imports.setdefault(module, []).append(cumulative_us / 1000)
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": args.runs,
+            "articles": rows,
+        },
+        "phases": {name: {"cold_ms": median(values["cold"]), "warm_ms": median(values["warm"])}
+                   for name, values in phases.items()},
+        "cold_wall_ms": median([sample["cold_wall_ms"] for sample in samples]),
+        "imports_ms": dict(sorted(((module, round(median(values), 2)) for module, values in imports.items()),
+                                  key=lambda entry: entry[1], reverse=True)),
+        "deferred_imported": {name: any(sample["deferred"][name] for sample in samples) for name in DEFERRED_PACKAGES},
+        "exceptions": sorted({error for sample in samples for error in sample["exception"]}),
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """(phase, baseline cold ms, current cold ms) for cold-start phases that slowed down by more than threshold."""
+    regressions = []
+    for name, stats in current["phases"].items():
+        previous = baseline.get("phases", {}).get(name)
+        if not previous or not previous.get("cold_ms") or stats["cold_ms"] is None:
+            continue
+        if stats["cold_ms"] > previous["cold_ms"] * (1 + threshold):
+            regressions.append((name, previous["cold_ms"], stats["cold_ms"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes started")
+    parser.add_argument("--items", type=int, default=20, help="articles per feed in the snapshot")
+    parser.add_argument("--top", type=int, default=12, help="slowest imports listed")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline results file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed median slowdown, as a fraction")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args)
+
+    print(f"{results['meta']['articles']} snapshot articles, {args.runs} fresh processes")
+    for error in results["exceptions"]:
+        print(f"  app raised: {error}")
+    print(f"  {'phase':<14} {'cold ms':>9} {'warm ms':>9}")
+    for name, stats in results["phases"].items():
+        print(f"  {name:<14} {stats['cold_ms'] or 0:>9.1f} {stats['warm_ms'] or 0:>9.1f}")
+    print(f"  cold run wall time: {results['cold_wall_ms']:.1f} ms")
+    print("  slowest imports during the cold start (cumulative ms):")
+    for module, ms in list(results["imports_ms"].items())[:args.top]:
+        print(f"    {module:<32} {ms:>8.1f}")
+    imported = [name for name, loaded in results["deferred_imported"].items() if loaded]
+    print(f"  deferred packages the two runs imported: {', '.join(imported) or 'none'}")
+
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump(results, handle, indent=2)
+        print(f"Results written to {args.json}")
+
+    if args.compare:
+        with open(args.compare) as handle:
+            regressions = compare(results, json.load(handle), args.threshold)
+        for name, before, after in regressions:
+            print(f"REGRESSION {name}: cold {before:.1f} ms -> {after:.1f} ms")
+        if regressions:
+            sys.exit(1)
+        print(f"No startup phase slowed down by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
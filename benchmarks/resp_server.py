@@ -0,0 +1,135 @@
+"""Local stand-in Redis server speaking the RESP subset the shared feed cache uses.
+
+Supports PING, SELECT, GET, SET (with NX, XX, EX and PX), DEL, EXISTS
+and FLUSHALL, with key expiry, in memory. Enough to run several
+dashboard replicas against one shared feed cache without a real Redis:
+
+    python benchmarks/resp_server.py --port 6390
+    FEED_CACHE_URL=redis://127.0.0.1:6390/0 streamlit run app.py
+"""
+
+import argparse
+import socketserver
+import threading
+import time
+
+
+class RespHandler(socketserver.StreamRequestHandler):
+    """One client connection; commands are answered in order."""
+
+    def handle(self):
+        db = 0
+        while True:
+            try:
+                args = self.read_command()
+            except (ConnectionError, ValueError):
+                return
+            if args is None:
+                return
+            name = args[0].upper().decode() if args else ""
+            if name == "SELECT" and len(args) == 2:
+                db = int(args[1])
+                reply = b"+OK\r\n"
+            else:
+                reply = self.server.execute(db, name, args[1:])
+            self.wfile.write(reply)
+
+    def read_command(self) -> list:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            # Inline command, as typed into telnet
+            return line.split()
+        args = []
+        for _ in range(int(line[1:])):
+            header = self.rfile.readline()
+            if not header.startswith(b"$"):
+                raise ValueError("Expected a bulk string")
+            args.append(self.rfile.read(int(header[1:]) + 2)[:-2])
+        return args
+
+
+def _bulk(value: bytes) -> bytes:
+    return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+class RespServer(socketserver.ThreadingTCPServer):
+    """Threaded in-memory key-value server; `commands` counts commands by name."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), RespHandler)
+        self.commands = {}
+        self._data = {}
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"redis://{self.server_address[0]}:{self.server_address[1]}/0"
+
+    def _live(self, db: int, key: bytes):
+        # Caller holds self._lock
+        entry = self._data.get((db, key))
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self._data[db, key]
+            entry = None
+        return entry
+
+    def execute(self, db: int, name: str, args: list) -> bytes:
+        with self._lock:
+            self.commands[name] = self.commands.get(name, 0) + 1
+            if name == "PING":
+                return b"+PONG\r\n"
+            if name == "GET" and len(args) == 1:
+                entry = self._live(db, args[0])
+                return _bulk(entry[0] if entry else None)
+            if name == "SET" and len(args) >= 2:
+                return self._set(db, args[0], args[1], [arg.upper() for arg in args[2:]], args[2:])
+            if name in ("DEL", "EXISTS") and args:
+                count = sum(1 for key in args if self._live(db, key) is not None)
+                if name == "DEL":
+                    for key in args:
+                        self._data.pop((db, key), None)
+                return b":%d\r\n" % count
+            if name == "FLUSHALL":
+                self._data.clear()
+                return b"+OK\r\n"
+        return b"-ERR unknown command or wrong number of arguments for '%s'\r\n" % name.encode()
+
+    def _set(self, db: int, key: bytes, value: bytes, options: list, raw: list) -> bytes:
+        # Caller holds self._lock
+        expires_at = None
+        for position, option in enumerate(options):
+            if option in (b"EX", b"PX") and position + 1 < len(raw):
+                seconds = int(raw[position + 1]) / (1000 if option == b"PX" else 1)
+                expires_at = time.monotonic() + seconds
+        exists = self._live(db, key) is not None
+        if (b"NX" in options and exists) or (b"XX" in options and not exists):
+            return b"$-1\r\n"
+        self._data[db, key] = (value, expires_at)
+        return b"+OK\r\n"
+
+    def start(self) -> "RespServer":
+        threading.Thread(target=self.serve_forever, name="resp-server", daemon=True).start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    args = parser.parse_args()
+
+    server = RespServer(args.host, args.port)
+    print(f"Serving a stand-in Redis at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
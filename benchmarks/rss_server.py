@@ -0,0 +1,216 @@
+"""Local stand-in RSS/Atom server serving generated feeds for benchmarks.
+
+Every feed is described by its query string, so one server covers any mix:
+
+    /feed/<name>?items=50&format=rss&dates=mixed&latency=200&status=200&dupes=0.2
+
+items    number of entries (default 50)
+format   rss or atom (default rss)
+dates    mixed, rfc822 or iso (default mixed)
+latency  milliseconds to wait before responding (default 0)
+status   HTTP status to answer with; anything but 200 sends an error body
+dupes    fraction of entries that are syndicated copies of another entry
+content  characters of full-article HTML per entry (default 0, none)
+drop     1 to close the connection without a response
+
+Entries are dated within the last few days so they survive the 30-day
+cutoff, and are deterministic per URL, so ETag/If-None-Match revalidation
+answers 304 the way real feeds do. Run standalone with
+`python benchmarks/rss_server.py --port 8765`.
+"""
+
+import argparse
+import hashlib
+import http.server
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+DAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+SUBJECTS = ["Rookie quarterback", "Bullpen usage", "Transfer portal class", "Fourth down model",
+            "Shot quality", "Contract extension", "Pitch tracking", "Defensive scheme",
+            "Draft prospect", "Lineup rotation", "Expected goals", "Salary cap outlook"]
+ANGLES = ["by the numbers", "and what the EPA says", "through a WAR lens", "after the deadline",
+          "as a coaching decision", "with new tracking data", "for the playoff race",
+          "and its roster fit", "versus the model", "in advanced metrics"]
+FILLER = ("The analysis walks through efficiency, usage and rating trends across the last few "
+          "weeks, with notes on strategy, depth and the contract situation going forward").split()
+
+
+def format_date(utc: datetime, style: str, rng: random.Random) -> str:
+    """A naive UTC datetime rendered the way one kind of feed would send it."""
+    if style == "mixed":
+        style = rng.choice(["rfc822", "rfc822", "rfc822-offset", "gmt", "iso", "iso-offset"])
+    if style in ("rfc822", "rfc822-offset", "gmt"):
+        offset = rng.choice([-300, -240, 60]) if style == "rfc822-offset" else 0
+        local = utc + timedelta(minutes=offset)
+        zone = "GMT" if style == "gmt" else f"{'-' if offset < 0 else '+'}{abs(offset) // 60:02d}{abs(offset) % 60:02d}"
+        return (f"{DAYS[local.weekday()]}, {local.day:02d} {MONTHS[local.month - 1]} {local.year} "
+                f"{local:%H:%M:%S} {zone}")
+    if style == "iso-offset":
+        local = utc + timedelta(hours=-5)
+        return f"{local:%Y-%m-%dT%H:%M:%S}-05:00"
+    return f"{utc:%Y-%m-%dT%H:%M:%S}Z"
+
+
+def generate_entries(name: str, count: int, dupes: float, now: datetime, date_style: str,
+                     content: int = 0) -> list:
+    """Deterministic newest-first entries for a feed name."""
+    rng = random.Random(name)
+    entries = []
+    for i in range(count):
+        if entries and rng.random() < dupes:
+            # Syndicated copy: same story, source suffix on the title
+            original = rng.choice(entries)
+            title = f"{original['title']} | Wire"
+            summary = original["summary"]
+        else:
+            title = f"{rng.choice(SUBJECTS)} {rng.choice(ANGLES)} ({name} #{i})"
+            summary = " ".join(rng.choice(FILLER) for _ in range(rng.randint(12, 40)))
+        published = now - timedelta(minutes=37 * i + rng.randrange(30))
+        entries.append({
+            "id": f"urn:{name}:{i}",
+            "title": title,
+            "link": f"https://example.com/{name}/{i}",
+            "summary": f"<p>{summary}</p>",
+            "date": format_date(published, date_style, rng),
+            "content": ("<p>" + " ".join(FILLER) + "</p>") * (content // 200 + 1) if content else "",
+        })
+    return entries
+
+
+def render_feed(name: str, entries: list, feed_format: str) -> bytes:
+    if feed_format == "atom":
+        body = "".join(
+            f"<entry><id>{escape(e['id'])}</id><title>{escape(e['title'])}</title>"
+            f"<link href=\"{escape(e['link'])}\"/><updated>{escape(e['date'])}</updated>"
+            f"<summary type=\"html\">{escape(e['summary'])}</summary>"
+            + (f"<content type=\"html\">{escape(e['content'])}</content>" if e["content"] else "")
+            + "</entry>"
+            for e in entries
+        )
+        return (f"<?xml version=\"1.0\" encoding=\"utf-8\"?><feed xmlns=\"http://www.w3.org/2005/Atom\">"
+                f"<title>{escape(name)}</title>{body}</feed>").encode("utf-8")
+    body = "".join(
+        f"<item><guid>{escape(e['id'])}</guid><title>{escape(e['title'])}</title>"
+        f"<link>{escape(e['link'])}</link><pubDate>{escape(e['date'])}</pubDate>"
+        f"<description>{escape(e['summary'])}</description>"
+        + (f"<content:encoded><![CDATA[{e['content']}]]></content:encoded>" if e["content"] else "")
+        + "</item>"
+        for e in entries
+    )
+    return (f"<?xml version=\"1.0\" encoding=\"utf-8\"?><rss version=\"2.0\" "
+            f"xmlns:content=\"http://purl.org/rss/1.0/modules/content/\"><channel>"
+            f"<title>{escape(name)}</title>{body}</channel></rss>").encode("utf-8")
+
+
+class FeedHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        self.server.record(url.path)
+
+        latency = float(params.get("latency", 0)) / 1000
+        if latency:
+            time.sleep(latency)
+        if params.get("drop") == "1":
+            self.close_connection = True
+            return
+
+        status = int(params.get("status", 200))
+        if status != 200:
+            self._send(status, b"error", "text/plain")
+            return
+
+        body = self.server.feed_body(self.path, url.path.rsplit("/", 1)[-1] or "feed", params)
+        etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", None, etag)
+            return
+        content_type = "application/atom+xml" if params.get("format") == "atom" else "application/rss+xml"
+        self._send(200, body, content_type, etag)
+
+    def _send(self, status: int, body: bytes, content_type: str, etag: str = None):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FeedServer(http.server.ThreadingHTTPServer):
+    """Threaded fixture server; bodies are generated once per URL and reused."""
+
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), FeedHandler)
+        self.now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+        self.hits = {}
+        self._bodies = {}
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+    def feed_url(self, name: str, **params) -> str:
+        """URL of a generated feed; keyword arguments become query parameters."""
+        query = "&".join(f"{key}={value}" for key, value in params.items())
+        return f"{self.base_url}/feed/{name}" + (f"?{query}" if query else "")
+
+    def handle_error(self, request, client_address):
+        # Clients that stop reading early (the streaming parser) reset the connection
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    def record(self, path: str):
+        with self._lock:
+            self.hits[path] = self.hits.get(path, 0) + 1
+
+    def feed_body(self, key: str, name: str, params: dict) -> bytes:
+        with self._lock:
+            body = self._bodies.get(key)
+        if body is None:
+            entries = generate_entries(name, int(params.get("items", 50)), float(params.get("dupes", 0)),
+                                       self.now, params.get("dates", "mixed"), int(params.get("content", 0)))
+            body = render_feed(name, entries, params.get("format", "rss"))
+            with self._lock:
+                self._bodies[key] = body
+        return body
+
+    def start(self) -> "FeedServer":
+        threading.Thread(target=self.serve_forever, name="rss-server", daemon=True).start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = FeedServer(args.host, args.port)
+    print(f"Serving generated feeds at {server.feed_url('example', items=50, format='rss')}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Fast date parsing for RSS/Atom entries.
+
+Dates are resolved in order of cost: feedparser's pre-parsed struct_time,
+then precompiled RFC 822 and ISO 8601 parsers, then the generic strptime
+formats. String results are memoized because the same timestamps repeat
+across polls. All results are naive datetimes in UTC.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+# Fallback formats for strings the fast parsers reject
+FALLBACK_FORMATS = [
+    "%a, %d %b %Y %H:%M:%S %z",      # RFC 822
+    "%a, %d %b %Y %H:%M:%S %Z",      # RFC 822 with timezone name
+    "%a, %d %b %Y %H:%M:%S GMT",     # RFC 822 GMT
+    "%Y-%m-%dT%H:%M:%S%z",           # ISO 8601
+    "%Y-%m-%dT%H:%M:%SZ",            # ISO 8601 UTC
+    "%Y-%m-%dT%H:%M:%S.%fZ",         # ISO 8601 with microseconds
+    "%Y-%m-%d %H:%M:%S",             # Simple datetime
+    "%Y-%m-%d",                       # Simple date
+]
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# Named zones allowed by RFC 822, as UTC offsets in minutes
+TIMEZONE_OFFSETS = {
+    "": 0, "z": 0, "ut": 0, "utc": 0, "gmt": 0,
+    "est": -300, "edt": -240, "cst": -360, "cdt": -300,
+    "mst": -420, "mdt": -360, "pst": -480, "pdt": -420,
+}
+
+RFC822_RE = re.compile(
+    r"^(?:[A-Za-z]{3},?\s+)?(\d{1,2})\s+([A-Za-z]{3})[a-z]*\s+(\d{2,4})\s+"
+    r"(\d{1,2}):(\d{2})(?::(\d{2}))?\s*([A-Za-z]*|[+-]\d{2}:?\d{2})$"
+)
+
+ISO8601_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d{1,6})\d*)?)?)?"
+    r"\s*(Z|z|[+-]\d{2}(?::?\d{2})?)?$"
+)
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _offset_minutes(tz: str):
+    """UTC offset in minutes for a numeric or named zone, or None if unknown."""
+    if tz and tz[0] in "+-":
+        digits = tz[1:].replace(":", "")
+        hours = int(digits[:2])
+        minutes = int(digits[2:4] or 0)
+        offset = hours * 60 + minutes
+        return -offset if tz[0] == "-" else offset
+    return TIMEZONE_OFFSETS.get(tz.lower())
+
+
+def _parse_rfc822(date_str: str) -> datetime:
+    match = RFC822_RE.match(date_str)
+    if not match:
+        return None
+    day, month, year, hour, minute, second, tz = match.groups()
+    month_num = MONTHS.get(month.lower())
+    offset = _offset_minutes(tz)
+    if month_num is None or offset is None:
+        return None
+    year = int(year)
+    if year < 100:
+        year += 2000 if year < 70 else 1900
+    try:
+        parsed = datetime(year, month_num, int(day), int(hour), int(minute), int(second or 0))
+    except ValueError:
+        return None
+    return parsed - timedelta(minutes=offset)
+
+
+def _parse_iso8601(date_str: str) -> datetime:
+    match = ISO8601_RE.match(date_str)
+    if not match:
+        return None
+    year, month, day, hour, minute, second, fraction, tz = match.groups()
+    try:
+        parsed = datetime(
+            int(year), int(month), int(day),
+            int(hour or 0), int(minute or 0), int(second or 0),
+            int(fraction.ljust(6, "0")) if fraction else 0,
+        )
+    except ValueError:
+        return None
+    if tz:
+        parsed -= timedelta(minutes=_offset_minutes(tz))
+    return parsed
+
+
+def _parse_with_formats(date_str: str) -> datetime:
+    for fmt in FALLBACK_FORMATS:
+        try:
+            parsed = datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+        offset = parsed.utcoffset()
+        if offset:
+            parsed -= offset
+        return parsed.replace(tzinfo=None)
+    return None
+
+
+@lru_cache(maxsize=8192)
+def parse_date(date_str: str) -> datetime:
+    """Parse an RSS/Atom date string into a naive UTC datetime, or None."""
+    if not date_str:
+        return None
+
+    date_str = WHITESPACE_RE.sub(" ", date_str.strip())
+    if date_str[:1].isdigit() and date_str[4:5] == "-":
+        return _parse_iso8601(date_str) or _parse_with_formats(date_str)
+    return _parse_rfc822(date_str) or _parse_with_formats(date_str)
+
+
+def parse_entry_date(entry) -> tuple:
+    """Return (raw date string, naive UTC datetime) for a feedparser entry.
+
+    feedparser's published_parsed/updated_parsed struct_times are already in
+    UTC, so they are used directly; the raw string is only parsed when
+    feedparser could not.
+    """
+    date_str = entry.get("published", "") or entry.get("updated", "")
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if parsed:
+        try:
+            return date_str, datetime(*parsed[:6])
+        except (TypeError, ValueError):
+            pass
+    return date_str, parse_date(date_str)
+
+
+def utc_now() -> datetime:
+    """Current time as a naive UTC datetime, comparable with parsed dates."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
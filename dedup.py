@@ -0,0 +1,203 @@
+"""Near-duplicate story detection with SimHash and LSH banding.
+
+Each article gets two 64-bit SimHashes: one over word shingles of its
+normalized title and summary, and one over the summary alone. Each hash is
+split into bands, and articles that share a band value become candidate
+pairs. Candidates within MAX_HAMMING_DISTANCE bits are merged into one
+cluster; identical normalized titles are checked against each other
+directly, but still have to pass the same distance test. Bucketing
+keeps the work roughly linear in the number of articles instead of
+comparing every pair.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+
+from enrichment import normalize_text
+from feed_config import current_feeds
+
+SIMHASH_BITS = 64
+# With more bands than the distance threshold, any two hashes within the
+# threshold are guaranteed to agree on at least one band
+LSH_BANDS = 5
+MAX_HAMMING_DISTANCE = 4
+
+# Summaries shorter than this are too generic to identify a story on their own
+MIN_SUMMARY_WORDS = 12
+# A summary match also needs this much title word overlap (Jaccard), so a
+# feed's boilerplate summary does not merge unrelated posts
+MIN_TITLE_OVERLAP = 0.25
+
+# Trailing " | Source" or " - Source Name" appended by syndication; only
+# stripped when it names the article's own source or a configured feed source,
+# so "Power Rankings - NFC East" and "Mailbag | Part 2" keep their suffix
+TITLE_SUFFIX_RE = re.compile(r"\s+[|\-–—]\s*([^|\-–—]+)$")
+
+# (shift, mask) for each band; the last band takes any leftover bits
+_BANDS = [
+    (band * (SIMHASH_BITS // LSH_BANDS),
+     (1 << (SIMHASH_BITS // LSH_BANDS + (SIMHASH_BITS % LSH_BANDS if band == LSH_BANDS - 1 else 0))) - 1)
+    for band in range(LSH_BANDS)
+]
+
+
+def source_names() -> frozenset:
+    """Normalized names of the configured feed sources."""
+    return frozenset(normalize_text(feed_info["source"]) for feed_info in current_feeds().sources)
+
+
+def normalize_title(title: str, source: str = None, sources: frozenset = frozenset()) -> str:
+    """Title as lowercase words, without a trailing suffix naming `source` or one of `sources`."""
+    title = str(title).strip()
+    match = TITLE_SUFFIX_RE.search(title)
+    if match:
+        suffix = normalize_text(match.group(1))
+        if suffix and (suffix in sources or (source and suffix == normalize_text(source))):
+            title = title[:match.start()]
+    return normalize_text(title)
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _simhash(features: list) -> int:
+    if not features:
+        return 0
+
+    # Per-bit counts of set bits, kept bit-sliced: planes[k] holds bit k of
+    # every position's counter, so each feature costs O(log n) integer ops
+    # instead of one Python operation per bit
+    planes = []
+    for feature in features:
+        carry = _feature_hash(feature)
+        for k in range(len(planes)):
+            planes[k], carry = planes[k] ^ carry, planes[k] & carry
+            if not carry:
+                break
+        if carry:
+            planes.append(carry)
+
+    fingerprint = 0
+    for bit in range(SIMHASH_BITS):
+        count = 0
+        for k, plane in enumerate(planes):
+            count |= (plane >> bit & 1) << k
+        if 2 * count > len(features):
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def _bigrams(words: list) -> list:
+    return [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+@lru_cache(maxsize=16384)
+def simhash(normalized_title: str, summary: str) -> int:
+    """64-bit SimHash of an article's normalize_title words and title+summary word bigrams."""
+    title_words = normalized_title.split()
+    return _simhash(title_words + _bigrams(title_words + normalize_text(summary).split()))
+
+
+@lru_cache(maxsize=16384)
+def summary_simhash(summary: str) -> int:
+    """64-bit SimHash of the summary's word bigrams, or None if it is too short."""
+    words = normalize_text(summary).split()
+    if len(words) < MIN_SUMMARY_WORDS:
+        return None
+    return _simhash(_bigrams(words))
+
+
+def _title_overlap(title_a: str, title_b: str) -> float:
+    words_a = set(title_a.split())
+    words_b = set(title_b.split())
+    if not words_a or not words_b:
+        return 0.0
+    return len(words_a & words_b) / len(words_a | words_b)
+
+
+def _within_distance(a: int, b: int) -> bool:
+    return bin(a ^ b).count("1") <= MAX_HAMMING_DISTANCE
+
+
+def _merge_bucket(bucket: list, i: int, find, union, is_near):
+    """Union item i with matching bucket members, then add it to the bucket.
+
+    An item that joined a cluster already present in the bucket is not
+    added, so syndicated copies of one story do not grow the bucket.
+    """
+    joined = False
+    for j in bucket:
+        if find(i) == find(j):
+            joined = True
+        elif is_near(j):
+            union(i, j)
+            joined = True
+    if not joined:
+        bucket.append(i)
+
+
+def cluster_near_duplicates(items: list) -> list:
+    """Group items into clusters of near-duplicates, preserving input order.
+
+    Returns a list of clusters, each a list of items; the first item of a
+    cluster is the earliest in the input.
+    """
+    parent = list(range(len(items)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int):
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    titles = []
+    raw_titles = []
+    full_hashes = []
+    summary_hashes = []
+    buckets = {}
+    title_index = {}
+    sources = source_names()
+    for i, item in enumerate(items):
+        summary = item.get("summary", "")
+        raw_title = normalize_text(str(item.get("title", "")).strip())
+        key = normalize_title(item.get("title", ""), item.get("source"), sources)
+        full_hash = simhash(key, summary)
+        summary_hash = summary_simhash(summary)
+        titles.append(key)
+        raw_titles.append(raw_title)
+        full_hashes.append(full_hash)
+        summary_hashes.append(summary_hash)
+
+        # Identical titles are checked directly, since banding may not pair
+        # them. Titles that only match once a source suffix is stripped are
+        # merged only if their hashes agree too
+        if key:
+            for j in title_index.setdefault(key, []):
+                if raw_title == raw_titles[j] or _within_distance(full_hash, full_hashes[j]):
+                    union(i, j)
+            title_index[key].append(i)
+
+        for band, (shift, mask) in enumerate(_BANDS):
+            _merge_bucket(buckets.setdefault(("full", band, full_hash >> shift & mask), []), i, find, union,
+                          lambda j: _within_distance(full_hash, full_hashes[j]))
+            if summary_hash is not None:
+                _merge_bucket(buckets.setdefault(("summary", band, summary_hash >> shift & mask), []), i, find, union,
+                              lambda j: (_within_distance(summary_hash, summary_hashes[j])
+                                         and _title_overlap(key, titles[j]) >= MIN_TITLE_OVERLAP))
+
+    clusters = {}
+    for i, item in enumerate(items):
+        clusters.setdefault(find(i), []).append(item)
+    return list(clusters.values())
+
+
+def dedupe_near_duplicates(items: list) -> list:
+    """One representative (the earliest in input order) per near-duplicate cluster."""
+    return [cluster[0] for cluster in cluster_near_duplicates(items)]
@@ -0,0 +1,26 @@
+"""Per-article enrichment computed once at ingest instead of on every rerun."""
+
+import re
+
+from article import Article
+from keyword_matching import FOCUS_AREAS, article_text, best_category, match_article
+
+WORD_RE = re.compile(r"\w+")
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase word tokens joined by single spaces, punctuation dropped."""
+    return " ".join(WORD_RE.findall(str(text).lower()))
+
+
+def enrich_article(item: Article) -> Article:
+    """A copy of the article with category, focus areas and normalized text set."""
+    item = Article.from_mapping(item)
+    title = item.get("title", "")
+    summary = item.get("summary", "")
+    scores = match_article(title, summary)
+    return item.replace(
+        category=best_category(scores["category"]),
+        focus_areas=[area for area in FOCUS_AREAS if scores["focus"].get(area)],
+        search_text=normalize_text(article_text(title, summary)),
+    )
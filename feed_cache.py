@@ -0,0 +1,262 @@
+"""Feed results shared between dashboard replicas, with a per-feed refresh lease.
+
+Every replica used to poll every upstream feed on its own, so upstream
+load grew with the replica count. With a shared cache, a replica whose
+copy of a feed has expired first adopts any newer result another replica
+published. Only the replica holding the feed's lease fetches it; the
+others wait for and read its result, or keep serving what they have.
+
+Two backends implement the same four calls (get, put, acquire, release):
+
+    sqlite:///data/feed_cache.db   SQLite file on a disk the replicas share
+    redis://127.0.0.1:6379/0       any server speaking the Redis protocol
+
+A bare path means SQLite. benchmarks/resp_server.py is a local stand-in
+Redis server for development and benchmarks.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from urllib.parse import urlparse
+
+from article import FIELDS, Article
+from feed_config import MAX_AGE_DAYS
+from feed_http import FETCH_DEADLINE_SECONDS
+
+# Shared cache backend URL; unset keeps every replica's feed cache private
+DEFAULT_FEED_CACHE_URL = os.environ.get("FEED_CACHE_URL")
+
+# A lease outlives one fetch, so a replica that dies mid-fetch blocks the feed only briefly
+LEASE_SECONDS = FETCH_DEADLINE_SECONDS * 2
+
+# Shared results are kept this long so replicas can serve stale items while upstream is down
+RESULT_KEEP_SECONDS = MAX_AGE_DAYS * 86400
+
+SOCKET_TIMEOUT_SECONDS = 2.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS feed_results (
+    url TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    item_window INTEGER NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS feed_leases (
+    url TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+# One statement, so taking a free or expired lease is atomic across processes
+ACQUIRE_SQL = """
+INSERT INTO feed_leases (url, owner, expires_at) VALUES (?, ?, ?)
+ON CONFLICT (url) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+WHERE feed_leases.expires_at <= ?
+"""
+
+
+def encode_result(fetched_at: float, window: int, items: list) -> str:
+    """A feed result as JSON: fetch time, item window and one value list per article."""
+    rows = []
+    for item in items:
+        item = Article.from_mapping(item)
+        values = dict(zip(FIELDS, item._values()))
+        if values["pub_date"] is not None:
+            values["pub_date"] = values["pub_date"].isoformat()
+        rows.append([values[name] for name in FIELDS])
+    return json.dumps({"fetched_at": fetched_at, "window": window, "fields": FIELDS, "items": rows},
+                      separators=(",", ":"))
+
+
+def decode_result(payload) -> tuple:
+    """(fetched_at, window, items) from encode_result's JSON."""
+    data = json.loads(payload)
+    items = []
+    for row in data["items"]:
+        values = dict(zip(data["fields"], row))
+        if values.get("pub_date"):
+            values["pub_date"] = datetime.fromisoformat(values["pub_date"])
+        items.append(Article(**{name: values.get(name) for name in FIELDS}))
+    return data["fetched_at"], data["window"], items
+
+
+class FeedCache:
+    """Interface of a shared feed result cache; see the module docstring."""
+
+    def get(self, url: str) -> tuple:
+        """(fetched_at as Unix time, window, items) of the last published result, or None."""
+        raise NotImplementedError
+
+    def put(self, url: str, items: list, window: int, fetched_at: float = None):
+        """Publish a feed's latest items, fetched at `fetched_at` (default now)."""
+        raise NotImplementedError
+
+    def acquire(self, url: str, owner: str, seconds: float = LEASE_SECONDS) -> bool:
+        """Take the feed's refresh lease for `seconds`; False while it is held, even by `owner`."""
+        raise NotImplementedError
+
+    def release(self, url: str, owner: str):
+        """Give up the feed's refresh lease if `owner` still holds it."""
+        raise NotImplementedError
+
+
+class SQLiteFeedCache(FeedCache):
+    """Shared cache in one SQLite file, for replicas on one host or a shared disk."""
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=SOCKET_TIMEOUT_SECONDS, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def get(self, url: str) -> tuple:
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM feed_results WHERE url = ?", (url,)).fetchone()
+        return decode_result(row[0]) if row else None
+
+    def put(self, url: str, items: list, window: int, fetched_at: float = None):
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        payload = encode_result(fetched_at, window, items)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO feed_results (url, fetched_at, item_window, payload) VALUES (?, ?, ?, ?)",
+                (url, fetched_at, window, payload),
+            )
+            self._conn.execute("DELETE FROM feed_results WHERE fetched_at < ?", (fetched_at - RESULT_KEEP_SECONDS,))
+
+    def acquire(self, url: str, owner: str, seconds: float = LEASE_SECONDS) -> bool:
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(ACQUIRE_SQL, (url, owner, now + seconds, now))
+        return cursor.rowcount > 0
+
+    def release(self, url: str, owner: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM feed_leases WHERE url = ? AND owner = ?", (url, owner))
+
+
+class RespError(Exception):
+    """The server answered a command with an error reply."""
+
+
+class RedisFeedCache(FeedCache):
+    """Shared cache on a Redis-protocol server, for replicas on several hosts.
+
+    Speaks the few RESP commands it needs (GET, SET with NX/PX/EX, DEL,
+    SELECT) over one socket, so no client library is required and any
+    compatible server works, including benchmarks/resp_server.py.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 6379, db: int = 0, prefix: str = "sports_feed:"):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._sock = None
+        self._reader = None
+
+    def _connect(self):
+        # Caller holds self._lock
+        self._sock = socket.create_connection((self.host, self.port), timeout=SOCKET_TIMEOUT_SECONDS)
+        self._reader = self._sock.makefile("rb")
+        if self.db:
+            self._send(("SELECT", self.db))
+
+    def _close(self):
+        # Caller holds self._lock
+        for handle in (self._reader, self._sock):
+            try:
+                if handle is not None:
+                    handle.close()
+            except OSError:
+                pass
+        self._sock = self._reader = None
+
+    def _send(self, args: tuple):
+        # Caller holds self._lock
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            value = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(value), value))
+        self._sock.sendall(b"".join(parts))
+        return self._read_reply()
+
+    def _read_reply(self):
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by the cache server")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body.decode()
+        if kind == b"-":
+            raise RespError(body.decode())
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            count = int(body)
+            return None if count < 0 else [self._read_reply() for _ in range(count)]
+        raise ConnectionError(f"Unexpected reply from the cache server: {line!r}")
+
+    def command(self, *args):
+        """Send one command and return its reply, reconnecting once if the connection dropped."""
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    return self._send(args)
+                except (OSError, ConnectionError):
+                    self._close()
+                    if attempt:
+                        raise
+
+    def get(self, url: str) -> tuple:
+        payload = self.command("GET", self.prefix + "result:" + url)
+        return decode_result(payload) if payload is not None else None
+
+    def put(self, url: str, items: list, window: int, fetched_at: float = None):
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        payload = encode_result(fetched_at, window, items)
+        self.command("SET", self.prefix + "result:" + url, payload, "EX", int(RESULT_KEEP_SECONDS))
+
+    def acquire(self, url: str, owner: str, seconds: float = LEASE_SECONDS) -> bool:
+        key = self.prefix + "lease:" + url
+        return self.command("SET", key, owner, "NX", "PX", int(seconds * 1000)) == "OK"
+
+    def release(self, url: str, owner: str):
+        # Check-then-delete without a script: if the lease lapses in between,
+        # the worst case is one extra fetch by whoever takes it next
+        key = self.prefix + "lease:" + url
+        if self.command("GET", key) == owner.encode():
+            self.command("DEL", key)
+
+
+def open_feed_cache(url: str) -> FeedCache:
+    """A shared feed cache from a sqlite:///path or redis://host:port/db URL (a bare path means SQLite)."""
+    parsed = urlparse(url)
+    if parsed.scheme in ("redis", "resp"):
+        db = int(parsed.path.strip("/") or 0)
+        return RedisFeedCache(parsed.hostname or "127.0.0.1", parsed.port or 6379, db)
+    if url.startswith("sqlite:///"):
+        return SQLiteFeedCache(url[len("sqlite:///"):])
+    if not parsed.scheme:
+        return SQLiteFeedCache(url)
+    raise ValueError(f"Unsupported feed cache URL: {url}")
@@ -0,0 +1,122 @@
+"""Feed sources, per-section windows and the article age limit.
+
+Shared by the dashboard and the headless ingestion worker. The feeds
+below are the built-in defaults; feed_registry replaces them from the
+file named by FEED_CONFIG_PATH. Read the configured feeds through
+current_feeds().
+"""
+
+import threading
+from types import MappingProxyType
+
+# =============================================================================
+# SPORT-SPECIFIC FEED MAPPING (Explicit - no cross-sport contamination)
+# =============================================================================
+ANALYTICS_FEEDS = {
+    "MLB": [
+        {"url": "https://blogs.fangraphs.com/feed/", "source": "FanGraphs"},
+        {"url": "https://www.baseballprospectus.com/feed/", "source": "Baseball Prospectus"},
+        {"url": "https://technology.mlblogs.com/feed", "source": "MLB Tech Blog"},
+    ],
+    "NFL": [
+        {"url": "https://www.the33rdteam.com/feed/", "source": "The 33rd Team"},
+        {"url": "https://www.sharpfootballanalysis.com/feed/", "source": "Sharp Football"},
+    ],
+    "NBA": [
+        {"url": "https://dunksandthrees.com/feed", "source": "Dunks & Threes"},
+    ],
+    "College Football": [
+        {"url": "https://www.saturdaytradition.com/feed/", "source": "Saturday Tradition"},
+    ],
+    "College Basketball": [
+        {"url": "https://kenpom.com/blog/feed/", "source": "KenPom"},
+    ],
+}
+
+# Deep Dive feeds mapped by sport (explicit mapping)
+DEEP_DIVE_FEEDS = {
+    "MLB": [
+        {"url": "https://blogs.fangraphs.com/feed/", "source": "FanGraphs"},
+        {"url": "https://www.baseballprospectus.com/feed/", "source": "Baseball Prospectus"},
+    ],
+    "NFL": [
+        {"url": "https://www.the33rdteam.com/feed/", "source": "The 33rd Team"},
+        {"url": "https://www.sharpfootballanalysis.com/feed/", "source": "Sharp Football"},
+    ],
+    "NBA": [
+        {"url": "https://dunksandthrees.com/feed", "source": "Dunks & Threes"},
+    ],
+    "College Football": [
+        {"url": "https://www.saturdaytradition.com/feed/", "source": "Saturday Tradition"},
+    ],
+    "College Basketball": [
+        {"url": "https://kenpom.com/blog/feed/", "source": "KenPom"},
+    ],
+}
+
+# Articles each section reads per feed
+NEWS_FEED_LIMIT = 15
+DEEP_DIVE_LIMIT = 8
+
+
+class FeedTables:
+    """One feed configuration and the tables derived from it; never changed once built.
+
+    sources: every configured feed, across both sections.
+    sports: sport each feed URL belongs to, used to tag articles in the
+    article store.
+    windows: largest window any section reads from each feed URL. A URL
+    listed in both sections is fetched once at this size and each section
+    takes a slice.
+    """
+
+    __slots__ = ("news", "deep_dives", "sources", "sports", "windows")
+
+    def __init__(self, analytics_feeds: dict, deep_dive_feeds: dict):
+        self.news = MappingProxyType({sport: tuple(feeds) for sport, feeds in analytics_feeds.items()})
+        self.deep_dives = MappingProxyType({sport: tuple(feeds) for sport, feeds in deep_dive_feeds.items()})
+        self.sources = tuple(
+            feed_info
+            for feeds in (self.news, self.deep_dives)
+            for sport_feeds in feeds.values()
+            for feed_info in sport_feeds
+        )
+        self.sports = MappingProxyType({
+            feed_info["url"]: sport
+            for feeds in (self.news, self.deep_dives)
+            for sport, sport_feeds in feeds.items()
+            for feed_info in sport_feeds
+        })
+        windows = {}
+        for section_feeds, section_limit in ((self.news, NEWS_FEED_LIMIT), (self.deep_dives, DEEP_DIVE_LIMIT)):
+            for feed_info in (feed for sport_feeds in section_feeds.values() for feed in sport_feeds):
+                windows[feed_info["url"]] = max(windows.get(feed_info["url"], 0), section_limit)
+        self.windows = MappingProxyType(windows)
+
+
+# Process-wide feed tables; replaced whole by configure_feeds, never changed in place
+_feeds = FeedTables(ANALYTICS_FEEDS, DEEP_DIVE_FEEDS)
+_feeds_lock = threading.Lock()
+
+
+def current_feeds() -> FeedTables:
+    """The configured feeds. Take them once per operation so it sees one configuration throughout."""
+    return _feeds
+
+
+def configure_feeds(analytics_feeds: dict, deep_dive_feeds: dict):
+    """Replace the configured feeds (see feed_registry for hot reload).
+
+    The new tables are built in full, then published in one step, so a
+    reader never sees a half-applied configuration.
+    """
+    global _feeds
+    feeds = FeedTables(analytics_feeds, deep_dive_feeds)
+    with _feeds_lock:
+        _feeds = feeds
+
+
+# =============================================================================
+# DATE FILTERING: Only show articles from last 30 days (after Dec 21, 2025)
+# =============================================================================
+MAX_AGE_DAYS = 30
@@ -0,0 +1,487 @@
+"""Feed fetching: conditional GETs, item extraction and the stale-while-revalidate refresher.
+
+Nothing here depends on Streamlit, so the dashboard and the headless
+ingestion worker share the same fetch path.
+"""
+
+import html
+import os
+import re
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import requests
+
+from article import Article
+from article_store import ArticleStore
+from date_parsing import parse_entry_date, utc_now
+from enrichment import enrich_article
+from feed_cache import LEASE_SECONDS, FeedCache
+from feed_config import MAX_AGE_DAYS, NEWS_FEED_LIMIT, current_feeds
+from feed_http import BREAKERS, FETCH_DEADLINE_SECONDS, CircuitOpenError, get_with_retries, read_body
+from feed_metrics import METRICS
+from feed_polling import POLLING
+from stream_parser import StreamParseError, parse_feed_stream
+
+# Upper bound on feeds fetched at the same time (override with FEED_FETCH_WORKERS)
+FETCH_MAX_WORKERS = int(os.environ.get("FEED_FETCH_WORKERS", "8"))
+
+# Some feed hosts reject the default python-requests user agent
+USER_AGENT = "SportsAnalyticsDashboard/1.0 (+feedparser)"
+
+# Parse feeds incrementally and stop early (STREAMING_PARSER=0 uses feedparser for everything)
+STREAMING_PARSER = os.environ.get("STREAMING_PARSER", "1") != "0"
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Feed results older than this are served as-is while a background refresh runs,
+# until the feed's own poll interval has been learned (see feed_polling)
+FEED_TTL_SECONDS = 600
+
+# How often a process waiting on another's refresh lease checks the shared cache
+LEASE_POLL_SECONDS = 0.25
+
+
+class FeedValidatorStore:
+    """Thread-safe per-URL store of HTTP validators (ETag/Last-Modified) and parsed entries."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._feeds = {}
+
+    def get(self, url: str) -> dict:
+        """Return the stored validators and entries for a URL, or None."""
+        with self._lock:
+            return self._feeds.get(url)
+
+    def put(self, url: str, etag: str, modified: str, entries: list, limit: int = None):
+        """Remember the validators and parsed entries from a full 200 response.
+
+        `limit` is set when parsing stopped early after that many entries,
+        so a later request for more entries does not reuse them on a 304.
+        """
+        with self._lock:
+            self._feeds[url] = {"etag": etag, "modified": modified, "entries": entries, "limit": limit}
+
+
+# Process-wide validator store; module state survives Streamlit reruns
+VALIDATORS = FeedValidatorStore()
+
+# Feeds the streaming parser rejected; they go straight to feedparser from then on
+_UNSTREAMABLE = set()
+
+
+def _covers(cached: dict, limit: int) -> bool:
+    """Whether cached entries were parsed far enough to serve `limit` entries."""
+    return cached["limit"] is None or (limit is not None and cached["limit"] >= limit)
+
+
+def _parse_with_feedparser(response: requests.Response, deadline: float, sample: dict) -> list:
+    # Imported on first use: most feeds never need it, and it slows the dashboard's first paint
+    import feedparser
+
+    content = b"".join(read_body(response, deadline, STREAM_CHUNK_BYTES))
+    sample["bytes"] = len(content)
+    started = time.perf_counter()
+    feed = feedparser.parse(content, response_headers={k.lower(): v for k, v in response.headers.items()})
+    sample["parse_seconds"] = time.perf_counter() - started
+    if feed.bozo and not feed.entries:
+        sample["error"] = f"Unparseable feed: {feed.get('bozo_exception')}"
+    return feed.entries
+
+
+def fetch_feed_entries(url: str, validators: FeedValidatorStore = None, sample: dict = None,
+                       limit: int = None, cutoff: datetime = None) -> list:
+    """Fetch a feed with a conditional GET, reusing the last parsed entries on a 304.
+
+    The fetch is bounded by feed_http's timeouts and deadline, and raises
+    CircuitOpenError without a request while the feed's circuit is open.
+    With STREAMING_PARSER, parsing stops once `limit` entries dated after
+    `cutoff` are found (see stream_parser). If `sample` is given it is
+    filled with the response status, bytes downloaded, download and parse
+    times, retries, entries seen and any error.
+    """
+    sample = {} if sample is None else sample
+    if not BREAKERS.allow(url):
+        raise CircuitOpenError(f"Circuit open, next attempt in {BREAKERS.retry_in(url):.0f}s")
+
+    try:
+        entries = _fetch_feed_entries(url, validators or VALIDATORS, sample, limit, cutoff)
+    except Exception:
+        BREAKERS.record_failure(url)
+        raise
+    if sample.get("error"):
+        BREAKERS.record_failure(url)
+    else:
+        BREAKERS.record_success(url)
+    return entries
+
+
+def _fetch_feed_entries(url: str, store: FeedValidatorStore, sample: dict, limit: int, cutoff: datetime) -> list:
+    cached = store.get(url)
+    if cached and not _covers(cached, limit):
+        cached = None
+
+    headers = {"User-Agent": USER_AGENT}
+    if cached:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["modified"]:
+            headers["If-Modified-Since"] = cached["modified"]
+
+    streaming = STREAMING_PARSER and url not in _UNSTREAMABLE
+    deadline = time.monotonic() + FETCH_DEADLINE_SECONDS
+    started = time.perf_counter()
+    response = get_with_retries(url, headers, deadline, sample)
+    sample["status"] = response.status_code
+
+    with response:
+        if response.status_code == 304 and cached:
+            sample["fetch_seconds"] = time.perf_counter() - started
+            sample["bytes"] = 0
+            sample["entries_seen"] = len(cached["entries"])
+            return cached["entries"]
+        if response.status_code >= 400:
+            sample["fetch_seconds"] = time.perf_counter() - started
+            sample["bytes"] = 0
+            sample["error"] = f"HTTP {response.status_code}"
+            return []
+
+        parsed_limit = None
+        if streaming:
+            # Download and parsing overlap here: fetch_seconds is the time to
+            # the response headers and parse_seconds covers reading the body
+            sample["fetch_seconds"] = time.perf_counter() - started
+            started = time.perf_counter()
+            try:
+                chunks = read_body(response, deadline, STREAM_CHUNK_BYTES)
+                entries = parse_feed_stream(chunks, limit, cutoff, sample)
+                chunks.close()
+                sample["parse_seconds"] = time.perf_counter() - started
+                parsed_limit = limit
+            except StreamParseError:
+                # The body was partly consumed; fetch it again in full for feedparser
+                _UNSTREAMABLE.add(url)
+                streaming = False
+                response = get_with_retries(url, {"User-Agent": USER_AGENT}, deadline, sample)
+
+        if not streaming:
+            with response:
+                entries = _parse_with_feedparser(response, deadline, sample)
+            sample.setdefault("fetch_seconds", time.perf_counter() - started - sample["parse_seconds"])
+
+    sample["entries_seen"] = len(entries)
+    if not entries:
+        return []
+
+    etag = response.headers.get("ETag")
+    modified = response.headers.get("Last-Modified")
+    if etag or modified:
+        store.put(url, etag, modified, entries, limit=parsed_limit)
+
+    return entries
+
+
+def fetch_rss_feed(url: str, source: str, limit: int = NEWS_FEED_LIMIT) -> list:
+    """Fetch and parse RSS feed with error handling and 30-day filtering."""
+    sample = {}
+    items = []
+    try:
+        cutoff_date = utc_now() - timedelta(days=MAX_AGE_DAYS)
+        entries = fetch_feed_entries(url, sample=sample, limit=limit, cutoff=cutoff_date)
+
+        if not entries:
+            return []
+
+        sport = current_feeds().sports.get(url)
+        for entry in entries:
+            if len(items) >= limit:
+                break
+
+            try:
+                # Parse publication date
+                pub_date_str, pub_date = parse_entry_date(entry)
+
+                # CRITICAL: Skip articles older than 30 days
+                if pub_date and pub_date < cutoff_date:
+                    continue
+
+                # If we can't parse the date, skip the article (be strict)
+                if not pub_date:
+                    continue
+
+                summary = entry.get("summary", "") or entry.get("description", "")
+                summary = html.unescape(str(summary))
+                # Remove HTML tags
+                summary = re.sub(r'<[^>]+>', ' ', summary)
+                summary = re.sub(r'\s+', ' ', summary).strip()
+
+                if len(summary) > 200:
+                    summary = summary[:200].rsplit(" ", 1)[0] + "..."
+
+                items.append(Article(
+                    guid=str(entry.get("id", "") or entry.get("link", "")),
+                    title=str(entry.get("title", "No title")),
+                    link=str(entry.get("link", "#")),
+                    published=pub_date_str,
+                    pub_date=pub_date,
+                    summary=summary,
+                    source=source,
+                    sport=sport,
+                    feed_url=url,
+                ))
+            except Exception:
+                continue
+
+        # Sort by date (newest first)
+        items.sort(key=lambda x: x.get("pub_date") or datetime.min, reverse=True)
+
+        return items
+    except CircuitOpenError as e:
+        sample["skipped"] = True
+        sample["error"] = str(e)
+        return []
+    except Exception as e:
+        sample["error"] = f"{type(e).__name__}: {e}"
+        items = []
+        return []
+    finally:
+        sample["entries_kept"] = len(items)
+        sample["circuit_open"] = BREAKERS.state(url) != "closed"
+        METRICS.record_fetch(url, source, sample)
+
+
+class FeedRefresher:
+    """Stale-while-revalidate cache of fetch_rss_feed results, keyed by feed URL.
+
+    Each URL is fetched once per refresh cycle at the largest window any
+    section reads (FeedTables.windows); callers get a slice of that shared result.
+    A result expires after its feed's adaptive poll interval (POLLING), or
+    `ttl` until the feed has been fetched once.
+    Fresh results are served directly. Expired results are still served
+    immediately while a background thread re-fetches the feed. On a cold
+    start, feeds are first served from the article store, so only a feed
+    that has never been ingested makes the caller wait.
+
+    With a shared `cache` (see feed_cache), an expired feed is first
+    looked up there, and only the process holding the feed's lease fetches
+    it. Others serve what they have and leave waiting for and adopting the
+    published result to a background thread, so a page never blocks on
+    another process's fetch.
+    """
+
+    def __init__(self, store: ArticleStore = None, ttl: int = FEED_TTL_SECONDS,
+                 max_workers: int = FETCH_MAX_WORKERS, listeners: list = None, cache: FeedCache = None):
+        self.store = store
+        self.ttl = ttl
+        self.cache = cache
+        # Identifies this refresher's leases in the shared cache
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        # Callables invoked as listener(url, items) after every refresh
+        self.listeners = list(listeners or [])
+        self._lock = threading.Lock()
+        self._results = {}
+        self._pending = set()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="feed-refresh")
+
+    def get(self, url: str, source: str, limit: int = NEWS_FEED_LIMIT) -> list:
+        """Return cached items for a feed, scheduling a background refresh if expired."""
+        window = max(limit, current_feeds().windows.get(url, 0))
+        with self._lock:
+            cached = self._results.get(url)
+            if cached is not None and cached[2] < limit:
+                cached = None
+        if self.cache is not None and (cached is None or self._expired(url, cached)):
+            # Another process may have refreshed the feed already
+            cached = self._adopt_shared(url, source, window) or cached
+        if cached is not None and self._expired(url, cached):
+            with self._lock:
+                self._schedule_refresh(url, source, window)
+
+        METRICS.record_cache(url, cached is not None, source)
+        if cached is not None:
+            return cached[1][:limit]
+
+        stored = self._load_stored(url, window)
+        if stored:
+            with self._lock:
+                # Served from disk, so treat it as expired and refresh in the background
+                if url not in self._results or self._results[url][2] < window:
+                    self._results[url] = (float("-inf"), tuple(stored), window)
+                self._schedule_refresh(url, source, window)
+            return stored[:limit]
+
+        return self.refresh(url, source, limit)
+
+    def refresh(self, url: str, source: str, limit: int = NEWS_FEED_LIMIT, wait: bool = False) -> list:
+        """Re-fetch one feed now without touching any other cached feed.
+
+        With a shared cache, a feed whose lease another process holds is not
+        fetched here. Without `wait`, the shared, cached or stored items are
+        returned at once and a background thread waits for the other
+        process's result. With `wait` (background threads only), its result
+        is adopted once published, and the feed is only fetched if the lease
+        is given up or lapses without one.
+        """
+        window = max(limit, current_feeds().windows.get(url, 0))
+        requested_at = time.time()
+        deadline = time.monotonic() + LEASE_SECONDS
+        leased = self._acquire_lease(url)
+        if leased is False and not wait:
+            return self._serve_while_leased(url, source, window)[:limit]
+        while leased is False:
+            time.sleep(LEASE_POLL_SECONDS)
+            leased = self._acquire_lease(url) if time.monotonic() < deadline else None
+            adopted = self._adopt_shared(url, source, window, newer_than=requested_at)
+            if adopted is not None:
+                if leased:
+                    self._release_lease(url)
+                return list(adopted[1][:limit])
+
+        try:
+            items = self._fetch(url, source, window)
+        finally:
+            if leased:
+                self._release_lease(url)
+        return items[:limit]
+
+    def _serve_while_leased(self, url: str, source: str, window: int) -> list:
+        """Items to serve now while another process refreshes the feed; may be empty."""
+        entry = self._adopt_shared(url, source, window)
+        if entry is None:
+            with self._lock:
+                entry = self._results.get(url)
+        items = list(entry[1]) if entry is not None and entry[2] >= window else self._load_stored(url, window)
+        with self._lock:
+            self._schedule_refresh(url, source, window)
+        return items
+
+    def _fetch(self, url: str, source: str, window: int) -> list:
+        with self._lock:
+            previous = self._results.get(url)
+        items = fetch_rss_feed(url, source, window)
+        # Only a successful fetch is published to the shared cache
+        fetched = bool(items)
+        self._observe(url, source, items, previous)
+
+        if self.store is None:
+            items = [enrich_article(item) for item in items]
+        else:
+            try:
+                # The store only enriches entries it has not seen before
+                self.store.ingest(url, source, current_feeds().sports.get(url), items, enrich=enrich_article)
+                stored = self._load_stored(url, window)
+            except Exception:
+                stored = []
+            items = stored or [enrich_article(item) for item in items]
+
+        with self._lock:
+            previous = self._results.get(url)
+            # Keep serving the last good items if the upstream failed or came back empty
+            if not items and previous:
+                items = previous[1]
+            # Tuples of immutable Articles, shared by every session without copying
+            self._results[url] = (time.monotonic(), tuple(items), window)
+
+        if self.cache is not None and fetched:
+            try:
+                self.cache.put(url, items, window)
+            except Exception:
+                pass
+        self._notify(url, items)
+        return items
+
+    def _notify(self, url: str, items: list):
+        for listener in self.listeners:
+            try:
+                listener(url, items)
+            except Exception:
+                pass
+
+    def due(self, url: str) -> bool:
+        """Whether a feed has no result yet or its poll interval has passed."""
+        with self._lock:
+            cached = self._results.get(url)
+        return cached is None or self._expired(url, cached)
+
+    def _expired(self, url: str, cached: tuple) -> bool:
+        return time.monotonic() - cached[0] >= POLLING.interval(url, self.ttl)
+
+    def _observe(self, url: str, source: str, items: list, previous: tuple):
+        if items:
+            interval = POLLING.observe(url, items, previous[1] if previous else (), self.ttl)
+            METRICS.record_poll_interval(url, interval, source)
+
+    def _acquire_lease(self, url: str):
+        """True if this process now holds the feed's lease, False if another does, None without a cache."""
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.acquire(url, self.owner)
+        except Exception:
+            # An unreachable cache must not stop feeds from refreshing
+            return None
+
+    def _release_lease(self, url: str):
+        try:
+            self.cache.release(url, self.owner)
+        except Exception:
+            pass
+
+    def _adopt_shared(self, url: str, source: str, window: int, newer_than: float = None) -> tuple:
+        """Take the shared cache's result for a feed if it is newer than ours; the new entry or None."""
+        try:
+            shared = self.cache.get(url)
+        except Exception:
+            return None
+        if shared is None:
+            return None
+        fetched_at, shared_window, items = shared
+        if not items or shared_window < window or (newer_than is not None and fetched_at < newer_than):
+            return None
+
+        # Shared results carry wall-clock times; local entries are stamped with time.monotonic()
+        stamp = time.monotonic() - max(0.0, time.time() - fetched_at)
+        with self._lock:
+            current = self._results.get(url)
+            if newer_than is None and current is not None and current[2] >= window and current[0] >= stamp:
+                return None
+            entry = self._results[url] = (stamp, tuple(items), shared_window)
+
+        METRICS.record_shared(url, source)
+        self._observe(url, source, items, current)
+        if self.store is not None:
+            try:
+                # Already enriched by the process that fetched them
+                self.store.ingest(url, source, current_feeds().sports.get(url), items)
+            except Exception:
+                pass
+        self._notify(url, items)
+        return entry
+
+    def _schedule_refresh(self, url: str, source: str, window: int):
+        # Caller holds self._lock
+        if url not in self._pending:
+            self._pending.add(url)
+            self._pool.submit(self._refresh_in_background, url, source, window)
+
+    def _load_stored(self, url: str, limit: int) -> list:
+        if self.store is None:
+            return []
+        try:
+            cutoff_date = utc_now() - timedelta(days=MAX_AGE_DAYS)
+            return self.store.feed_articles(url, limit, since=cutoff_date)
+        except Exception:
+            return []
+
+    def _refresh_in_background(self, url: str, source: str, window: int):
+        try:
+            self.refresh(url, source, window, wait=True)
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                self._pending.discard(url)
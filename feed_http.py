@@ -0,0 +1,182 @@
+"""HTTP layer for feed fetches: timeouts, a retry budget and per-feed circuit breakers.
+
+Every fetch gets a connect and read timeout per attempt plus an overall
+deadline that also bounds reading the body, so no upstream can hold a
+page for longer than FETCH_DEADLINE_SECONDS. Connection errors, timeouts
+and 429/5xx responses are retried with jittered exponential backoff
+while the deadline allows. A feed that keeps failing trips its circuit
+breaker and is skipped for a cool-down, during which callers keep
+serving its last good items.
+"""
+
+import os
+import random
+import socket
+import threading
+import time
+
+import requests
+
+CONNECT_TIMEOUT_SECONDS = float(os.environ.get("FEED_CONNECT_TIMEOUT", "3.05"))
+READ_TIMEOUT_SECONDS = float(os.environ.get("FEED_READ_TIMEOUT", "8"))
+# Upper bound on one feed fetch, retries and body included
+FETCH_DEADLINE_SECONDS = float(os.environ.get("FEED_FETCH_DEADLINE", "15"))
+
+MAX_RETRIES = 2
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_CAP_SECONDS = 4.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Consecutive failed fetches that open a feed's circuit, and how long it stays open
+FAILURE_THRESHOLD = 3
+COOLDOWN_SECONDS = 300
+MAX_COOLDOWN_SECONDS = 3600
+
+
+class FetchTimeout(requests.Timeout):
+    """The fetch ran past its overall deadline."""
+
+
+class CircuitOpenError(Exception):
+    """The feed's circuit is open, so it was not fetched."""
+
+
+class CircuitBreaker:
+    """Thread-safe per-URL circuit breakers.
+
+    A circuit opens after FAILURE_THRESHOLD consecutive failures. Once the
+    cool-down passes it lets one trial fetch through (half-open): success
+    closes it, failure re-opens it with double the cool-down, up to
+    MAX_COOLDOWN_SECONDS. `clock` returns the current time in seconds.
+    """
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, cooldown: float = COOLDOWN_SECONDS,
+                 max_cooldown: float = MAX_COOLDOWN_SECONDS, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._circuits = {}
+
+    def _circuit(self, url: str) -> dict:
+        # Caller holds self._lock
+        return self._circuits.setdefault(url, {"failures": 0, "open_until": 0.0, "cooldown": self.cooldown,
+                                               "trial": False})
+
+    def allow(self, url: str) -> bool:
+        """Whether the feed may be fetched now; claims the half-open trial if due."""
+        with self._lock:
+            circuit = self._circuit(url)
+            if circuit["failures"] < self.failure_threshold:
+                return True
+            if circuit["trial"] or self.clock() < circuit["open_until"]:
+                return False
+            circuit["trial"] = True
+            return True
+
+    def record_success(self, url: str):
+        with self._lock:
+            circuit = self._circuit(url)
+            circuit.update(failures=0, open_until=0.0, cooldown=self.cooldown, trial=False)
+
+    def record_failure(self, url: str):
+        with self._lock:
+            circuit = self._circuit(url)
+            circuit["failures"] += 1
+            if circuit["trial"]:
+                circuit["cooldown"] = min(circuit["cooldown"] * 2, self.max_cooldown)
+                circuit["trial"] = False
+            if circuit["failures"] >= self.failure_threshold:
+                circuit["open_until"] = self.clock() + circuit["cooldown"]
+
+    def state(self, url: str) -> str:
+        """Circuit state: closed, open, or half-open once the cool-down is over."""
+        with self._lock:
+            circuit = self._circuits.get(url)
+            if circuit is None or circuit["failures"] < self.failure_threshold:
+                return "closed"
+            if circuit["trial"] or self.clock() >= circuit["open_until"]:
+                return "half-open"
+            return "open"
+
+    def retry_in(self, url: str) -> float:
+        """Seconds until an open circuit allows a trial fetch (0 if it is not open)."""
+        with self._lock:
+            circuit = self._circuits.get(url)
+            if circuit is None or circuit["failures"] < self.failure_threshold:
+                return 0.0
+            return max(0.0, circuit["open_until"] - self.clock())
+
+
+# Process-wide breakers; module state survives Streamlit reruns
+BREAKERS = CircuitBreaker()
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff before retry number `attempt` (0-based)."""
+    return random.uniform(0, min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+def get_with_retries(url: str, headers: dict, deadline: float, sample: dict = None,
+                     clock=time.monotonic, sleep=time.sleep) -> requests.Response:
+    """Streamed GET retried on transient failures until `deadline` (a `clock()` value).
+
+    The last response is returned even if its status is retryable, so the
+    caller can report it. Adds the number of retries to sample["retries"].
+    """
+    sample = {} if sample is None else sample
+    for attempt in range(MAX_RETRIES + 1):
+        remaining = deadline - clock()
+        if remaining <= 0:
+            raise FetchTimeout(f"No response within {FETCH_DEADLINE_SECONDS:g}s")
+        last_attempt = attempt == MAX_RETRIES
+        try:
+            response = requests.get(url, headers=headers, stream=True,
+                                    timeout=(min(CONNECT_TIMEOUT_SECONDS, remaining),
+                                             min(READ_TIMEOUT_SECONDS, remaining)))
+        except (requests.ConnectionError, requests.Timeout):
+            if last_attempt:
+                raise
+        else:
+            if response.status_code not in RETRY_STATUSES or last_attempt:
+                return response
+            response.close()
+
+        delay = backoff_delay(attempt)
+        if clock() + delay >= deadline:
+            raise FetchTimeout(f"Retry budget exhausted within {FETCH_DEADLINE_SECONDS:g}s")
+        sample["retries"] = sample.get("retries", 0) + 1
+        sleep(delay)
+
+
+def _abort(response: requests.Response):
+    # Closing the response does not wake a read blocked in another thread;
+    # shutting the socket down does
+    try:
+        response.raw._fp.fp.raw._sock.shutdown(socket.SHUT_RDWR)
+    except Exception:
+        response.close()
+
+
+def read_body(response: requests.Response, deadline: float, chunk_size: int):
+    """Yield body chunks, raising FetchTimeout once `deadline` passes.
+
+    The read timeout only bounds each socket read, so a server dripping a
+    few bytes at a time could hold a read open indefinitely; a watchdog
+    timer aborts the connection at the deadline instead.
+    """
+    watchdog = threading.Timer(max(0.0, deadline - time.monotonic()), _abort, args=(response,))
+    watchdog.daemon = True
+    watchdog.start()
+    try:
+        for chunk in response.iter_content(chunk_size):
+            if time.monotonic() > deadline:
+                raise FetchTimeout(f"Body not read within {FETCH_DEADLINE_SECONDS:g}s")
+            yield chunk
+    except (requests.RequestException, OSError) as e:
+        if time.monotonic() >= deadline:
+            raise FetchTimeout(f"Body not read within {FETCH_DEADLINE_SECONDS:g}s") from e
+        raise
+    finally:
+        watchdog.cancel()
@@ -0,0 +1,176 @@
+"""Per-feed fetch metrics with Prometheus text and JSON lines export."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+# Cumulative per-feed counters, exported as Prometheus counters
+COUNTERS = {
+    "fetches": "Feed fetch attempts",
+    "errors": "Feed fetches that failed (HTTP error, unparseable feed or exception)",
+    "not_modified": "Feed fetches answered with 304 Not Modified",
+    "retries": "Fetch attempts retried after a transient failure",
+    "circuit_skips": "Fetches skipped because the feed's circuit was open",
+    "fetch_seconds": "Time spent downloading the feed",
+    "parse_seconds": "Time spent parsing the feed",
+    "bytes": "Feed response bytes downloaded",
+    "entries_seen": "Entries found in the feed",
+    "entries_kept": "Entries kept after date filtering",
+    "cache_hits": "Reads served from the in-process feed cache",
+    "cache_misses": "Reads that had to load from the store or network",
+    "shared_adoptions": "Results taken from the shared feed cache instead of fetching",
+}
+
+# Values from the most recent fetch, exported as Prometheus gauges
+GAUGES = {
+    "last_fetch_seconds": "Download time of the last fetch",
+    "last_parse_seconds": "Parse time of the last fetch",
+    "last_bytes": "Response bytes of the last fetch",
+    "last_entries_kept": "Entries kept by the last fetch",
+    "last_fetch_timestamp": "Unix time of the last fetch",
+    "last_success_timestamp": "Unix time of the last fetch that returned entries",
+    "circuit_open": "1 while the feed's circuit breaker is open or half-open",
+    "poll_interval_seconds": "Seconds between polls of the feed, adapted to its publish cadence",
+}
+
+METRIC_PREFIX = "sports_feed_"
+
+
+def _label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class FeedMetrics:
+    """Thread-safe per-URL fetch statistics.
+
+    fetch_rss_feed records one sample per fetch and the feed refresher
+    records cache hits and misses. `rows()` backs the ops panel; the
+    export methods back monitoring.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._feeds = {}
+
+    def _feed(self, url: str, source: str = None) -> dict:
+        # Caller holds self._lock
+        feed = self._feeds.get(url)
+        if feed is None:
+            feed = {"url": url, "source": source, "last_status": None, "last_error": None,
+                    "last_error_timestamp": None}
+            feed.update({name: 0 for name in COUNTERS})
+            feed.update({name: None for name in GAUGES})
+            self._feeds[url] = feed
+        if source:
+            feed["source"] = source
+        return feed
+
+    def record_fetch(self, url: str, source: str, sample: dict):
+        """Add one fetch sample: status, bytes, fetch/parse seconds, retries, entries seen/kept, error.
+
+        A sample marked "skipped" (circuit open) only counts as a skip.
+        """
+        now = time.time()
+        with self._lock:
+            feed = self._feed(url, source)
+            feed["circuit_open"] = int(bool(sample.get("circuit_open")))
+            if sample.get("skipped"):
+                feed["circuit_skips"] += 1
+                return
+
+            feed["fetches"] += 1
+            feed["retries"] += sample.get("retries", 0)
+            feed["fetch_seconds"] += sample.get("fetch_seconds", 0.0)
+            feed["parse_seconds"] += sample.get("parse_seconds", 0.0)
+            feed["bytes"] += sample.get("bytes", 0)
+            feed["entries_seen"] += sample.get("entries_seen", 0)
+            feed["entries_kept"] += sample.get("entries_kept", 0)
+            if sample.get("status") == 304:
+                feed["not_modified"] += 1
+
+            feed["last_status"] = sample.get("status")
+            feed["last_fetch_seconds"] = sample.get("fetch_seconds", 0.0)
+            feed["last_parse_seconds"] = sample.get("parse_seconds", 0.0)
+            feed["last_bytes"] = sample.get("bytes", 0)
+            feed["last_entries_kept"] = sample.get("entries_kept", 0)
+            feed["last_fetch_timestamp"] = now
+
+            if sample.get("error"):
+                feed["errors"] += 1
+                feed["last_error"] = sample["error"]
+                feed["last_error_timestamp"] = now
+            elif sample.get("entries_kept") or sample.get("status") == 304:
+                feed["last_success_timestamp"] = now
+
+    def record_cache(self, url: str, hit: bool, source: str = None):
+        """Count one read of a feed as served from the in-process cache or not."""
+        with self._lock:
+            self._feed(url, source)["cache_hits" if hit else "cache_misses"] += 1
+
+    def record_shared(self, url: str, source: str = None):
+        """Count one feed result adopted from another process through the shared cache."""
+        with self._lock:
+            self._feed(url, source)["shared_adoptions"] += 1
+
+    def record_poll_interval(self, url: str, seconds: float, source: str = None):
+        """Set the feed's current adaptive poll interval."""
+        with self._lock:
+            self._feed(url, source)["poll_interval_seconds"] = seconds
+
+    def get(self, url: str) -> dict:
+        """A copy of one feed's metrics, or None if it was never recorded."""
+        with self._lock:
+            feed = self._feeds.get(url)
+            return dict(feed) if feed is not None else None
+
+    def rows(self) -> list:
+        """Copies of every feed's metrics, slowest last fetch first."""
+        with self._lock:
+            rows = [dict(feed) for feed in self._feeds.values()]
+        return sorted(rows, key=lambda row: row["last_fetch_seconds"] or 0.0, reverse=True)
+
+    def to_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        rows = self.rows()
+        lines = []
+        for kind, metrics in (("counter", COUNTERS), ("gauge", GAUGES)):
+            for name, help_text in metrics.items():
+                metric = METRIC_PREFIX + name + ("_total" if kind == "counter" else "")
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} {kind}")
+                for row in rows:
+                    if row[name] is None:
+                        continue
+                    labels = f'url="{_label(row["url"])}",source="{_label(row["source"] or "")}"'
+                    lines.append(f"{metric}{{{labels}}} {row[name]}")
+        return "\n".join(lines) + "\n"
+
+    def to_json_lines(self) -> str:
+        """One JSON object per feed, stamped with the export time."""
+        exported_at = time.time()
+        return "".join(json.dumps({"timestamp": exported_at, **row}) + "\n" for row in self.rows())
+
+    def export(self, path: str):
+        """Write metrics to `path`: Prometheus text for *.prom (replaced atomically), else append JSON lines."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        if not path.endswith(".prom"):
+            with open(path, "a") as handle:
+                handle.write(self.to_json_lines())
+            return
+
+        fd, temp_path = tempfile.mkstemp(prefix=".metrics-", dir=directory)
+        try:
+            with os.fdopen(fd, "w") as handle:
+                handle.write(self.to_prometheus())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+
+# Process-wide metrics; module state survives Streamlit reruns
+METRICS = FeedMetrics()
@@ -0,0 +1,91 @@
+"""Adaptive per-feed poll intervals from publish cadence and unchanged fetches.
+
+A feed that posts several times an hour should be polled every few
+minutes, one that posts monthly a few times a day. After every fetch the
+feed's interval is recomputed as
+
+    half the median gap between its recent posts
+    x (1 + 3 x the recent share of fetches that found nothing new)
+
+clamped to the feed's bounds. A 304, or a 200 with no new entries, counts
+as finding nothing new, so quiet feeds back off up to 4x beyond their
+cadence and busy ones tighten again as soon as posts resume.
+"""
+
+import os
+import threading
+
+# Bounds on any feed's poll interval (per-feed bounds can be set in the feed config)
+MIN_POLL_SECONDS = float(os.environ.get("FEED_MIN_POLL_SECONDS", "300"))
+MAX_POLL_SECONDS = float(os.environ.get("FEED_MAX_POLL_SECONDS", "21600"))
+
+# Recent posts whose gaps give a feed's cadence
+CADENCE_POSTS = 10
+
+# Weight of the latest fetch in the unchanged-fetch rate
+UNCHANGED_ALPHA = 0.3
+
+
+def publish_cadence(items: list) -> float:
+    """Median seconds between a feed's recent posts, or None with fewer than two dated posts."""
+    dates = sorted((item["pub_date"] for item in items[:CADENCE_POSTS] if item.get("pub_date")), reverse=True)
+    gaps = sorted((newer - older).total_seconds() for newer, older in zip(dates, dates[1:]))
+    if not gaps:
+        return None
+    return gaps[len(gaps) // 2]
+
+
+class AdaptivePolling:
+    """Thread-safe per-URL poll intervals, learned from each feed's fetches."""
+
+    def __init__(self, min_seconds: float = MIN_POLL_SECONDS, max_seconds: float = MAX_POLL_SECONDS):
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+        self._lock = threading.Lock()
+        self._feeds = {}
+        self._bounds = {}
+
+    def configure(self, bounds: dict):
+        """Set per-feed (min, max) seconds, replacing earlier ones; None keeps the global bound."""
+        with self._lock:
+            self._bounds = dict(bounds)
+            for url, feed in self._feeds.items():
+                feed["interval"] = self._interval(url, feed)
+
+    def _interval(self, url: str, feed: dict) -> float:
+        # Caller holds self._lock
+        low, high = self._bounds.get(url, (None, None))
+        low = self.min_seconds if low is None else low
+        high = max(low, self.max_seconds if high is None else high)
+        base = feed["cadence"] / 2 if feed["cadence"] else feed["default"]
+        return min(high, max(low, base * (1 + 3 * feed["unchanged"])))
+
+    def observe(self, url: str, items: list, previous: list, default: float) -> float:
+        """Record a successful fetch of `items` after `previous`; returns the feed's new interval.
+
+        `default` is the base interval until the feed has two dated posts.
+        """
+        known = {item.get("guid") or item.get("link") for item in previous}
+        unchanged = all((item.get("guid") or item.get("link")) in known for item in items)
+        cadence = publish_cadence(items)
+        with self._lock:
+            feed = self._feeds.setdefault(url, {"cadence": None, "unchanged": 0.0, "default": default})
+            feed["default"] = default
+            if cadence:
+                feed["cadence"] = cadence
+            if previous:
+                feed["unchanged"] += UNCHANGED_ALPHA * (float(unchanged) - feed["unchanged"])
+            feed["interval"] = self._interval(url, feed)
+            return feed["interval"]
+
+    def interval(self, url: str, default: float) -> float:
+        """Seconds between polls of a feed; `default` (within bounds) until it has been observed."""
+        with self._lock:
+            feed = self._feeds.get(url)
+            if feed is not None:
+                return feed["interval"]
+            return self._interval(url, {"cadence": None, "unchanged": 0.0, "default": default})
+
+
+# Process-wide poll intervals; module state survives Streamlit reruns
+POLLING = AdaptivePolling()
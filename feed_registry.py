@@ -0,0 +1,187 @@
+"""Feeds loaded from an external YAML or OPML file, reloaded while the app runs.
+
+FEED_CONFIG_PATH names the file; without it the built-in feeds in
+feed_config are used. YAML lists one entry per feed:
+
+    feeds:
+      - url: https://blogs.fangraphs.com/feed/
+        source: FanGraphs
+        sport: MLB
+        sections: [news, deep_dives]   # default [news]
+        min_interval: 120              # optional poll bounds in seconds
+        max_interval: 3600
+
+OPML nests feed outlines in one outline per sport, with the same options
+as attributes:
+
+    <outline text="MLB">
+      <outline type="rss" text="FanGraphs" xmlUrl="https://blogs.fangraphs.com/feed/"
+               sections="news,deep_dives" minInterval="120"/>
+    </outline>
+
+A loaded file replaces feed_config's feed tables and sets each feed's
+poll bounds (see feed_polling). A file that fails to load leaves the last
+good feeds in place.
+"""
+
+import os
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
+
+from feed_config import configure_feeds
+from feed_polling import POLLING
+
+DEFAULT_FEED_CONFIG_PATH = os.environ.get("FEED_CONFIG_PATH")
+
+NEWS_SECTION = "news"
+DEEP_DIVE_SECTION = "deep_dives"
+SECTIONS = (NEWS_SECTION, DEEP_DIVE_SECTION)
+
+
+def _seconds(value) -> float:
+    return None if value in (None, "") else float(value)
+
+
+def feed_entry(raw: dict, sport: str = None) -> dict:
+    """A validated feed entry: url, source, sport, sections and optional poll bounds."""
+    url = str(raw.get("url") or "").strip()
+    sport = raw.get("sport") or sport
+    if not url or not sport:
+        raise ValueError(f"Feed entry needs a url and a sport: {raw!r}")
+    sections = raw.get("sections") or [NEWS_SECTION]
+    if isinstance(sections, str):
+        sections = [section.strip() for section in sections.split(",") if section.strip()]
+    unknown = set(sections) - set(SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown sections {sorted(unknown)} for {url}")
+    return {
+        "url": url,
+        "source": str(raw.get("source") or url),
+        "sport": str(sport),
+        "sections": tuple(sections),
+        "min_interval": _seconds(raw.get("min_interval")),
+        "max_interval": _seconds(raw.get("max_interval")),
+    }
+
+
+def parse_yaml_config(text: str) -> list:
+    """Feed entries from a YAML document with a top-level `feeds` list."""
+    try:
+        import yaml
+    except ImportError:  # YAML configs need PyYAML; OPML works without it
+        raise ValueError("YAML feed configs need PyYAML (pip install pyyaml)")
+    document = yaml.safe_load(text) or {}
+    return [feed_entry(raw) for raw in document.get("feeds") or []]
+
+
+def parse_opml_config(data: bytes) -> list:
+    """Feed entries from OPML: feed outlines (with xmlUrl) nested in one outline per sport."""
+    root = ElementTree.fromstring(data)
+    body = root.find("body")
+    entries = []
+
+    def walk(outline, sport):
+        url = outline.get("xmlUrl")
+        if url:
+            entries.append(feed_entry({
+                "url": url,
+                "source": outline.get("title") or outline.get("text"),
+                "sport": outline.get("sport"),
+                "sections": outline.get("sections"),
+                "min_interval": outline.get("minInterval"),
+                "max_interval": outline.get("maxInterval"),
+            }, sport))
+            return
+        for child in outline.findall("outline"):
+            walk(child, outline.get("text") or outline.get("title") or sport)
+
+    for outline in (body if body is not None else root).findall("outline"):
+        walk(outline, None)
+    return entries
+
+
+def load_feed_config(path: str) -> list:
+    """Feed entries from a .yaml/.yml or .opml/.xml file."""
+    with open(path, "rb") as handle:
+        data = handle.read()
+    if path.lower().endswith((".opml", ".xml")):
+        entries = parse_opml_config(data)
+    else:
+        entries = parse_yaml_config(data.decode("utf-8"))
+    if not entries:
+        raise ValueError(f"No feeds in {path}")
+    return entries
+
+
+def feeds_by_section(entries: list) -> tuple:
+    """(news feeds, Deep Dives feeds) as sport -> [{"url", "source"}] dicts, in file order."""
+    sections = {section: {} for section in SECTIONS}
+    for entry in entries:
+        for section in entry["sections"]:
+            sections[section].setdefault(entry["sport"], []).append({"url": entry["url"], "source": entry["source"]})
+    return sections[NEWS_SECTION], sections[DEEP_DIVE_SECTION]
+
+
+class FeedRegistry:
+    """Keeps feed_config in step with the feed config file.
+
+    The file's mtime is checked at most every `check_interval` seconds.
+    Listeners are called as listener(news feeds, Deep Dives feeds) after
+    each reload; one that raises is reported in `error`.
+    """
+
+    def __init__(self, path: str = DEFAULT_FEED_CONFIG_PATH, check_interval: float = 5.0, listeners: list = None):
+        self.path = path
+        self.check_interval = check_interval
+        self.listeners = list(listeners or [])
+        # Why the last load failed, or None
+        self.error = None
+        self.version = 0
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._checked_at = float("-inf")
+
+    def reload_if_changed(self, force: bool = False) -> bool:
+        """Load the file if its mtime changed; returns True if new feeds were applied."""
+        if not self.path:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._checked_at < self.check_interval:
+                return False
+            self._checked_at = now
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except OSError as e:
+                self.error = str(e)
+                return False
+            if mtime == self._mtime and not force:
+                return False
+            self._mtime = mtime
+            try:
+                entries = load_feed_config(self.path)
+            except Exception as e:
+                # Parser messages run over several lines; the first says what went wrong
+                self.error = f"{type(e).__name__}: {(str(e).splitlines() or [''])[0]}"
+                return False
+
+            news_feeds, deep_dive_feeds = feeds_by_section(entries)
+            configure_feeds(news_feeds, deep_dive_feeds)
+            POLLING.configure({entry["url"]: (entry["min_interval"], entry["max_interval"]) for entry in entries
+                               if entry["min_interval"] is not None or entry["max_interval"] is not None})
+            self.error = None
+            self.version += 1
+
+        for listener in self.listeners:
+            try:
+                listener(news_feeds, deep_dive_feeds)
+            except Exception as e:
+                # The feeds were applied, but whatever the listener keeps is still on the old ones
+                name = getattr(listener, "__qualname__", repr(listener))
+                self.error = f"{name} failed: {type(e).__name__}: {(str(e).splitlines() or [''])[0]}"
+        return True
+
+
+# Process-wide registry; module state survives Streamlit reruns
+REGISTRY = FeedRegistry()
@@ -0,0 +1,149 @@
+"""Headless ingestion worker: polls every feed, stores new articles and writes a snapshot.
+
+Run one cycle with `python ingest.py --once`, or leave it running. Every
+--interval seconds it re-reads the feed config (--feeds) if it changed
+and fetches the feeds whose adaptive poll interval has passed (see
+feed_polling). Point the dashboard at the same snapshot with
+FEED_SNAPSHOT_PATH and it stops fetching feeds itself.
+"""
+
+import argparse
+import http.server
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from article_store import DEFAULT_DB_PATH, ArticleStore
+from feed_cache import DEFAULT_FEED_CACHE_URL, open_feed_cache
+from feed_config import NEWS_FEED_LIMIT, FeedTables, current_feeds
+from feed_fetcher import FETCH_MAX_WORKERS, FeedRefresher
+from feed_metrics import METRICS
+from feed_registry import DEFAULT_FEED_CONFIG_PATH, REGISTRY
+from snapshot import DEFAULT_SNAPSHOT_PATH, write_snapshot
+
+DEFAULT_INTERVAL_SECONDS = 60
+
+logger = logging.getLogger("ingest")
+
+
+def unique_feeds(tables: FeedTables = None) -> dict:
+    """{url: source} for every configured feed (or every feed in `tables`), each URL once."""
+    feeds = {}
+    for feed_info in (tables or current_feeds()).sources:
+        feeds.setdefault(feed_info["url"], feed_info["source"])
+    return feeds
+
+
+def run_cycle(refresher: FeedRefresher, snapshot_path: str, max_workers: int = FETCH_MAX_WORKERS) -> dict:
+    """Fetch the feeds that are due concurrently, then write the snapshot; returns {url: items}.
+
+    Feeds whose poll interval has not passed are served from the
+    refresher's cache. The snapshot is only rewritten if some feed was
+    fetched, so dashboards do not reload it for nothing.
+    """
+    tables = current_feeds()
+    feeds = unique_feeds(tables)
+    due = {url for url in feeds if refresher.due(url)}
+    if not due and os.path.exists(snapshot_path):
+        return {}
+    workers = max(1, min(max_workers, len(due)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest") as pool:
+        futures = {
+            url: pool.submit(refresher.refresh if url in due else refresher.get,
+                             url, source, tables.windows.get(url, NEWS_FEED_LIMIT))
+            for url, source in feeds.items()
+        }
+        results = {}
+        for url, future in futures.items():
+            try:
+                results[url] = future.result()
+            except Exception:
+                logger.exception("Fetching %s failed", url)
+                results[url] = []
+
+    rows = write_snapshot(snapshot_path, results)
+    logger.info("Fetched %d feeds; wrote %d articles from %d feeds to %s", len(due), rows, len(results), snapshot_path)
+    return results
+
+
+class MetricsHandler(http.server.BaseHTTPRequestHandler):
+    """Serves METRICS at /metrics (Prometheus text) and /metrics.jsonl."""
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            body, content_type = METRICS.to_prometheus(), "text/plain; version=0.0.4"
+        elif self.path == "/metrics.jsonl":
+            body, content_type = METRICS.to_json_lines(), "application/x-ndjson"
+        else:
+            self.send_error(404)
+            return
+        payload = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_metrics(port: int) -> http.server.ThreadingHTTPServer:
+    """Start the metrics endpoint on a daemon thread."""
+    server = http.server.ThreadingHTTPServer(("", port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    return server
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--once", action="store_true", help="run a single cycle and exit")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL_SECONDS,
+                        help=f"seconds between checks for feeds due a poll (default {DEFAULT_INTERVAL_SECONDS})")
+    parser.add_argument("--feeds", default=DEFAULT_FEED_CONFIG_PATH,
+                        help="YAML or OPML feed config, reloaded when it changes (default FEED_CONFIG_PATH, "
+                             "else the built-in feeds)")
+    parser.add_argument("--snapshot", default=DEFAULT_SNAPSHOT_PATH,
+                        help=f"snapshot file to write (default {DEFAULT_SNAPSHOT_PATH})")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help=f"article database (default {DEFAULT_DB_PATH})")
+    parser.add_argument("--cache", default=DEFAULT_FEED_CACHE_URL,
+                        help="feed cache shared with other workers and dashboards "
+                             "(sqlite:///path or redis://host:port/db; default FEED_CACHE_URL)")
+    parser.add_argument("--workers", type=int, default=FETCH_MAX_WORKERS,
+                        help=f"feeds fetched at the same time (default {FETCH_MAX_WORKERS})")
+    parser.add_argument("--metrics", help="write per-feed metrics here after each cycle "
+                                          "(*.prom for Prometheus text, otherwise appended JSON lines)")
+    parser.add_argument("--metrics-port", type=int, help="serve Prometheus metrics on this port at /metrics")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    if args.metrics_port:
+        serve_metrics(args.metrics_port)
+    cache = open_feed_cache(args.cache) if args.cache else None
+    refresher = FeedRefresher(store=ArticleStore(args.db), max_workers=1, cache=cache)
+
+    REGISTRY.path = args.feeds
+    while True:
+        started = time.monotonic()
+        try:
+            REGISTRY.reload_if_changed()
+            run_cycle(refresher, args.snapshot, args.workers)
+        except Exception:
+            logger.exception("Ingestion cycle failed")
+        if args.metrics:
+            try:
+                METRICS.export(args.metrics)
+            except OSError:
+                logger.exception("Writing metrics to %s failed", args.metrics)
+        if args.once:
+            break
+        time.sleep(max(0.0, args.interval - (time.monotonic() - started)))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,178 @@
+"""Single-pass keyword matching for article categories and focus areas."""
+
+import re
+from functools import lru_cache
+
+# Keyword tables. Keywords match whole words. Acronyms and keywords of three
+# letters or fewer may add only a plural "s", so "cap" does not hit "capture"
+# and "AI" does not hit "said". Longer keywords may add one of
+# INFLECTION_SUFFIXES, so "recruit" also hits "recruits" and "recruiting" and
+# "free agent" hits "free agents", but "stat" does not hit "State" and
+# "commit" does not hit "Committee". Other forms are listed explicitly.
+ARTICLE_CATEGORIES = {
+    "Recruiting Analytics": ["recruit", "recruiting", "draft", "prospect", "transfer", "transferred", "portal",
+                             "signing", "commit", "committed", "commitment"],
+    "Performance Metrics": ["metric", "stat", "statistic", "statistics", "EPA", "CPOE", "WAR", "efficiency",
+                            "rating", "advanced", "expected"],
+    "Coaching Analytics": ["coach", "strategy", "scheme", "decision", "fourth down", "play-call", "game plan"],
+    "Roster Optimization": ["roster", "lineup", "rotation", "depth", "minutes", "snap", "usage"],
+    "Salary Cap/NIL": ["salary", "salaries", "cap", "contract", "NIL", "money", "deal", "extension"],
+}
+
+DEFAULT_CATEGORY = "Performance Metrics"
+
+# Analytics focus area categories
+FOCUS_AREAS = {
+    "All Topics": [],
+    "Recruiting & Roster": ["recruit", "recruiting", "roster", "draft", "transfer", "transferred", "portal",
+                            "prospect", "signing"],
+    "Performance Metrics": ["metric", "stat", "statistic", "statistics", "EPA", "CPOE", "WAR", "xG", "expected",
+                            "efficiency", "rating", "advanced"],
+    "Coaching Strategy": ["coach", "strategy", "scheme", "play-call", "decision", "fourth down", "clock", "timeout"],
+    "Salary Cap/NIL": ["salary", "salaries", "cap", "contract", "NIL", "money", "deal", "extension", "free agent"],
+    "Technology & Tools": ["tracking", "wearable", "AI", "machine learning", "model", "algorithm", "technology", "data"],
+}
+
+# Endings a keyword longer than three letters may take and still match
+INFLECTION_SUFFIXES = frozenset({"s", "es", "ed", "ing", "er", "ers"})
+
+# Words that end like an inflection of a keyword but are different words
+NOT_INFLECTIONS = frozenset({"dealer", "dealers", "states", "stated", "stater", "staters"})
+
+
+def _trie_pattern(keywords: list) -> str:
+    """Regex alternation for lowercase keywords, factored into a character trie.
+
+    Python's re tries alternatives one at a time, so a flat alternation of
+    every keyword is slow. Sharing prefixes lets most positions fail after
+    one character, and longer continuations are tried before shorter ones.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [
+            (r"\s+" if ch == " " else re.escape(ch)) + build(child)
+            for ch, child in sorted(node.items()) if ch
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def _normalize_keyword(keyword: str) -> str:
+    return " ".join(keyword.lower().split())
+
+
+class KeywordMatcher:
+    """Finds every keyword from several labelled keyword tables in one regex pass.
+
+    `tables` maps a table name to {label: [keywords]}. All keywords are
+    compiled into one case-insensitive trie regex that captures the keyword
+    and the rest of its word; a match counts only if the rest of the word
+    is empty or an allowed inflection, and is then mapped back to the
+    (table, label) pairs that list that keyword.
+    """
+
+    def __init__(self, tables: dict):
+        self.tables = tables
+        self._owners = {}
+        self._whole_word = set()
+        for table, labels in tables.items():
+            for label, keywords in labels.items():
+                for keyword in keywords:
+                    key = _normalize_keyword(keyword)
+                    self._owners.setdefault(key, set()).add((table, label))
+                    if len(key) <= 3 or any(ch.isupper() for ch in keyword):
+                        self._whole_word.add(key)
+
+        if self._owners:
+            self._pattern = re.compile(rf"(?<!\w)({_trie_pattern(self._owners)})(\w*)", re.IGNORECASE)
+        else:
+            self._pattern = re.compile(r"(?!)")
+
+    def scan(self, text: str) -> dict:
+        """Return {table: {label: number of distinct keywords found}} for the text."""
+        hits = set()
+        for keyword, rest in self._pattern.findall(text):
+            key = _normalize_keyword(keyword)
+            if rest:
+                rest = rest.lower()
+                if key in self._whole_word:
+                    if rest != "s":
+                        continue
+                elif rest not in INFLECTION_SUFFIXES or key + rest in NOT_INFLECTIONS:
+                    continue
+            hits.add(key)
+
+        scores = {table: {} for table in self.tables}
+        for key in hits:
+            for table, label in self._owners[key]:
+                scores[table][label] = scores[table].get(label, 0) + 1
+        return scores
+
+
+MATCHER = KeywordMatcher({"category": ARTICLE_CATEGORIES, "focus": FOCUS_AREAS})
+
+
+def article_text(title: str, summary: str) -> str:
+    """The text keywords are matched against."""
+    return str(title) + " " + str(summary)
+
+
+@lru_cache(maxsize=4096)
+def match_article(title: str, summary: str) -> dict:
+    """Category and focus-area keyword scores for an article, from one scan."""
+    return MATCHER.scan(article_text(title, summary))
+
+
+def best_category(category_scores: dict) -> str:
+    """Highest-scoring category, ties going to the earlier table entry."""
+    best = DEFAULT_CATEGORY
+    best_score = 0
+    for category in ARTICLE_CATEGORIES:
+        score = category_scores.get(category, 0)
+        if score > best_score:
+            best_score = score
+            best = category
+    return best
+
+
+def categorize_article(title: str, summary: str) -> str:
+    """Categorize an article based on keywords."""
+    try:
+        return best_category(match_article(title, summary)["category"])
+    except Exception:
+        return DEFAULT_CATEGORY
+
+
+def matching_focus_areas(title: str, summary: str) -> list:
+    """Focus areas whose keywords appear in the article, in FOCUS_AREAS order."""
+    hits = match_article(title, summary)["focus"]
+    return [area for area in FOCUS_AREAS if hits.get(area)]
+
+
+def filter_by_focus_area(items: list, focus_area: str) -> list:
+    """Filter news items by analytics focus area."""
+    try:
+        if focus_area == "All Topics" or not FOCUS_AREAS.get(focus_area):
+            return items
+
+        filtered = []
+        for item in items:
+            # Enriched articles carry their focus areas; others are matched here
+            areas = item.get("focus_areas")
+            if areas is None:
+                areas = matching_focus_areas(item.get("title", ""), item.get("summary", ""))
+            if focus_area in areas:
+                filtered.append(item)
+        return filtered if filtered else items[:5]
+    except Exception:
+        return items
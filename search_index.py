@@ -0,0 +1,130 @@
+"""Incrementally maintained inverted index with BM25 ranking over stored articles."""
+
+import heapq
+import math
+import threading
+from datetime import datetime
+
+from enrichment import normalize_text
+from keyword_matching import article_text
+
+# BM25 parameters (Robertson/Sparck Jones defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Too common to help ranking; skipping them keeps posting lists short
+STOPWORDS = frozenset("""
+a an and are as at be but by for from has have he her his how in into is it its of on or our
+she that the their them they this to was we were what when which who why will with you your
+""".split())
+
+
+def tokenize(text: str) -> list:
+    """Normalized search terms for a piece of text."""
+    return [term for term in normalize_text(text).split() if term not in STOPWORDS]
+
+
+class SearchIndex:
+    """Thread-safe BM25 index over article titles and summaries.
+
+    Articles are keyed by guid. Re-adding an unchanged article is a dict
+    lookup; an edited one has its old postings replaced. Sport, source and
+    pub_date are kept per document so filters are applied while scoring.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings = {}
+        self._docs = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, item: dict) -> bool:
+        """Index or re-index one article; returns False if it was already current."""
+        guid = str(item.get("guid") or item.get("link", ""))
+        if not guid:
+            return False
+        text = item.get("search_text") or normalize_text(article_text(item.get("title", ""), item.get("summary", "")))
+
+        with self._lock:
+            existing = self._docs.get(guid)
+            if existing is not None and existing["text"] == text:
+                existing["item"] = item
+                return False
+            if existing is not None:
+                self._remove(guid)
+
+            terms = [term for term in text.split() if term not in STOPWORDS]
+            frequencies = {}
+            for term in terms:
+                frequencies[term] = frequencies.get(term, 0) + 1
+            for term, count in frequencies.items():
+                self._postings.setdefault(term, {})[guid] = count
+
+            self._docs[guid] = {"text": text, "length": len(terms), "terms": tuple(frequencies), "item": item}
+            self._total_length += len(terms)
+            return True
+
+    def add_many(self, items: list) -> int:
+        """Index several articles and return how many were new or changed."""
+        return sum(1 for item in items if self.add(item))
+
+    def search(self, query: str, limit: int = 20, sport: str = None, source: str = None,
+               since: datetime = None, until: datetime = None) -> list:
+        """Top `limit` articles for the query as (score, item) pairs, best first."""
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+
+        with self._lock:
+            doc_count = len(self._docs)
+            if not doc_count:
+                return []
+            average_length = self._total_length / doc_count or 1.0
+
+            scores = {}
+            rejected = set()
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for guid, frequency in postings.items():
+                    if guid in rejected:
+                        continue
+                    if guid not in scores:
+                        if not self._matches(self._docs[guid]["item"], sport, source, since, until):
+                            rejected.add(guid)
+                            continue
+                        scores[guid] = 0.0
+                    length_norm = 1 - BM25_B + BM25_B * self._docs[guid]["length"] / average_length
+                    scores[guid] += idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+
+            best = heapq.nlargest(limit, scores.items(), key=lambda pair: pair[1])
+            return [(score, self._docs[guid]["item"]) for guid, score in best]
+
+    @staticmethod
+    def _matches(item: dict, sport: str, source: str, since: datetime, until: datetime) -> bool:
+        if sport and item.get("sport") != sport:
+            return False
+        if source and item.get("source") != source:
+            return False
+        pub_date = item.get("pub_date")
+        if since and (not pub_date or pub_date < since):
+            return False
+        if until and (not pub_date or pub_date >= until):
+            return False
+        return True
+
+    def _remove(self, guid: str):
+        # Caller holds self._lock
+        doc = self._docs.pop(guid)
+        self._total_length -= doc["length"]
+        for term in doc["terms"]:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(guid, None)
+                if not postings:
+                    del self._postings[term]
@@ -0,0 +1,273 @@
+"""Compact columnar snapshot of ingested articles, shared between processes.
+
+The headless ingestion worker (ingest.py) writes a snapshot after every
+poll cycle. Dashboard processes memory-map it and reload when the file's
+mtime changes. Layout:
+
+    MAGIC | uint32 header length | JSON header | padding | column blocks
+
+Rows are grouped by feed URL, newest first within a feed, and the header
+records each feed's row range. Integer columns (pub_date as epoch
+seconds, dictionary codes, focus-area bitmasks) are little-endian arrays.
+String columns are a uint32 offset array plus one UTF-8 blob. Rows are
+decoded lazily, only when a feed is read.
+"""
+
+import calendar
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from datetime import datetime, timedelta
+
+from article import Article
+from date_parsing import utc_now
+from keyword_matching import FOCUS_AREAS
+
+DEFAULT_SNAPSHOT_PATH = os.environ.get("FEED_SNAPSHOT_PATH", os.path.join("data", "snapshot.bin"))
+
+MAGIC = b"SADSNAP1"
+STRING_COLUMNS = ("guid", "link", "title", "summary", "published", "search_text")
+CODED_COLUMNS = ("source", "sport", "category")
+FOCUS_AREA_NAMES = list(FOCUS_AREAS)
+
+
+def _epoch(value: datetime) -> int:
+    return calendar.timegm(value.timetuple())
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _cast(buffer: memoryview, typecode: str) -> memoryview:
+    view = buffer.cast(typecode)
+    if sys.byteorder != "little":
+        swapped = array(typecode, view)
+        swapped.byteswap()
+        return memoryview(swapped)
+    return view
+
+
+def write_snapshot(path: str, feed_items: dict) -> int:
+    """Atomically write {feed_url: newest-first items} to `path`; returns the row count."""
+    columns = {name: [] for name in STRING_COLUMNS}
+    pub_dates = array("q")
+    codes = {name: array("I") for name in CODED_COLUMNS}
+    dictionaries = {name: [] for name in CODED_COLUMNS}
+    lookups = {name: {} for name in CODED_COLUMNS}
+    focus_masks = array("I")
+    feeds = {}
+
+    for url, items in feed_items.items():
+        start = len(pub_dates)
+        for item in items:
+            if not item.get("pub_date"):
+                continue
+            for name in STRING_COLUMNS:
+                columns[name].append(str(item.get(name) or ""))
+            pub_dates.append(_epoch(item["pub_date"]))
+            for name in CODED_COLUMNS:
+                value = str(item.get(name) or "")
+                if value not in lookups[name]:
+                    lookups[name][value] = len(dictionaries[name])
+                    dictionaries[name].append(value)
+                codes[name].append(lookups[name][value])
+            mask = 0
+            for area in item.get("focus_areas") or []:
+                if area in FOCUS_AREA_NAMES:
+                    mask |= 1 << FOCUS_AREA_NAMES.index(area)
+            focus_masks.append(mask)
+        feeds[url] = [start, len(pub_dates)]
+
+    blocks = []
+    layout = {}
+
+    def add_block(name: str, data: bytes):
+        offset = sum(len(block) for block in blocks)
+        blocks.append(data + b"\0" * (-len(data) % 8))
+        layout[name] = [offset, len(data)]
+
+    add_block("pub_date", _little_endian(pub_dates))
+    add_block("focus_mask", _little_endian(focus_masks))
+    for name in CODED_COLUMNS:
+        add_block(name, _little_endian(codes[name]))
+    for name in STRING_COLUMNS:
+        encoded = [value.encode("utf-8") for value in columns[name]]
+        offsets = array("I", [0])
+        for value in encoded:
+            offsets.append(offsets[-1] + len(value))
+        add_block(f"{name}.offsets", _little_endian(offsets))
+        add_block(f"{name}.data", b"".join(encoded))
+
+    header = json.dumps({
+        "version": 1,
+        "created": utc_now().isoformat(timespec="seconds"),
+        "rows": len(pub_dates),
+        "feeds": feeds,
+        "dictionaries": dictionaries,
+        "focus_areas": FOCUS_AREA_NAMES,
+        "columns": layout,
+    }).encode("utf-8")
+    prefix = MAGIC + struct.pack("<I", len(header)) + header
+    prefix += b"\0" * (-len(prefix) % 8)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=".snapshot-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(prefix)
+            for block in blocks:
+                handle.write(block)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return len(pub_dates)
+
+
+class Snapshot:
+    """One memory-mapped snapshot file; rows are decoded on first access."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._map)
+        if bytes(buffer[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a feed snapshot")
+        (header_length,) = struct.unpack_from("<I", buffer, len(MAGIC))
+        header_start = len(MAGIC) + 4
+        header = json.loads(bytes(buffer[header_start:header_start + header_length]))
+        data_start = header_start + header_length
+        data_start += -data_start % 8
+
+        self.created = header["created"]
+        self.rows = header["rows"]
+        self.feeds = {url: tuple(bounds) for url, bounds in header["feeds"].items()}
+        self._dictionaries = header["dictionaries"]
+        self._focus_areas = header["focus_areas"]
+
+        def block(name: str) -> memoryview:
+            offset, length = header["columns"][name]
+            return buffer[data_start + offset:data_start + offset + length]
+
+        self._pub_dates = _cast(block("pub_date"), "q")
+        self._focus_masks = _cast(block("focus_mask"), "I")
+        self._codes = {name: _cast(block(name), "I") for name in CODED_COLUMNS}
+        self._strings = {
+            name: (_cast(block(f"{name}.offsets"), "I"), block(f"{name}.data"))
+            for name in STRING_COLUMNS
+        }
+        self._decoded = {}
+        self._lock = threading.Lock()
+
+    def feed_articles(self, url: str, limit: int = None, since: datetime = None) -> list:
+        """Newest-first items for one feed, optionally bounded by count and age."""
+        start, end = self.feeds.get(url, (0, 0))
+        if limit is not None:
+            end = min(end, start + limit)
+        floor = _epoch(since) if since else None
+        items = []
+        for row in range(start, end):
+            if floor is not None and self._pub_dates[row] < floor:
+                break
+            items.append(self._row(row, url))
+        return items
+
+    def _row(self, row: int, url: str) -> Article:
+        with self._lock:
+            item = self._decoded.get(row)
+            if item is not None:
+                return item
+
+            fields = {}
+            for name, (offsets, data) in self._strings.items():
+                fields[name] = bytes(data[offsets[row]:offsets[row + 1]]).decode("utf-8")
+            for name, codes in self._codes.items():
+                fields[name] = self._dictionaries[name][codes[row]] or None
+            mask = self._focus_masks[row]
+            fields["focus_areas"] = [area for bit, area in enumerate(self._focus_areas) if mask >> bit & 1]
+            fields["pub_date"] = datetime(1970, 1, 1) + timedelta(seconds=self._pub_dates[row])
+            item = Article(feed_url=url, **fields)
+            self._decoded[row] = item
+            return item
+
+
+class SnapshotReader:
+    """Serves feed items from the newest snapshot file, with the FeedRefresher interface.
+
+    The file's mtime is checked at most every `check_interval` seconds and
+    the snapshot is re-mapped when it changes. Listeners are called as
+    listener(url, items) for every feed after each (re)load.
+    """
+
+    def __init__(self, path: str = DEFAULT_SNAPSHOT_PATH, max_age_days: int = None,
+                 check_interval: float = 1.0, listeners: list = None):
+        self.path = path
+        self.max_age_days = max_age_days
+        self.check_interval = check_interval
+        self.listeners = list(listeners or [])
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._mtime = None
+        self._checked_at = float("-inf")
+
+    @property
+    def snapshot(self) -> Snapshot:
+        """The current snapshot, reloaded first if the file changed; None if missing."""
+        self.reload_if_changed()
+        return self._snapshot
+
+    def reload_if_changed(self, force: bool = False) -> bool:
+        """Re-map the file if its mtime changed; returns True if a new snapshot was loaded."""
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._checked_at < self.check_interval:
+                return False
+            self._checked_at = now
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except OSError:
+                return False
+            if mtime == self._mtime and not force:
+                return False
+            try:
+                snapshot = Snapshot(self.path)
+            except (OSError, ValueError):
+                return False
+            self._snapshot = snapshot
+            self._mtime = mtime
+
+        for url in snapshot.feeds:
+            items = snapshot.feed_articles(url)
+            for listener in self.listeners:
+                try:
+                    listener(url, items)
+                except Exception:
+                    pass
+        return True
+
+    def get(self, url: str, source: str = None, limit: int = 15) -> list:
+        """Newest-first items for a feed from the current snapshot."""
+        snapshot = self.snapshot
+        if snapshot is None:
+            return []
+        since = utc_now() - timedelta(days=self.max_age_days) if self.max_age_days else None
+        return snapshot.feed_articles(url, limit, since=since)
+
+    def refresh(self, url: str, source: str = None, limit: int = 15) -> list:
+        """Check for a newer snapshot right away, then serve the feed from it."""
+        self.reload_if_changed(force=True)
+        return self.get(url, source, limit)
@@ -0,0 +1,93 @@
+"""Phase timings of dashboard script runs, for tracking time to first paint.
+
+app.py marks phases as its script runs: its imports done, the page set
+up, the first news card sent, each section drawn and the end of the
+script. The first run in a process is the cold start: it includes
+importing the app's modules and seeding the process-wide caches, which
+later runs reuse. The ops panel shows the cold run next to the median of
+recent warm runs; with STARTUP_PROFILE_PATH set, every run's marks are
+also appended there as JSON lines. benchmarks/bench_startup.py adds
+per-module import times.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# When set, each run's marks are appended here as JSON lines
+STARTUP_PROFILE_PATH = os.environ.get("STARTUP_PROFILE_PATH")
+
+# Warm runs kept for the medians
+RECENT_RUNS = 50
+
+
+class StartupProfile:
+    """Thread-safe phase marks of script runs.
+
+    Each session runs its script on its own thread, so the run being
+    timed is per thread. Marks made outside a run, e.g. by a fragment
+    rerunning alone, are ignored.
+    """
+
+    def __init__(self, recent_runs: int = RECENT_RUNS, path: str = STARTUP_PROFILE_PATH):
+        self.path = path
+        # Marks (ms) of the first run in the process, or None
+        self.cold = None
+        self.runs = 0
+        self._recent = deque(maxlen=recent_runs)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def begin(self, started: float = None):
+        """Start timing a script run on this thread (`started` is a time.perf_counter() value)."""
+        self._local.run = {"started": time.perf_counter() if started is None else started, "marks": {}}
+
+    def mark(self, name: str):
+        """Record `name` at the time since the run began; later marks of the same name are ignored."""
+        run = getattr(self._local, "run", None)
+        if run is not None and name not in run["marks"]:
+            run["marks"][name] = time.perf_counter() - run["started"]
+
+    def end(self) -> dict:
+        """Finish this thread's run and return its marks in ms, or None if no run was begun."""
+        self.mark("done")
+        run, self._local.run = getattr(self._local, "run", None), None
+        if run is None:
+            return None
+        marks = {name: round(seconds * 1000, 2) for name, seconds in run["marks"].items()}
+        with self._lock:
+            cold = self.cold is None
+            if cold:
+                self.cold = marks
+            else:
+                self._recent.append(marks)
+            self.runs += 1
+        if self.path:
+            try:
+                with open(self.path, "a") as handle:
+                    handle.write(json.dumps({"ts": time.time(), "cold": cold, "marks": marks}) + "\n")
+            except OSError:
+                pass
+        return marks
+
+    def warm(self) -> dict:
+        """Median ms of each mark over the recent warm runs."""
+        with self._lock:
+            runs = list(self._recent)
+        samples = {}
+        for marks in runs:
+            for name, ms in marks.items():
+                samples.setdefault(name, []).append(ms)
+        return {name: sorted(values)[len(values) // 2] for name, values in samples.items()}
+
+    def report(self) -> list:
+        """[{"phase", "cold_ms", "warm_ms"}] in the order the cold run reached each phase."""
+        cold, warm = self.cold or {}, self.warm()
+        phases = list(cold) + [name for name in warm if name not in cold]
+        return [{"phase": name, "cold_ms": cold.get(name), "warm_ms": warm.get(name)} for name in phases]
+
+
+# Process-wide profile; module state survives Streamlit reruns
+PROFILE = StartupProfile()
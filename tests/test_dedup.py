@@ -0,0 +1,39 @@
+from dedup import dedupe_near_duplicates, normalize_title
+
+SUMMARY = "Our weekly look at where every team stands, with notes on injuries, schedules and what comes next."
+
+
+def test_distinct_stories_with_similar_titles_are_kept():
+    stories = [
+        ("NFL Power Rankings - NFC East", "Dallas and Philadelphia trade places after a wild week in the division."),
+        ("NFL Power Rankings - AFC West", "Kansas City stays on top while Denver climbs behind its rookie passer."),
+        ("Mailbag | Part 1", "Your questions on bullpen usage, September call-ups and the wild card race."),
+        ("Mailbag | Part 2", "More questions, this time on free agency, arbitration and next year's payroll."),
+        ("Top 100 Prospects - Catchers", "Framing grades and arm strength for the best young backstops in the minors."),
+        ("Top 100 Prospects - Shortstops", "Range, hands and bat speed for the best young shortstops in the minors."),
+    ]
+    items = [{"title": title, "summary": summary, "source": "FanGraphs"} for title, summary in stories]
+    assert dedupe_near_duplicates(items) == items
+
+
+def test_source_suffix_is_stripped_and_copies_merge():
+    assert normalize_title("Ohtani signs record deal | Yahoo Sports", "Yahoo Sports") == "ohtani signs record deal"
+    assert normalize_title("Ohtani signs record deal - FanGraphs", sources=frozenset({"fangraphs"})) == \
+        "ohtani signs record deal"
+    assert normalize_title("NFL Power Rankings - NFC East", "FanGraphs") == "nfl power rankings nfc east"
+
+    items = [
+        {"title": "Ohtani signs record deal - FanGraphs", "summary": SUMMARY, "source": "FanGraphs"},
+        {"title": "Ohtani signs record deal", "summary": SUMMARY, "source": "Baseball Prospectus"},
+    ]
+    assert dedupe_near_duplicates(items) == items[:1]
+
+
+def test_identical_titles_merge_whatever_their_summaries():
+    items = [
+        {"title": "Ohtani signs record deal", "summary": SUMMARY, "source": "FanGraphs"},
+        {"title": "Ohtani signs record deal", "summary": "", "source": "Baseball Prospectus"},
+        {"title": "Ohtani Signs Record Deal", "summary": "Ten years, and the richest contract in the sport.",
+         "source": "MLB Tech Blog"},
+    ]
+    assert dedupe_near_duplicates(items) == items[:1]
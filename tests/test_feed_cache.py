@@ -0,0 +1,59 @@
+import time
+from datetime import datetime
+
+import feed_cache
+import feed_fetcher
+from article import Article
+from feed_cache import SQLiteFeedCache
+from feed_fetcher import FeedRefresher
+
+URL = "https://example.com/feed/"
+
+
+def test_only_one_replica_holds_the_lease(tmp_path):
+    path = str(tmp_path / "feed_cache.db")
+    first, second = SQLiteFeedCache(path), SQLiteFeedCache(path)
+    assert first.acquire(URL, "replica-1")
+    assert not second.acquire(URL, "replica-2")
+    # Held means held, even for the holder
+    assert not first.acquire(URL, "replica-1")
+    # Only the holder can give it up
+    second.release(URL, "replica-2")
+    assert not second.acquire(URL, "replica-2")
+    first.release(URL, "replica-1")
+    assert second.acquire(URL, "replica-2")
+    assert first.acquire("https://example.org/other", "replica-1")
+
+
+def test_lease_expires_after_its_ttl(tmp_path, monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(feed_cache.time, "time", lambda: now[0])
+    cache = SQLiteFeedCache(str(tmp_path / "feed_cache.db"))
+    assert cache.acquire(URL, "replica-1", seconds=30)
+    now[0] += 29
+    assert not cache.acquire(URL, "replica-2", seconds=30)
+    now[0] += 1
+    assert cache.acquire(URL, "replica-2", seconds=30)
+    assert not cache.acquire(URL, "replica-1", seconds=30)
+
+
+def test_page_is_served_the_shared_result_while_another_replica_holds_the_lease(tmp_path, monkeypatch):
+    fetched = []
+    monkeypatch.setattr(feed_fetcher, "fetch_rss_feed", lambda url, source, limit: fetched.append(url) or [])
+    cache = SQLiteFeedCache(str(tmp_path / "feed_cache.db"))
+    items = [Article(guid="1", title="Shared story", link="https://example.com/1", published="",
+                     pub_date=datetime(2026, 1, 15), source="Example")]
+    cache.put(URL, items, 15)
+    assert cache.acquire(URL, "other-replica")
+
+    refresher = FeedRefresher(cache=cache)
+    started = time.monotonic()
+    served = refresher.refresh(URL, "Example")
+    assert time.monotonic() - started < 1
+    assert [item["title"] for item in served] == ["Shared story"]
+    assert fetched == []
+
+    # The background refresher takes over once the other replica lets go
+    cache.release(URL, "other-replica")
+    refresher._pool.shutdown(wait=True)
+    assert fetched == [URL]
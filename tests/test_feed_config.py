@@ -0,0 +1,17 @@
+from feed_config import ANALYTICS_FEEDS, DEEP_DIVE_FEEDS, configure_feeds, current_feeds
+
+
+def test_reload_publishes_new_tables_without_changing_old_ones():
+    before = current_feeds()
+    url = "https://example.com/feed/"
+    try:
+        configure_feeds({"NHL": [{"url": url, "source": "Example"}]}, {})
+        after = current_feeds()
+        assert after.sports == {url: "NHL"}
+        assert dict(after.windows) == {url: 15}
+        # A reader holding the old tables still sees the old configuration
+        assert url not in before.sports
+        assert list(before.news) == list(ANALYTICS_FEEDS)
+        assert all(before.sports[feed_info["url"]] for feed_info in before.sources)
+    finally:
+        configure_feeds(ANALYTICS_FEEDS, DEEP_DIVE_FEEDS)
@@ -0,0 +1,115 @@
+import pytest
+import requests
+
+import feed_http
+from feed_http import CircuitBreaker, FetchTimeout, get_with_retries
+
+URL = "https://example.com/feed/"
+
+
+class FakeClock:
+    """Manually advanced time; sleeping advances it too."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_circuit_opens_after_consecutive_failures():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=10, clock=clock)
+    for _ in range(2):
+        breaker.record_failure(URL)
+    assert breaker.allow(URL) and breaker.state(URL) == "closed"
+
+    breaker.record_failure(URL)
+    assert breaker.state(URL) == "open"
+    assert not breaker.allow(URL)
+    assert breaker.retry_in(URL) == 10
+    assert breaker.state("https://example.org/other") == "closed"
+
+
+def test_half_open_lets_one_trial_through_and_success_resets():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=10, clock=clock)
+    breaker.record_failure(URL)
+    clock.sleep(10)
+    assert breaker.state(URL) == "half-open"
+    assert breaker.allow(URL)
+    # The trial is in flight, so no other caller gets through
+    assert not breaker.allow(URL)
+
+    breaker.record_success(URL)
+    assert breaker.state(URL) == "closed" and breaker.retry_in(URL) == 0
+    breaker.record_failure(URL)
+    assert breaker.retry_in(URL) == 10
+
+
+def test_failed_trial_doubles_the_cooldown_up_to_the_cap():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=10, max_cooldown=30, clock=clock)
+    breaker.record_failure(URL)
+    for expected in (20, 30, 30):
+        clock.sleep(breaker.retry_in(URL))
+        assert breaker.allow(URL)
+        breaker.record_failure(URL)
+        assert breaker.state(URL) == "open"
+        assert breaker.retry_in(URL) == expected
+
+
+def fake_get(monkeypatch, outcomes: list, clock: FakeClock = None, seconds_per_call: float = 0):
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(kwargs["timeout"])
+        if clock is not None:
+            clock.sleep(seconds_per_call)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(feed_http.requests, "get", get)
+    monkeypatch.setattr(feed_http, "backoff_delay", lambda attempt: 1.0)
+    return calls
+
+
+def test_transient_failures_are_retried(monkeypatch):
+    clock = FakeClock()
+    unavailable, ok = FakeResponse(503), FakeResponse(200)
+    calls = fake_get(monkeypatch, [requests.ConnectionError(), unavailable, ok])
+    sample = {}
+    assert get_with_retries(URL, {}, clock() + 15, sample, clock=clock, sleep=clock.sleep) is ok
+    assert len(calls) == 3 and sample["retries"] == 2
+    assert unavailable.closed and clock() == 1002.0
+
+
+def test_last_retryable_response_is_returned(monkeypatch):
+    clock = FakeClock()
+    responses = [FakeResponse(503) for _ in range(feed_http.MAX_RETRIES + 1)]
+    fake_get(monkeypatch, list(responses))
+    assert get_with_retries(URL, {}, clock() + 15, clock=clock, sleep=clock.sleep) is responses[-1]
+
+
+def test_retries_stop_at_the_deadline(monkeypatch):
+    clock = FakeClock()
+    calls = fake_get(monkeypatch, [requests.Timeout(), requests.Timeout()], clock, seconds_per_call=2.5)
+    with pytest.raises(FetchTimeout):
+        get_with_retries(URL, {}, clock() + 4, clock=clock, sleep=clock.sleep)
+    # The second attempt's timeouts were cut down to what was left of the deadline
+    assert len(calls) == 2
+    assert calls[1] == (min(feed_http.CONNECT_TIMEOUT_SECONDS, 0.5), 0.5)
@@ -0,0 +1,29 @@
+from feed_config import ANALYTICS_FEEDS, DEEP_DIVE_FEEDS, configure_feeds, current_feeds
+from feed_registry import FeedRegistry
+
+CONFIG = """
+feeds:
+  - url: https://example.com/feed/
+    source: Example
+    sport: NHL
+"""
+
+
+def test_failing_listener_is_reported(tmp_path):
+    path = tmp_path / "feeds.yaml"
+    path.write_text(CONFIG)
+    received = []
+
+    def broken_listener(news_feeds, deep_dive_feeds):
+        raise ValueError("views not rebuilt")
+
+    registry = FeedRegistry(str(path), listeners=[broken_listener, lambda *feeds: received.append(feeds)])
+    try:
+        assert registry.reload_if_changed()
+        assert list(current_feeds().news) == ["NHL"]
+        assert registry.error == "test_failing_listener_is_reported.<locals>.broken_listener failed: " \
+                                 "ValueError: views not rebuilt"
+        # Later listeners still run
+        assert len(received) == 1
+    finally:
+        configure_feeds(ANALYTICS_FEEDS, DEEP_DIVE_FEEDS)
@@ -0,0 +1,16 @@
+from keyword_matching import MATCHER, matching_focus_areas
+
+
+def test_keywords_do_not_match_other_words_they_start():
+    for text in ("Ohio State tops Penn State and Michigan State", "Dealer's choice",
+                 "Rules committee meets", "Restoring a database snapshot", "The United States stated"):
+        scores = MATCHER.scan(text)
+        assert scores == {"category": {}, "focus": {}}, text
+
+
+def test_keywords_match_inflections_and_listed_forms():
+    assert matching_focus_areas("Recruiting class rankings", "") == ["Recruiting & Roster"]
+    assert matching_focus_areas("Stats and statistics", "") == ["Performance Metrics"]
+    assert matching_focus_areas("Free agents sign deals", "") == ["Salary Cap/NIL"]
+    assert MATCHER.scan("Five-star QB committed")["category"] == {"Recruiting Analytics": 1}
+    assert MATCHER.scan("Coaches coached")["category"] == {"Coaching Analytics": 1}
@@ -0,0 +1,68 @@
+import os
+from datetime import datetime
+
+from snapshot import Snapshot, SnapshotReader, write_snapshot
+
+URL = "https://example.com/feed/"
+OTHER_URL = "https://example.org/rss"
+
+
+def article(guid: str, pub_date: datetime, **fields) -> dict:
+    item = {"guid": guid, "link": f"https://example.com/{guid}", "title": f"Title {guid}",
+            "summary": "", "published": "", "pub_date": pub_date, "source": "Example"}
+    item.update(fields)
+    return item
+
+
+def test_round_trip_keeps_every_column(tmp_path):
+    path = str(tmp_path / "snapshot.bin")
+    items = {
+        URL: [
+            article("1", datetime(2026, 1, 15, 12, 30, 5), title="Ronald Acuña Jr. — 40/70 ✓",
+                    summary="Straße, café, 野球", published="Thu, 15 Jan 2026 12:30:05 GMT", sport="MLB",
+                    category="Performance Metrics", focus_areas=["Performance Metrics", "Salary Cap/NIL"],
+                    search_text="ronald acuna jr"),
+            article("undated", None),
+            article("2", datetime(2026, 1, 14, 8, 0), sport=None, category=None),
+        ],
+        OTHER_URL: [article("3", datetime(2026, 1, 13), source="Other", sport="NFL")],
+    }
+    assert write_snapshot(path, items) == 3
+
+    snapshot = Snapshot(path)
+    assert snapshot.rows == 3
+    first, second = snapshot.feed_articles(URL)
+    assert dict(first) == {
+        "guid": "1", "link": "https://example.com/1", "title": "Ronald Acuña Jr. — 40/70 ✓",
+        "summary": "Straße, café, 野球", "published": "Thu, 15 Jan 2026 12:30:05 GMT",
+        "pub_date": datetime(2026, 1, 15, 12, 30, 5), "source": "Example", "sport": "MLB",
+        "category": "Performance Metrics", "focus_areas": ("Performance Metrics", "Salary Cap/NIL"),
+        "search_text": "ronald acuna jr", "feed_url": URL,
+    }
+    # Empty strings come back as "" and unset coded fields as None
+    assert second["guid"] == "2" and second["summary"] == "" and second.get("sport") is None
+    assert second.get("category") is None and second["focus_areas"] == ()
+    # Items without a pub_date are not written
+    assert [item["guid"] for item in snapshot.feed_articles(URL)] == ["1", "2"]
+    assert [item["guid"] for item in snapshot.feed_articles(OTHER_URL)] == ["3"]
+    assert snapshot.feed_articles(URL, limit=1) == [first]
+    assert snapshot.feed_articles(URL, since=datetime(2026, 1, 15)) == [first]
+    assert snapshot.feed_articles("https://missing.example/feed") == []
+
+
+def test_reader_picks_up_a_replaced_file(tmp_path):
+    path = str(tmp_path / "snapshot.bin")
+    write_snapshot(path, {URL: [article("old", datetime(2026, 1, 14))]})
+    delivered = []
+    reader = SnapshotReader(path, check_interval=3600, listeners=[lambda url, items: delivered.append((url, items))])
+    assert [item["guid"] for item in reader.get(URL)] == ["old"]
+
+    write_snapshot(path, {URL: [article("new", datetime(2026, 1, 15)), article("old", datetime(2026, 1, 14))]})
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    # Within check_interval get() keeps the mapped snapshot; refresh() checks right away
+    assert [item["guid"] for item in reader.get(URL)] == ["old"]
+    assert [item["guid"] for item in reader.refresh(URL)] == ["new", "old"]
+    assert [(url, [item["guid"] for item in items]) for url, items in delivered] == [
+        (URL, ["old"]), (URL, ["new", "old"])]
+    assert not [name for name in os.listdir(tmp_path) if name.startswith(".snapshot-")]
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+
+from views import page_newest_first
+
+NOW = datetime(2026, 1, 15, 12, 0)
+
+
+def article(name: str, hours_ago: float) -> dict:
+    return {"guid": name, "title": name, "pub_date": NOW - timedelta(hours=hours_ago)}
+
+
+def titles(page: list) -> list:
+    return [item["title"] for item in page]
+
+
+def read_all(lists: list, page_size: int) -> list:
+    pages, cursor = [], None
+    while True:
+        page, cursor = page_newest_first(lists, page_size, cursor)
+        pages.append(titles(page))
+        if cursor is None:
+            return pages
+
+
+def test_pages_merge_lists_newest_first_until_exhausted():
+    lists = [[article("a", 1), article("c", 3), article("e", 5)], [article("b", 2), article("d", 4)]]
+    assert read_all(lists, 2) == [["a", "b"], ["c", "d"], ["e"]]
+
+
+def test_article_in_several_lists_is_served_once():
+    a = article("a", 1)
+    lists = [[a, article("b", 2)], [dict(a), article("c", 3)], [dict(a)]]
+    assert read_all(lists, 1) == [["a"], ["b"], ["c"]]
+
+
+def test_no_cursor_when_only_served_copies_remain():
+    a = article("a", 1)
+    page, cursor = page_newest_first([[a], [dict(a)]], 1)
+    assert titles(page) == ["a"]
+    assert cursor is None
+
+
+def test_cursor_is_stable_when_newer_items_arrive():
+    lists = [[article("b", 2), article("c", 3), article("d", 4)]]
+    page, cursor = page_newest_first(lists, 2)
+    assert titles(page) == ["b", "c"]
+
+    lists = [[article("new", 0), article("a", 1)] + lists[0]]
+    page, cursor = page_newest_first(lists, 2, cursor)
+    assert titles(page) == ["d"]
+    assert cursor is None
+
+
+def test_items_sharing_the_cursor_age_are_not_repeated_or_skipped():
+    lists = [[article("a", 1), article("b", 1), article("c", 1)], [article("d", 1)]]
+    pages = read_all(lists, 1)
+    assert sorted(title for page in pages for title in page) == ["a", "b", "c", "d"]
+    assert all(len(page) == 1 for page in pages)
@@ -0,0 +1,198 @@
+"""Incrementally maintained keyword trends over ingested articles.
+
+KeywordTrends keeps a daily mention counter per (kind, label, sport,
+source), where kind is a focus area or an article category, in a ring of
+TREND_DAYS day columns. Each article is counted once; counting it again
+unchanged is a dict lookup, so keeping trends current costs
+O(new articles) rather than a rescan of history. Queries sum the matching
+counter rows and compute rolling windows over the day columns with numpy.
+
+Added articles are queued and counted at the next query, so feeding the
+counters while the page's first sections are drawn costs a list append,
+and numpy is only imported once trends are first shown.
+"""
+
+import threading
+from datetime import date
+
+from date_parsing import utc_now
+from keyword_matching import ARTICLE_CATEGORIES, FOCUS_AREAS, categorize_article, matching_focus_areas
+
+FOCUS_KIND = "focus"
+CATEGORY_KIND = "category"
+TREND_KINDS = {FOCUS_KIND: "Focus areas", CATEGORY_KIND: "Categories"}
+
+# Day columns kept; older articles are not counted
+TREND_DAYS = 120
+
+# Trend lines show mentions over this many trailing days
+ROLLING_DAYS = 7
+
+# Queued articles are counted once this many are waiting, even without a query
+PENDING_LIMIT = 5000
+
+# Labels in display order; "All Topics" matches everything, so it is not a trend
+_LABELS = {
+    FOCUS_KIND: [area for area, keywords in FOCUS_AREAS.items() if keywords],
+    CATEGORY_KIND: list(ARTICLE_CATEGORIES),
+}
+
+
+def _today() -> int:
+    return utc_now().toordinal()
+
+
+def article_labels(item) -> list:
+    """(kind, label) pairs an article counts towards: its focus areas and its category."""
+    focus_areas = item.get("focus_areas")
+    category = item.get("category")
+    if focus_areas is None or category is None:
+        title, summary = item.get("title", ""), item.get("summary", "")
+        focus_areas = matching_focus_areas(title, summary) if focus_areas is None else focus_areas
+        category = category or categorize_article(title, summary)
+    return [(FOCUS_KIND, area) for area in focus_areas if area in FOCUS_AREAS] + [(CATEGORY_KIND, category)]
+
+
+class KeywordTrends:
+    """Thread-safe daily mention counts of focus areas and categories, per sport and source.
+
+    Articles are keyed by guid. An edited article (new date or labels) is
+    moved to its new counters. `version` changes whenever a count does, so
+    callers can cache what they draw from it.
+    """
+
+    def __init__(self, days: int = TREND_DAYS):
+        self.days = days
+        self._version = 0
+        self._lock = threading.Lock()
+        # (kind, label, sport, source) -> counter row
+        self._rows = {}
+        self._row_keys = []
+        # Allocated when the first articles are counted
+        self._counts = None
+        # Ordinal of the newest day column
+        self._newest = _today()
+        # guid -> (day ordinal, counter rows) it was counted in
+        self._counted = {}
+        # Articles added but not counted yet
+        self._pending = []
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._flush()
+            return len(self._counted)
+
+    @property
+    def version(self) -> int:
+        """Changes whenever a count does; counts queued articles first."""
+        with self._lock:
+            self._flush()
+            return self._version
+
+    def add(self, item):
+        """Queue one article to be counted."""
+        self.add_many([item])
+
+    def add_many(self, items: list):
+        """Queue articles (e.g. a feed's latest items) to be counted at the next query."""
+        with self._lock:
+            self._pending.extend(items)
+            if len(self._pending) >= PENDING_LIMIT:
+                self._flush()
+
+    def _flush(self):
+        # Caller holds self._lock. Counts the queued articles
+        self._advance(_today())
+        if not self._pending:
+            return
+        if self._counts is None:
+            import numpy as np
+            self._counts = np.zeros((16, self.days), dtype=np.int32)
+        pending, self._pending = self._pending, []
+        if sum(1 for item in pending if self._add(item)):
+            self._version += 1
+
+    def _advance(self, today: int):
+        # Caller holds self._lock. Clears the day columns that rotate out of the ring
+        if today <= self._newest:
+            return
+        if self._counts is not None:
+            for ordinal in range(self._newest + 1, min(today, self._newest + self.days) + 1):
+                self._counts[:, ordinal % self.days] = 0
+        self._newest = today
+        oldest = today - self.days + 1
+        self._counted = {guid: counted for guid, counted in self._counted.items() if counted[0] >= oldest}
+        self._version += 1
+
+    def _row(self, key: tuple) -> int:
+        # Caller holds self._lock
+        row = self._rows.get(key)
+        if row is None:
+            row = self._rows[key] = len(self._row_keys)
+            self._row_keys.append(key)
+            if row == len(self._counts):
+                import numpy as np
+                self._counts = np.vstack([self._counts, np.zeros_like(self._counts)])
+        return row
+
+    def _add(self, item) -> bool:
+        # Caller holds self._lock
+        guid = str(item.get("guid") or item.get("link", ""))
+        pub_date = item.get("pub_date")
+        if not guid or pub_date is None:
+            return False
+        # Future-dated articles count towards today
+        day = min(pub_date.toordinal(), self._newest)
+        if day <= self._newest - self.days:
+            return False
+
+        sport, source = item.get("sport"), item.get("source")
+        rows = tuple(self._row((kind, label, sport, source)) for kind, label in article_labels(item))
+        counted = self._counted.get(guid)
+        if counted == (day, rows):
+            return False
+        if counted is not None:
+            self._counts[list(counted[1]), counted[0] % self.days] -= 1
+        self._counts[list(rows), day % self.days] += 1
+        self._counted[guid] = (day, rows)
+        return True
+
+    def series(self, kind: str, sport: str = None, source: str = None, days: int = 30,
+               window: int = ROLLING_DAYS) -> tuple:
+        """(dates, {label: mentions}) for the last `days` days, oldest first.
+
+        Each value is the label's mentions in the `window` days ending that
+        day, summed over the matching sports and sources (None matches all).
+        Labels never mentioned in the period are left out.
+        """
+        import numpy as np
+
+        days = min(days, self.days - window + 1)
+        labels = _LABELS[kind]
+        with self._lock:
+            self._flush()
+            newest = self._newest
+            selected = [(row, labels.index(key[1])) for row, key in enumerate(self._row_keys)
+                        if key[0] == kind and key[1] in labels
+                        and (sport is None or key[2] == sport) and (source is None or key[3] == source)]
+            if self._counts is None:
+                counts = np.zeros((0, self.days), dtype=np.int32)
+            else:
+                counts = self._counts[[row for row, _ in selected]]
+
+        # Ring columns in day order, oldest first, then one row per label
+        counts = counts[:, np.arange(newest - self.days + 1, newest + 1) % self.days]
+        by_label = np.zeros((len(labels), self.days), dtype=np.int64)
+        np.add.at(by_label, [label for _, label in selected], counts)
+
+        cumulative = np.concatenate([np.zeros((len(labels), 1), dtype=np.int64), by_label.cumsum(axis=1)], axis=1)
+        rolling = (cumulative[:, window:] - cumulative[:, :-window])[:, -days:]
+
+        dates = [date.fromordinal(ordinal) for ordinal in range(newest - days + 1, newest + 1)]
+        return dates, {label: rolling[index] for index, label in enumerate(labels) if rolling[index].any()}
+
+    def movers(self, kind: str, sport: str = None, source: str = None, window: int = ROLLING_DAYS) -> list:
+        """[(label, mentions in the last `window` days, mentions in the `window` days before)], busiest first."""
+        _, series = self.series(kind, sport, source, days=window + 1, window=window)
+        movers = [(label, int(counts[-1]), int(counts[0])) for label, counts in series.items()]
+        return sorted(movers, key=lambda mover: mover[1], reverse=True)
@@ -0,0 +1,237 @@
+"""Materialized news and Deep Dives views for every sport and focus area.
+
+The page used to merge, focus-filter and near-deduplicate the selected
+sport's feeds on every rerun. FeedViews keeps the latest items of every
+feed and, whenever a feed's items change, rebuilds the views of the
+sports that read it: one list per (sport, focus area) for the news grid
+and one per sport for Deep Dives. Serving a page is then a dict lookup
+and a slice.
+
+Views are read in pages with a cursor. The "All Sports" view is not
+stored: its pages are k-way merged from the per-sport views.
+"""
+
+import bisect
+import heapq
+import threading
+from datetime import datetime, timedelta
+
+from date_parsing import utc_now
+from dedup import cluster_near_duplicates, dedupe_near_duplicates
+from feed_config import DEEP_DIVE_LIMIT, NEWS_FEED_LIMIT, current_feeds
+from keyword_matching import FOCUS_AREAS, filter_by_focus_area
+
+NEWS_VIEW = "news"
+DEEP_DIVE_VIEW = "deep_dives"
+
+# Pseudo-sport whose views merge every sport's
+ALL_SPORTS = "All Sports"
+
+# Deep Dives only show articles with a summary longer than this
+FEATURE_SUMMARY_CHARS = 80
+
+
+def merge_newest_first(feed_results: list) -> list:
+    """Merge per-feed newest-first item lists into one newest-first list."""
+    return list(heapq.merge(
+        *feed_results,
+        key=lambda x: x.get("pub_date") or datetime.min,
+        reverse=True,
+    ))
+
+
+def _age(item) -> timedelta:
+    # Ascending in list order for newest-first lists, so it works with heapq and bisect
+    return datetime.max - (item.get("pub_date") or datetime.min)
+
+
+def _identity(item) -> str:
+    return item.get("guid") or item.get("link") or item.get("title")
+
+
+def page_newest_first(lists: list, page_size: int, cursor: tuple = None) -> tuple:
+    """One page of the k-way merge of newest-first lists, and the cursor for the next page.
+
+    The cursor is (age, identities served at that age) of the last item
+    served, not an offset, so paging stays stable when newer items arrive.
+    Each list is entered with a binary search, so a page costs
+    O(k log n + page_size log k) for k lists. An article present in
+    several lists is served once. The returned cursor is None when
+    every list is exhausted.
+    """
+    heap = []
+    for list_index, items in enumerate(lists):
+        position = 0
+        if cursor is not None:
+            cursor_age, served = cursor
+            position = bisect.bisect_left(items, cursor_age, key=_age)
+            while position < len(items) and _age(items[position]) == cursor_age and _identity(items[position]) in served:
+                position += 1
+        if position < len(items):
+            heap.append((_age(items[position]), list_index, position))
+    heapq.heapify(heap)
+
+    page = []
+    last_age, served = cursor if cursor is not None else (None, frozenset())
+    served = set(served)
+    while heap and len(page) < page_size:
+        age, list_index, position = heapq.heappop(heap)
+        items = lists[list_index]
+        if position + 1 < len(items):
+            heapq.heappush(heap, (_age(items[position + 1]), list_index, position + 1))
+
+        item = items[position]
+        if age != last_age:
+            last_age = age
+            served = set()
+        # Copies of one article share an age, so they are popped back to back
+        identity = _identity(item)
+        if identity in served:
+            continue
+        served.add(identity)
+        page.append(item)
+
+    # Drop copies of articles already served, so a cursor always has something left to serve
+    while heap and heap[0][0] == last_age and _identity(lists[heap[0][1]][heap[0][2]]) in served:
+        age, list_index, position = heapq.heappop(heap)
+        if position + 1 < len(lists[list_index]):
+            heapq.heappush(heap, (_age(lists[list_index][position + 1]), list_index, position + 1))
+
+    next_cursor = (last_age, frozenset(served)) if heap else None
+    return page, next_cursor
+
+
+def build_focus_views(items: list) -> dict:
+    """Focus area -> focus-filtered, near-deduplicated items, newest first.
+
+    Stories are clustered once for all focus areas; each view keeps the
+    newest in-focus article of every cluster.
+    """
+    titled = [item for item in items if item.get("title")]
+    cluster_of = {}
+    for cluster_id, cluster in enumerate(cluster_near_duplicates(titled)):
+        for item in cluster:
+            cluster_of[id(item)] = cluster_id
+
+    views = {}
+    for focus_area in FOCUS_AREAS:
+        seen = set()
+        view = []
+        for item in filter_by_focus_area(titled, focus_area):
+            cluster_id = cluster_of[id(item)]
+            if cluster_id not in seen:
+                seen.add(cluster_id)
+                view.append(item)
+        views[focus_area] = tuple(view)
+    return views
+
+
+def build_feature_view(items: list) -> tuple:
+    """Longer feature articles, near-deduplicated, newest first."""
+    features = [item for item in items
+                if item.get("title") and len(item.get("summary", "")) > FEATURE_SUMMARY_CHARS]
+    return tuple(dedupe_near_duplicates(features))
+
+
+class FeedViews:
+    """Thread-safe per-feed items plus the views built from them.
+
+    `update(url, items)` is called with each feed's latest items (as a
+    FeedRefresher or SnapshotReader listener, and by the page as feeds
+    land); it returns False without rebuilding anything if the items are
+    the same objects as last time. Views are replaced wholesale, so
+    lookups never take the lock.
+    """
+
+    def __init__(self, news_feeds: dict = None, deep_dive_feeds: dict = None, max_age_days: int = None):
+        self.max_age_days = max_age_days
+        self._lock = threading.Lock()
+        self._items = {}
+        self._views = {}
+        # Defaults to the configured feeds
+        feeds = current_feeds()
+        self.configure(feeds.news if news_feeds is None else news_feeds,
+                       feeds.deep_dives if deep_dive_feeds is None else deep_dive_feeds)
+
+    def configure(self, news_feeds: dict, deep_dive_feeds: dict):
+        """Switch to a new feed configuration, rebuilding every view from the items already recorded."""
+        # (view, sport) -> (feed URLs, per-feed limit)
+        sections = {}
+        # URL -> [(view, sport)] that read it, and the most items any of them reads
+        readers = {}
+        windows = {}
+        for view, feeds, limit in ((NEWS_VIEW, news_feeds, NEWS_FEED_LIMIT),
+                                   (DEEP_DIVE_VIEW, deep_dive_feeds, DEEP_DIVE_LIMIT)):
+            for sport, sport_feeds in feeds.items():
+                urls = [feed_info["url"] for feed_info in sport_feeds]
+                sections[view, sport] = (urls, limit)
+                for url in urls:
+                    readers.setdefault(url, []).append((view, sport))
+                    windows[url] = max(windows.get(url, 0), limit)
+
+        with self._lock:
+            self._sections, self._readers, self._windows = sections, readers, windows
+            self._items = {url: items[:windows[url]] for url, items in self._items.items() if url in readers}
+            self._views = self._build_views(set(sections), {})
+
+    def _build_views(self, sections: set, views: dict) -> dict:
+        # Caller holds self._lock
+        for view, sport in sections:
+            urls, limit = self._sections[view, sport]
+            merged = merge_newest_first([self._items.get(feed_url, ())[:limit] for feed_url in urls])
+            if view == NEWS_VIEW:
+                for focus_area, focus_view in build_focus_views(merged).items():
+                    views[NEWS_VIEW, sport, focus_area] = focus_view
+            else:
+                views[DEEP_DIVE_VIEW, sport] = build_feature_view(merged)
+        return views
+
+    def update(self, url: str, items: list) -> bool:
+        """Record a feed's latest items and rebuild the views that read it; False if unchanged."""
+        readers = self._readers.get(url)
+        if not readers:
+            return False
+        items = items[:self._windows.get(url, 0)]
+        if self.max_age_days:
+            cutoff = utc_now() - timedelta(days=self.max_age_days)
+            items = [item for item in items if item.get("pub_date") is None or item["pub_date"] >= cutoff]
+        items = tuple(items)
+
+        with self._lock:
+            # The feed configuration may have changed while the items were filtered
+            readers = self._readers.get(url)
+            if not readers:
+                return False
+            previous = self._items.get(url)
+            if previous is not None and len(previous) == len(items) and all(
+                    old is new for old, new in zip(previous, items)):
+                return False
+            self._items[url] = items
+            self._views = self._build_views(set(readers), dict(self._views))
+        return True
+
+    def news(self, sport: str, focus_area: str) -> tuple:
+        """The news grid for a sport and focus area, newest first."""
+        return self._views.get((NEWS_VIEW, sport, focus_area), ())
+
+    def deep_dives(self, sport: str) -> tuple:
+        """The Deep Dives features for a sport, newest first."""
+        return self._views.get((DEEP_DIVE_VIEW, sport), ())
+
+    def sports(self, view: str = NEWS_VIEW) -> list:
+        """Sports with a section in the given view, in configuration order."""
+        return [sport for section_view, sport in self._sections if section_view == view]
+
+    def news_page(self, sport: str, focus_area: str, cursor: tuple = None, page_size: int = 10) -> tuple:
+        """(items, next cursor) for one page of a sport's news view, or of every sport's for ALL_SPORTS."""
+        sports = self.sports(NEWS_VIEW) if sport == ALL_SPORTS else [sport]
+        return page_newest_first([self.news(name, focus_area) for name in sports], page_size, cursor)
+
+    def deep_dive_page(self, sport: str, cursor: tuple = None, page_size: int = 6) -> tuple:
+        """(items, next cursor) for one page of a sport's Deep Dives, or of every sport's for ALL_SPORTS."""
+        sports = self.sports(DEEP_DIVE_VIEW) if sport == ALL_SPORTS else [sport]
+        return page_newest_first([self.deep_dives(name) for name in sports], page_size, cursor)
+
+    def feed_items(self, url: str) -> tuple:
+        """The items last recorded for a feed."""
+        return self._items.get(url, ())